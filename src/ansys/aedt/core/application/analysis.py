@@ -33,13 +33,12 @@ from __future__ import absolute_import  # noreorder
 
 import os
 import re
-import shutil
 import subprocess  # nosec
 import tempfile
 import time
 
 from ansys.aedt.core.application.design import Design
-from ansys.aedt.core.application.job_manager import update_hpc_option
+from ansys.aedt.core.application.job_manager import JobConfiguration
 from ansys.aedt.core.application.variables import Variable
 from ansys.aedt.core.application.variables import decompose_variable_value
 from ansys.aedt.core.generic.constants import AXIS
@@ -69,6 +68,8 @@ from ansys.aedt.core.modules.solve_setup import SetupQ3D
 from ansys.aedt.core.modules.solve_setup import SetupSBR
 from ansys.aedt.core.modules.solve_sweeps import SetupProps
 
+_VARIATION_PAIR = re.compile(r"(\S+?)='(.*?)'")
+
 
 class Analysis(Design, object):
     """Contains all common analysis functions.
@@ -1067,6 +1068,7 @@ class Analysis(Design, object):
 
             """
             self._app = app
+            self._variation_tables = {}
 
         @property
         def variables(self):
@@ -1099,38 +1101,199 @@ class Analysis(Design, object):
             ----------
             >>> oModule.GetAvailableVariations
             """
-            variations_string = self.get_variation_strings(setup_sweep)
-            variables = [k for k, v in self._app.variable_manager.variables.items() if not v.post_processing]
+            table = self._variation_entry(setup_sweep)
+            columns = table["columns"]
             families = []
-            if variations_string:
-                for vs in variations_string:
-                    vsplit = vs.split(" ")
-                    variation = []
-                    for v in vsplit:
-                        m = re.search(r"(.+?)='(.+?)'", v)
-                        if m and len(m.groups()) == 2:
-                            variation.append([m.group(1), m.group(2)])
-                        else:  # pragma: no cover
-                            raise Exception("Error in splitting the variation variable.")
-                    family_list = []
-                    family_dict = {}
-                    count = 0
-                    for var in variables:
-                        family_list.append(var + ":=")
-                        for v in variation:
-                            if var == v[0]:
-                                family_list.append([v[1]])
-                                family_dict[v[0]] = v[1]
-                                count += 1
-                                break
-                    if count != len(variation):  # pragma: no cover
-                        raise IndexError("Not all variations were found in variables.")
-                    if output_as_dict:
-                        families.append(family_dict)
-                    else:
-                        families.append(family_list)
+            if output_as_dict:
+                for row in table["rows"]:
+                    families.append(dict(zip(columns, row)))
+                return families
+            for row in table["rows"]:
+                values = dict(zip(columns, row))
+                family_list = []
+                for var in table["variables"]:
+                    family_list.append(var + ":=")
+                    if var in values:
+                        family_list.append([values[var]])
+                families.append(family_list)
             return families
 
+        @pyaedt_function_handler()
+        def variation_table(self, setup_sweep=None, pandas_output=False):
+            """Get the available variations as a table with one column per variable.
+
+            The variation strings are parsed once per setup and cached until the solution
+            results of the design change.
+
+            Parameters
+            ----------
+            setup_sweep : str, optional
+                Setup name with the sweep to search for variations on.
+                The default is ``None``, in which case the first of the existing analysis setups is taken.
+            pandas_output : bool, optional
+                Whether to return a ``pandas.DataFrame`` instead of a NumPy structured array.
+                The default is ``False``.
+
+            Returns
+            -------
+            :class:`numpy.ndarray` or :class:`pandas.DataFrame`
+                Table of variation values as strings, with one field or column per variable.
+
+            References
+            ----------
+            >>> oModule.GetAvailableVariations
+            """
+            table = self._variation_entry(setup_sweep)
+            if pandas_output:
+                try:
+                    import pandas as pd
+                except ImportError:  # pragma: no cover
+                    self._app.logger.error("Pandas is required to return the variation table as a DataFrame.")
+                    return False
+                return pd.DataFrame(table["rows"], columns=table["columns"])
+            try:
+                import numpy as np
+            except ImportError:  # pragma: no cover
+                self._app.logger.error("NumPy is required to return the variation table.")
+                return False
+            if table["array"] is None:
+                dtype = [
+                    (name, "U" + str(max([len(row[i]) for row in table["rows"]] + [1])))
+                    for i, name in enumerate(table["columns"])
+                ]
+                table["array"] = np.array(table["rows"], dtype=dtype)
+            return table["array"]
+
+        @pyaedt_function_handler()
+        def find_variations(self, values, setup_sweep=None, output_as_dict=True):
+            """Find the available variations that match given variable values.
+
+            Parameters
+            ----------
+            values : dict
+                Dictionary of variable names and values to match. String values are compared with the
+                variation strings, for example ``"1mm"``. Numeric values are compared with the numeric
+                part of the variation values.
+            setup_sweep : str, optional
+                Setup name with the sweep to search for variations on.
+                The default is ``None``, in which case the first of the existing analysis setups is taken.
+            output_as_dict : bool, optional
+                Whether to output the variations as dicts. The default is ``True``.
+                If ``False``, the indices of the matching variations are returned.
+
+            Returns
+            -------
+            list
+                List of matching variations or their indices in :meth:`variations`.
+
+            Examples
+            --------
+            >>> from ansys.aedt.core import Hfss
+            >>> hfss = Hfss()
+            >>> hfss.available_variations.find_variations({"width": "2mm", "length": 3})
+            """
+            try:
+                import numpy as np
+            except ImportError:  # pragma: no cover
+                np = None
+
+            table = self._variation_entry(setup_sweep)
+            columns = table["columns"]
+            indices = range(len(table["rows"]))
+            for name, value in values.items():
+                if name not in columns:
+                    self._app.logger.error(f"Variable {name} is not in the available variations.")
+                    return []
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    column = self._numeric_column(table, name)
+                    if np is not None:
+                        mask = np.isclose(np.asarray(column, dtype=float), float(value))
+                        indices = [i for i in indices if mask[i]]
+                    else:  # pragma: no cover
+                        indices = [i for i in indices if column[i] == float(value)]
+                else:
+                    col = columns.index(name)
+                    indices = [i for i in indices if table["rows"][i][col] == str(value)]
+            if not output_as_dict:
+                return list(indices)
+            return [dict(zip(columns, table["rows"][i])) for i in indices]
+
+        @pyaedt_function_handler()
+        def clear_variation_cache(self):
+            """Clear the cached variation tables.
+
+            Returns
+            -------
+            bool
+                ``True`` when successful.
+            """
+            self._variation_tables = {}
+            return True
+
+        def _solution_time_stamp(self):
+            # Results of new or deleted variations add or remove entries in the design results folder.
+            results_directory = self._app.results_directory
+            if not results_directory:
+                return None
+            design_results = os.path.join(results_directory, f"{self._app.design_name}.results")
+            if not os.path.isdir(design_results):
+                return None
+            return os.path.getmtime(design_results)
+
+        def _variation_entry(self, setup_sweep=None):
+            if not setup_sweep:
+                setup_sweep = self._app.existing_analysis_sweeps[0]
+            time_stamp = self._solution_time_stamp()
+            entry = self._variation_tables.get(setup_sweep)
+            if entry and time_stamp is not None and entry["time_stamp"] == time_stamp:
+                return entry
+            variation_strings = tuple(self.get_variation_strings(setup_sweep) or [])
+            if entry and entry["strings"] == variation_strings:
+                entry["time_stamp"] = time_stamp
+                return entry
+            entry = self._parse_variations(variation_strings)
+            entry["time_stamp"] = time_stamp
+            self._variation_tables[setup_sweep] = entry
+            return entry
+
+        def _parse_variations(self, variation_strings):
+            variables = [k for k, v in self._app.variable_manager.variables.items() if not v.post_processing]
+            order = {name: i for i, name in enumerate(variables)}
+            parsed = []
+            names = set()
+            for vs in variation_strings:
+                pairs = _VARIATION_PAIR.findall(vs)
+                if len(pairs) != len(vs.split(" ")):  # pragma: no cover
+                    raise Exception("Error in splitting the variation variable.")
+                for name, _ in pairs:
+                    if name not in order:  # pragma: no cover
+                        raise IndexError("Not all variations were found in variables.")
+                names.update(name for name, _ in pairs)
+                parsed.append(dict(pairs))
+            columns = sorted(names, key=order.get)
+            rows = [tuple(values.get(name, "") for name in columns) for values in parsed]
+            return {
+                "strings": variation_strings,
+                "variables": variables,
+                "columns": columns,
+                "rows": rows,
+                "array": None,
+                "numeric": {},
+            }
+
+        @staticmethod
+        def _numeric_column(table, name):
+            if name not in table["numeric"]:
+                col = table["columns"].index(name)
+                magnitudes = []
+                for row in table["rows"]:
+                    try:
+                        magnitudes.append(float(decompose_variable_value(row[col])[0]))
+                    except (TypeError, ValueError):
+                        magnitudes.append(float("nan"))
+                table["numeric"][name] = magnitudes
+            return table["numeric"][name]
+
         @pyaedt_function_handler()
         def get_variation_strings(self, setup_sweep=None):
             """Return variation strings.
@@ -1810,53 +1973,33 @@ class Analysis(Design, object):
                     if self.working_directory[0] != "\\"
                     else os.path.join(self.working_directory, config_name + ".acf")
                 )
-            skip_files = False
-            try:
-                shutil.copy2(source_name, target_name)
-
-            # If source and destination are same
-            except shutil.SameFileError:
-                self.logger.warning("Source and destination represents the same file.")
-            # If there is any permission issue
-            except PermissionError:
-                self.logger.error("Permission denied.")
-                skip_files = True
-            # For other errors
-            except Exception:
-                self.logger.error("Error occurred while copying file.")
+            config = JobConfiguration.from_file(source_name)
+            succeeded = True
+            if cores:
+                succeeded = config.set_option("NumCores", cores, False) and succeeded
+            if gpus:
+                succeeded = config.set_option("NumGPUs", gpus, False) and succeeded
+            if tasks:
+                succeeded = config.set_option("NumEngines", tasks, False) and succeeded
+            succeeded = config.set_option("ConfigName", config_name, True) and succeeded
+            succeeded = config.set_option("DesignType", self.design_type, True) and succeeded
+            if self.design_type == "Icepak":
+                use_auto_settings = False
+            succeeded = config.set_option("UseAutoSettings", use_auto_settings, False) and succeeded
+            if num_variations_to_distribute:
+                succeeded = (
+                    config.set_option("NumVariationsToDistribute", num_variations_to_distribute, False) and succeeded
+                )
+            if isinstance(allowed_distribution_types, list):
+                num_adt = len(allowed_distribution_types)
+                adt_string = "', '".join(allowed_distribution_types)
+                adt_string = f"[{num_adt}: '{adt_string}']"
+
+                succeeded = config.set_option("AllowedDistributionTypes", adt_string, False, separator="") and succeeded
+            skip_files = not succeeded
+            if not skip_files and not config.write(target_name):
+                self.logger.error(f"Error occurred while writing file {target_name}.")
                 skip_files = True
-            if not skip_files:
-                if cores:
-                    succeeded = update_hpc_option(target_name, "NumCores", cores, False)
-                    skip_files = True if not succeeded else skip_files
-                if gpus:
-                    succeeded = update_hpc_option(target_name, "NumGPUs", gpus, False)
-                    skip_files = True if not succeeded else skip_files
-                if tasks:
-                    succeeded = update_hpc_option(target_name, "NumEngines", tasks, False)
-                    skip_files = True if not succeeded else skip_files
-                succeeded = update_hpc_option(target_name, "ConfigName", config_name, True)
-                skip_files = True if not succeeded else skip_files
-                succeeded = update_hpc_option(target_name, "DesignType", self.design_type, True)
-                skip_files = True if not succeeded else skip_files
-                if self.design_type == "Icepak":
-                    use_auto_settings = False
-                succeeded = update_hpc_option(target_name, "UseAutoSettings", use_auto_settings, False)
-                skip_files = True if not succeeded else skip_files
-                if num_variations_to_distribute:
-                    succeeded = update_hpc_option(
-                        target_name, "NumVariationsToDistribute", num_variations_to_distribute, False
-                    )
-                    skip_files = True if not succeeded else skip_files
-                if isinstance(allowed_distribution_types, list):
-                    num_adt = len(allowed_distribution_types)
-                    adt_string = "', '".join(allowed_distribution_types)
-                    adt_string = f"[{num_adt}: '{adt_string}']"
-
-                    succeeded = update_hpc_option(
-                        target_name, "AllowedDistributionTypes", adt_string, False, separator=""
-                    )
-                    skip_files = True if not succeeded else skip_files
 
             if settings.remote_rpc_session:
                 remote_name = (
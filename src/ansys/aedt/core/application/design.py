@@ -191,6 +191,7 @@ class Design(AedtObjects):
         self._design_dictionary: Optional[Dict] = None
         self._project_dictionary: Dict = {}
         self._boundaries: Dict = {}
+        self._boundary_counts: Optional[tuple] = None
         self._project_datasets: List = []
         self._design_datasets: List = []
         self.close_on_exit: bool = close_on_exit
@@ -386,12 +387,63 @@ class Design(AedtObjects):
     def boundaries(self) -> List[BoundaryObject]:
         """Design boundaries and excitations.
 
+        Boundaries created, renamed, or deleted through PyAEDT are tracked in a registry.
+        The registry is synchronized with AEDT only when the number of boundaries and
+        excitations in the design no longer matches, or when the ``refresh_boundaries()``
+        method is called.
 
         Returns
         -------
         list[:class:`ansys.aedt.core.modules.boundary.common.BoundaryObject`]
             Boundaries available in design.
         """
+        boundary_counts = self._get_boundary_counts()
+        if boundary_counts is not None and boundary_counts == self._boundary_counts:
+            return list(self._boundaries.values())
+        boundaries = self.refresh_boundaries()
+        self._boundary_counts = boundary_counts
+        return boundaries
+
+    def _get_boundary_counts(self) -> Optional[tuple]:
+        """Get the number of boundaries and excitations in the design.
+
+        Returns
+        -------
+        tuple or None
+            Counts used to detect changes made outside PyAEDT, or ``None`` when
+            the design does not provide them or they cannot be read. ``None``
+            always forces a synchronization of the boundaries.
+        """
+        try:
+            if not self.oboundary or "GetNumBoundaries" not in self.oboundary.__dir__():
+                return None
+            counts = [self.oboundary.GetNumBoundaries()]
+            if "GetNumExcitations" in self.oboundary.__dir__():
+                counts.append(self.oboundary.GetNumExcitations())
+            if self.design_type in ["Maxwell 3D", "Maxwell 2D"]:
+                counts.append(len(self.get_oo_name(self.odesign, "Parameters")))
+                counts.append(len(self.get_oo_name(self.odesign, "Model")))
+            elif self.design_type == "Icepak":
+                counts.append(len(self.get_oo_name(self.odesign, "Thermal")))
+        except Exception:
+            return None
+        return tuple(counts)
+
+    def _boundary_registry_changed(self) -> None:
+        """Update the boundary counts after a boundary is created or deleted through PyAEDT."""
+        if self._boundary_counts is not None:
+            self._boundary_counts = self._get_boundary_counts()
+
+    @pyaedt_function_handler()
+    def refresh_boundaries(self) -> List[BoundaryObject]:
+        """Synchronize the boundaries and excitations with the design.
+
+        Returns
+        -------
+        list[:class:`ansys.aedt.core.modules.boundary.common.BoundaryObject`]
+            Boundaries available in design.
+        """
+        self._boundary_counts = None
         bb = []
         if self.oboundary and "GetBoundaries" in self.oboundary.__dir__():
             bb = list(self.oboundary.GetBoundaries())
@@ -913,6 +965,7 @@ class Design(AedtObjects):
                     if exc.type == "Terminal":
                         del self._boundaries[exc.name]
             self.design_solutions.solution_type = soltype
+            self._boundary_counts = None
 
     @property
     def valid_design(self) -> bool:
@@ -22,6 +22,331 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import os
+import shutil
+import tempfile
+
+_job_templates = {}
+
+
+def _template_lines(file_name):
+    """Read the lines of a configuration file through the template cache."""
+    file_name = os.path.abspath(file_name)
+    stat = os.stat(file_name)
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _job_templates.get(file_name)
+    if cached and cached[0] == key:
+        return cached[1]
+    with open(file_name, "r") as f:
+        lines = tuple(f.readlines())
+    _job_templates[file_name] = (key, lines)
+    return lines
+
+
+def clear_job_templates():
+    """Clear the cache of parsed configuration templates."""
+    _job_templates.clear()
+
+
+class JobConfiguration(object):
+    """Edits an HPC or job configuration file in memory.
+
+    The file is parsed once, any number of options can be changed, and the result is written
+    once with an atomic replace. Templates read with :func:`JobConfiguration.from_file` are
+    cached, so many configurations can be generated from one parsed base file.
+
+    Parameters
+    ----------
+    lines : list
+        Lines of the configuration, including line endings.
+    file_name : str, optional
+        Full path and name of the configuration file. The default is ``None``.
+
+    Examples
+    --------
+    >>> from ansys.aedt.core.application.job_manager import JobConfiguration
+    >>> for cores in [4, 8, 16]:
+    ...     config = JobConfiguration.from_file("pyaedt_local_config.acf")
+    ...     config.set_simulation_cores(cores)
+    ...     config.set_option("ConfigName", f"config_{cores}")
+    ...     config.write(f"config_{cores}.acf")
+    """
+
+    def __init__(self, lines, file_name=None):
+        self.lines = list(lines)
+        self.file_name = file_name
+        self._line_index = {}
+
+    @classmethod
+    def from_file(cls, file_name, use_cache=True):
+        """Parse a configuration file.
+
+        Parameters
+        ----------
+        file_name : str
+            Full path and name of the configuration file. The file type can be ACF, AREG, or TXT.
+        use_cache : bool, optional
+            Whether to reuse the parsed file while it is unchanged on disk. The default is ``True``.
+
+        Returns
+        -------
+        :class:`ansys.aedt.core.application.job_manager.JobConfiguration`
+            Configuration that can be edited without changing the file.
+        """
+        if not use_cache:
+            _job_templates.pop(os.path.abspath(file_name), None)
+        return cls(_template_lines(file_name), file_name)
+
+    def copy(self):
+        """Copy the configuration.
+
+        Returns
+        -------
+        :class:`ansys.aedt.core.application.job_manager.JobConfiguration`
+        """
+        return JobConfiguration(self.lines, self.file_name)
+
+    def _find(self, text):
+        index = self._line_index.get(text)
+        if index is not None and text in self.lines[index]:
+            return index
+        for i, line in enumerate(self.lines):
+            if text in line:
+                self._line_index[text] = i
+                return i
+        return None
+
+    def get_option(self, name, separator="="):
+        """Get the value of an option.
+
+        Parameters
+        ----------
+        name : str
+            Name of the option.
+        separator : str, optional
+            Separates the option name from its value. The default is ``=``.
+
+        Returns
+        -------
+        str
+            Value of the option without quotes, ``None`` if the option is not found.
+        """
+        index = self._find(name + separator)
+        if index is None:
+            return None
+        line = self.lines[index].strip()
+        return line[line.index(name + separator) + len(name + separator) :].strip("'")
+
+    def set_option(self, name, value, is_value_string=True, separator="=", all_occurrences=False):
+        """Set the value of an option.
+
+        Parameters
+        ----------
+        name : str
+            Name of the option.
+        value :
+            Value for the option.
+        is_value_string : bool, optional
+            Whether the value is a string. The default is ``True``.
+        separator : str, optional
+            Separates the option name from its value. The default is ``=``.
+        all_occurrences : bool, optional
+            Whether to replace every line with the same content as the last line defining the option,
+            for example the ``NumCores`` line of each machine in a multi-machine configuration.
+            The default is ``False``, in which case only the first line defining the option is changed.
+
+        Returns
+        -------
+        bool
+            ``True`` when successful, ``False`` when the option is not found.
+        """
+        if is_value_string:
+            value = "'" + str(value) + "'"
+        if all_occurrences:
+            indices = [i for i, line in enumerate(self.lines) if name + separator in line]
+            if not indices:
+                return False
+            return self._replace_all(self.lines[indices[-1]].strip(), name + separator + str(value))
+        index = self._find(name + separator)
+        if index is None:
+            return False
+        line = self.lines[index]
+        self.lines[index] = line.replace(line.strip(), name + separator + str(value))
+        return True
+
+    def _replace_all(self, old_text, new_text):
+        for i, line in enumerate(self.lines):
+            if old_text in line:
+                self.lines[i] = line.replace(old_text, new_text)
+        return True
+
+    def set_options(self, options, is_value_string=False):
+        """Set the values of several options.
+
+        Parameters
+        ----------
+        options : dict
+            Values of the options keyed by option name.
+        is_value_string : bool, optional
+            Whether the values are strings. The default is ``False``.
+
+        Returns
+        -------
+        bool
+            ``True`` when all options are found, ``False`` otherwise.
+        """
+        succeeded = True
+        for name, value in options.items():
+            succeeded = self.set_option(name, value, is_value_string) and succeeded
+        return succeeded
+
+    def set_simulation_cores(self, cores):
+        """Set the number of simulation cores.
+
+        Parameters
+        ----------
+        cores : int or str
+            Number of simulation cores.
+
+        Returns
+        -------
+        bool
+        """
+        return self.set_option("NumCores", cores, False, all_occurrences=True)
+
+    def set_simulation_engines(self, engines):
+        """Set the number of simulation engines.
+
+        Parameters
+        ----------
+        engines : int or str
+            Number of simulation engines.
+
+        Returns
+        -------
+        bool
+        """
+        return self.set_option("NumEngines", engines, False, all_occurrences=True)
+
+    def set_machine_name(self, machine_name):
+        """Set the machine name.
+
+        Parameters
+        ----------
+        machine_name : str
+            Name of the machine.
+
+        Returns
+        -------
+        bool
+        """
+        return self.set_option("MachineName", machine_name, all_occurrences=True)
+
+    def set_config_name(self, config_name):
+        """Set the name of the configuration.
+
+        Parameters
+        ----------
+        config_name : str
+            Name of the configuration. ``"localhost"`` is written as ``"Local"``.
+
+        Returns
+        -------
+        bool
+        """
+        if config_name == "localhost":
+            config_name = "Local"
+        return self.set_option("ConfigName", config_name, all_occurrences=True)
+
+    def set_cluster_cores(self, param_name, param_val):
+        """Set the number of cluster cores in a registry configuration.
+
+        Parameters
+        ----------
+        param_name : str
+            Name of the parameter that identifies the line to replace.
+        param_val : int
+            Number of cluster cores.
+
+        Returns
+        -------
+        bool
+        """
+        indices = [i for i, line in enumerate(self.lines) if param_name in line]
+        if not indices:
+            return False
+        return self._replace_all(self.lines[indices[-1]], "\\\t\\\t\\\tNumCores=" + str(param_val) + "\\" + chr(10))
+
+    def set_template_value(self, param_name, param_val):
+        """Set the value that follows a parameter in a registry template.
+
+        Parameters
+        ----------
+        param_name : str
+            Name of the parameter.
+        param_val : int
+            Value of the parameter.
+
+        Returns
+        -------
+        bool
+        """
+        indices = [i + 1 for i, line in enumerate(self.lines) if line.find(param_name) > 0]
+        if not indices or indices[-1] >= len(self.lines):
+            return False
+        return self._replace_all(self.lines[indices[-1]], "\\\t\\\t\\\tValue=\\'" + str(param_val) + "\\'\\" + chr(10))
+
+    def to_string(self):
+        """Get the content of the configuration.
+
+        Returns
+        -------
+        str
+        """
+        return "".join(self.lines)
+
+    def write(self, file_name=None):
+        """Write the configuration with an atomic replace.
+
+        The content is written to a temporary file in the target directory, which then
+        replaces the target file.
+
+        Parameters
+        ----------
+        file_name : str, optional
+            Full path and name of the file to write. The default is ``None``, in which case
+            the file that the configuration was read from is overwritten.
+
+        Returns
+        -------
+        bool
+            ``True`` when successful, ``False`` when failed.
+        """
+        file_name = file_name or self.file_name
+        if not file_name:
+            return False
+        temp_name = None
+        try:
+            handle, temp_name = tempfile.mkstemp(
+                prefix=os.path.basename(file_name) + ".", suffix=".tmp", dir=os.path.dirname(os.path.abspath(file_name))
+            )
+            with os.fdopen(handle, "w") as f:
+                f.writelines(self.lines)
+            if os.path.exists(file_name):
+                shutil.copymode(file_name, temp_name)
+            else:
+                os.chmod(temp_name, 0o644)
+            os.replace(temp_name, file_name)
+            written = os.path.abspath(file_name)
+            if written in _job_templates:
+                stat = os.stat(written)
+                _job_templates[written] = ((stat.st_mtime_ns, stat.st_size), tuple(self.lines))
+        except (IOError, OSError):
+            if temp_name and os.path.exists(temp_name):
+                os.remove(temp_name)
+            return False
+        return True
+
 
 def get_hpc_info(filename):
     """Retrieve HPC information.
@@ -53,6 +378,8 @@ def get_hpc_info(filename):
 def update_hpc_option(filnename, propertyname, propertyvalue, isvaluestring=True, separator="="):
     """Update an HPC option in the configuration file.
 
+    To change several options, use :class:`JobConfiguration`, which writes the file once.
+
     Parameters
     ----------
     filnename : str
@@ -71,28 +398,10 @@ def update_hpc_option(filnename, propertyname, propertyvalue, isvaluestring=True
     type
 
     """
-    line_number = None
-    new_line = ""
-    with open(filnename, "r") as file:
-        data = file.readlines()
-        for i, line in enumerate(data):
-            if propertyname + separator in line:
-                old_prop = line.strip()
-                old_line = line
-                line_number = i
-                if isvaluestring:
-                    new_line = old_line.replace(old_prop, propertyname + separator + "'" + str(propertyvalue) + "'")
-                else:
-                    new_line = old_line.replace(old_prop, propertyname + separator + str(propertyvalue))
-                break
-
-    data[line_number] = new_line
-    try:
-        with open(filnename, "w") as file:
-            file.writelines(data)
-        return True
-    except IOError:
+    config = JobConfiguration.from_file(filnename)
+    if not config.set_option(propertyname, propertyvalue, isvaluestring, separator):
         return False
+    return config.write()
 
 
 def update_simulation_cores(name, nc):
@@ -106,15 +415,9 @@ def update_simulation_cores(name, nc):
         Number of simulation cores.
 
     """
-    with open(name) as fid:
-        for line in fid:
-            if "NumCores=" in line:
-                old_cores = line.strip()
-                new_line = line
-    with open(name) as fid:
-        new_line = fid.read().replace(old_cores, "NumCores=" + str(nc))
-    with open(name, "w") as f:
-        f.write(new_line)
+    config = JobConfiguration.from_file(name)
+    config.set_simulation_cores(nc)
+    config.write()
 
 
 def update_simulation_engines(name, nc):
@@ -128,15 +431,9 @@ def update_simulation_engines(name, nc):
         Number of simulaton engines.
 
     """
-    with open(name) as fid:
-        for line in fid:
-            if "NumEngines=" in line:
-                old_cores = line.strip()
-                new_line = line
-    with open(name) as fid:
-        new_line = fid.read().replace(old_cores, "NumEngines=" + str(nc))
-    with open(name, "w") as f:
-        f.write(new_line)
+    config = JobConfiguration.from_file(name)
+    config.set_simulation_engines(nc)
+    config.write()
 
 
 def update_machine_name(name, machinename):
@@ -150,15 +447,9 @@ def update_machine_name(name, machinename):
         New name of the machine.
 
     """
-    with open(name) as fid:
-        for line in fid:
-            if "MachineName=" in line:
-                old_machine = line.strip()
-                new_line = line
-    with open(name) as fid:
-        new_line = fid.read().replace(old_machine, "MachineName='" + str(machinename) + "'")
-    with open(name, "w") as f:
-        f.write(new_line)
+    config = JobConfiguration.from_file(name)
+    config.set_machine_name(machinename)
+    config.write()
 
 
 def update_config_name(name, machinename):
@@ -172,17 +463,9 @@ def update_config_name(name, machinename):
         New name of the machine.
 
     """
-    with open(name) as fid:
-        for line in fid:
-            if "ConfigName=" in line:
-                old_config = line.strip()
-                new_line = line
-    with open(name) as fid:
-        if machinename == "localhost":
-            machinename = "Local"
-        new_line = fid.read().replace(old_config, "ConfigName='" + str(machinename) + "'")
-    with open(name, "w") as f:
-        f.write(new_line)
+    config = JobConfiguration.from_file(name)
+    config.set_config_name(machinename)
+    config.write()
 
 
 def update_cluster_cores(file_name, param_name, param_val):
@@ -198,15 +481,9 @@ def update_cluster_cores(file_name, param_name, param_val):
          New number of cluster cores.
 
     """
-    with open(file_name) as f:
-        for line in f:
-            if param_name in line:
-                old_line = line
-    with open(file_name) as f:
-        replacement_line = "\\	\\	\\	NumCores=" + str(param_val) + "\\" + chr(10)
-        new_line = f.read().replace(old_line, replacement_line)
-    with open(file_name, "w") as f:
-        f.write(new_line)
+    config = JobConfiguration.from_file(file_name)
+    config.set_cluster_cores(param_name, param_val)
+    config.write()
 
 
 def update_hpc_template(file_name, param_name, param_val):
@@ -222,13 +499,6 @@ def update_hpc_template(file_name, param_name, param_val):
         Value of the parameter.
 
     """
-    with open(file_name) as f:
-        for line in f:
-            if line.find(param_name) > 0:
-                line = f.readline()
-                old_line = line
-    with open(file_name) as f:
-        replacement_line = "\\	\\	\\	Value=\\'" + str(param_val) + "\\'\\" + chr(10)
-        new_line = f.read().replace(old_line, replacement_line)
-    with open(file_name, "w") as f:
-        f.write(new_line)
+    config = JobConfiguration.from_file(file_name)
+    config.set_template_value(param_name, param_val)
+    config.write()
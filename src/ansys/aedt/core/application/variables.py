@@ -1045,21 +1045,7 @@ class VariableManager(object):
             description = ""
 
         desktop_object = self.aedt_object(name)
-        if name.startswith("$"):
-            tab_name = "ProjectVariableTab"
-            prop_server = "ProjectVariables"
-        else:
-            tab_name = "LocalVariableTab"
-            prop_server = "LocalVariables"
-            if circuit_parameter and self._app.design_type in [
-                "HFSS 3D Layout Design",
-                "Circuit Design",
-                "Maxwell Circuit",
-                "Twin Builder",
-            ]:
-                tab_name = "DefinitionParameterTab"
-            if self._app.design_type in ["HFSS 3D Layout Design", "Circuit Design", "Maxwell Circuit", "Twin Builder"]:
-                prop_server = f"Instance:{desktop_object.GetName()}"
+        tab_name, prop_server = self._variable_tab(name, desktop_object, circuit_parameter)
 
         prop_type = "VariableProp"
         if is_post_processing or "post" in name.lower()[0:5]:
@@ -1183,6 +1169,107 @@ class VariableManager(object):
             return False
         return True
 
+    def _variable_tab(self, name, desktop_object, circuit_parameter=True):
+        if name.startswith("$"):
+            return "ProjectVariableTab", "ProjectVariables"
+        tab_name = "LocalVariableTab"
+        prop_server = "LocalVariables"
+        if self._app.design_type in ["HFSS 3D Layout Design", "Circuit Design", "Maxwell Circuit", "Twin Builder"]:
+            if circuit_parameter:
+                tab_name = "DefinitionParameterTab"
+            prop_server = f"Instance:{desktop_object.GetName()}"
+        return tab_name, prop_server
+
+    @pyaedt_function_handler()
+    def set_variables(
+        self, variables, read_only=False, hidden=False, description=None, sweep=True, circuit_parameter=True
+    ):
+        """Set the values of several design properties or project variables at once.
+
+        New variables are created and existing variables are changed with a single
+        ``ChangeProperty`` call for the design and a single one for the project.
+
+        Parameters
+        ----------
+        variables : dict
+            Dictionary with the names of the design properties or project variables (``$var``)
+            as keys and their expressions as values. Expressions can be strings or numbers.
+        read_only : bool, optional
+            Whether to set the variables to read-only. The default is ``False``.
+        hidden :  bool, optional
+            Whether to hide the variables. The default is ``False``.
+        description : str, optional
+            Text to display for the variables in the ``Properties`` window.
+            The default is ``None``.
+        sweep : bool, optional
+            Whether to include the variables in solution indexing. The default is ``True``.
+        circuit_parameter : bool, optional
+            Whether to define parameters in a circuit design or local parameters.
+            The default is ``True``.
+
+        Returns
+        -------
+        bool
+             ``True`` when successful, ``False`` when failed.
+
+        References
+        ----------
+        >>> oProject.ChangeProperty
+        >>> oDesign.ChangeProperty
+
+        Examples
+        --------
+        >>> from ansys.aedt.core import Circuit
+        >>> cir = Circuit()
+        >>> cir.variable_manager.set_variables({"r1": "50ohm", "c1": "1pF", "$l1": "1nH"})
+        """
+        if not description:
+            description = ""
+        all_dicts = [
+            self._independent_project_variables,
+            self._independent_design_variables,
+            self._dependent_project_variables,
+            self._dependent_design_variables,
+        ]
+        project_variables = {}
+        design_variables = {}
+        for name, expression in variables.items():
+            if isinstance(expression, Variable):
+                expression = expression.evaluated_value
+            elif not isinstance(expression, str):
+                expression = str(expression)
+            for dict_var in all_dicts:
+                dict_var.pop(name, None)
+            if name.startswith("$"):
+                project_variables[name] = expression
+            else:
+                design_variables[name] = expression
+
+        for group in [design_variables, project_variables]:
+            if not group:
+                continue
+            desktop_object = self.aedt_object(next(iter(group)))
+            tab_name, prop_server = self._variable_tab(next(iter(group)), desktop_object, circuit_parameter)
+            existing = {var_name.lower() for var_name in self._get_var_list_from_aedt(desktop_object)}
+            new_props = ["NAME:NewProps"]
+            changed_props = ["NAME:ChangedProps"]
+            for name, variable in group.items():
+                props = ["Value:=", variable, "Description:=", description, "ReadOnly:=", read_only]
+                props += ["Hidden:=", hidden, "Sweep:=", sweep]
+                if name.lower() in existing:
+                    changed_props.append(["NAME:" + name] + props)
+                else:
+                    prop_type = "PostProcessingVariableProp" if "post" in name.lower()[0:5] else "VariableProp"
+                    new_props.append(["NAME:" + name, "PropType:=", prop_type, "UserDef:=", True] + props)
+                    existing.add(name.lower())
+            tab = [f"NAME:{tab_name}", ["NAME:PropServers", prop_server]]
+            if len(new_props) > 1:
+                tab.append(new_props)
+            if len(changed_props) > 1:
+                tab.append(changed_props)
+            desktop_object.ChangeProperty(["NAME:AllTabs", tab])
+        return True
+
     @pyaedt_function_handler(separator_name="name")
     def delete_separator(self, name):
         """Delete a separator from either the active project or design.
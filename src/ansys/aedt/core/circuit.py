@@ -38,13 +38,14 @@ from ansys.aedt.core.application.analysis_hf import ScatteringMethods
 from ansys.aedt.core.application.analysis_nexxim import FieldAnalysisCircuit
 from ansys.aedt.core.generic import ibis_reader
 from ansys.aedt.core.generic.constants import unit_converter
-from ansys.aedt.core.generic.data_handlers import from_rkm_to_aedt
 from ansys.aedt.core.generic.filesystem import search_files
 from ansys.aedt.core.generic.general_methods import generate_unique_name
 from ansys.aedt.core.generic.general_methods import is_linux
 from ansys.aedt.core.generic.general_methods import open_file
 from ansys.aedt.core.generic.general_methods import pyaedt_function_handler
 from ansys.aedt.core.generic.general_methods import read_configuration_file
+from ansys.aedt.core.generic.netlist_reader import NetlistReader
+from ansys.aedt.core.generic.netlist_reader import netlist_value
 from ansys.aedt.core.generic.settings import settings
 from ansys.aedt.core.hfss3dlayout import Hfss3dLayout
 from ansys.aedt.core.modules.boundary.circuit_boundary import CurrentSinSource
@@ -198,16 +199,10 @@ class Circuit(FieldAnalysisCircuit, ScatteringMethods):
         self.__init__(*args, **kwargs)
 
     def _get_number_from_string(self, stringval):
-        value = stringval[stringval.find("=") + 1 :].strip().replace("{", "").replace("}", "").replace(",", ".")
-        value = value.replace("µ", "u")
-        try:
-            float(value)
-            return value
-        except Exception:
-            return from_rkm_to_aedt(value)
+        return netlist_value(stringval)
 
     @pyaedt_function_handler(file_to_import="input_file")
-    def create_schematic_from_netlist(self, input_file):
+    def create_schematic_from_netlist(self, input_file, batch_size=500):
         """Create a circuit schematic from an HSpice netlist.
 
         Supported currently are:
@@ -219,10 +214,17 @@ class Circuit(FieldAnalysisCircuit, ScatteringMethods):
         * Bjts
         * Discrete components with syntax ``Uxxx net1 net2 ... netn modname``
 
+        The netlist is read once into a table of elements. Parameters are set in a single
+        variable update, and components are placed on a precomputed grid and created in batches,
+        each batch being connected to grounds and page ports once its components exist.
+        The time spent in each phase is logged.
+
         Parameters
         ----------
         input_file : str
             Full path to the HSpice file to import.
+        batch_size : int, optional
+            Number of components created before they are connected. The default is ``500``.
 
         Returns
         -------
@@ -230,35 +232,32 @@ class Circuit(FieldAnalysisCircuit, ScatteringMethods):
             ``True`` when successful, ``False`` when failed.
 
         """
+        timing = {}
+        start = time.time()
+        netlist = NetlistReader(input_file).parse_netlist_file()
+        for _, message in netlist.skipped:
+            self.logger.warning(message)
+        timing["parse"] = time.time() - start
+
         units = self.modeler.schematic_units
         self.modeler.schematic_units = "meter"
         xpos = 0
-        ypos = 0
-        delta = 0.0508
-        use_instance = True
-        model = []
         self.desktop_class.close_windows()
         autosave = False
         if self._desktop.GetAutoSaveEnabled() == 1:
             self._desktop.EnableAutoSave(False)
             autosave = True
-        with open_file(input_file, "rb") as f:
-            for line in f:
-                line = line.decode("utf-8")
-                if ".param" in line[:7].lower():
-                    try:
-                        param_line = " ".join(line[7:].split())
-                        param_re = re.split("[ =]", param_line)
 
-                        ppar = param_re[0]
-                        pval = param_re[1]
-                        self[ppar] = pval
-                        xpos = 0.0254
-                    except Exception:
-                        self.logger.error(f"Failed to parse line '{line}'.")
-                elif ".model" in line[:7].lower() or ".lib" in line[:4].lower():
-                    model.append(line)
-        if model:
+        start = time.time()
+        if netlist.parameters:
+            if self.variable_manager.set_variables(netlist.parameters):
+                xpos = 0.0254
+            else:
+                self.logger.error("Failed to set netlist parameters.")
+        timing["parameters"] = time.time() - start
+
+        start = time.time()
+        if netlist.models:
             self.modeler.schematic.create_symbol("Models_Netlist", [])
             self.modeler.schematic.create_new_component_from_symbol("Models_Netlist", [], "")
             self.modeler.schematic.create_component(
@@ -266,193 +265,131 @@ class Circuit(FieldAnalysisCircuit, ScatteringMethods):
                 component_library=None,
                 component_name="Models_Netlist",
                 location=[xpos, 0],
-                global_netlist_list=model,
+                global_netlist_list=netlist.models,
             )
             self.modeler.schematic.disable_data_netlist(assignment="Models_Netlist")
             xpos += 0.0254
+        timing["models"] = time.time() - start
+
+        locations = self._netlist_grid(len(netlist.elements), xpos)
+        definitions = set()
+        timing["components"] = 0.0
+        timing["connections"] = 0.0
         counter = 0
-        with open_file(input_file, "rb") as f:
-            for line in f:
-                line = line.decode("utf-8")
-                mycomp = None
-                fields = line.split(" ")
-                name = fields[0].replace(".", "")
-
-                if fields[0][0] == "R":
-                    if "{" in fields[3][0]:
-                        value = fields[3].strip()[1:-1]
-                    elif (
-                        "/" in fields[3]
-                        and '"' not in fields[3][0]
-                        and "'" not in fields[3][0]
-                        and "{" not in fields[3][0]
-                    ):
-                        value = self._get_number_from_string(fields[3].split("/")[0])
-                    else:
-                        value = self._get_number_from_string(fields[3])
-                    mycomp = self.modeler.schematic.create_resistor(
-                        name, value, [xpos, ypos], use_instance_id_netlist=use_instance
-                    )
-                elif fields[0][0] == "L":
-                    if len(fields) > 4 and "=" not in fields[4]:
-                        try:
-                            float(fields[4])
-                        except Exception:
-                            self.logger.warning(f"Component {name} was not imported. Check it and manually import")
-                            continue
-                    if "{" in fields[3][0]:
-                        value = fields[3].strip()[1:-1]
-                    elif "/" in fields[3] and '"' not in fields[3][0] and "'" not in fields[3][0]:
-                        value = self._get_number_from_string(fields[3].split("/")[0])
-                    else:
-                        value = self._get_number_from_string(fields[3])
-                    mycomp = self.modeler.schematic.create_inductor(
-                        name, value, [xpos, ypos], use_instance_id_netlist=use_instance
-                    )
-                elif fields[0][0] == "C":
-                    if "{" in fields[3][0]:
-                        value = fields[3].strip()[1:-1]
-                    elif "/" in fields[3] and '"' not in fields[3][0] and "'" not in fields[3][0]:
-                        value = self._get_number_from_string(fields[3].split("/")[0])
-                    else:
-                        value = self._get_number_from_string(fields[3])
-                    mycomp = self.modeler.schematic.create_capacitor(
-                        name, value, [xpos, ypos], use_instance_id_netlist=use_instance
-                    )
-                elif fields[0][0] == "Q" or fields[0][0] == "U":
-                    if len(fields) == 4 and fields[0][0] == "Q":
-                        value = fields[3].strip()
-                        mycomp = self.modeler.schematic.create_npn(
-                            fields[0], value, [xpos, ypos], use_instance_id_netlist=use_instance
-                        )
-                    else:
-                        numpins = len(fields) - 2
-                        i = 1
-                        pins = []
-                        while i <= numpins:
-                            pins.append("Pin" + str(i))
-                            i += 1
-                        parameter = fields[len(fields) - 1][:-1].strip()
-                        if "=" in parameter:
-                            parameter_list = [parameter[: parameter.find("=") - 1]]
-                            parameter_value = [parameter[parameter.find("=") + 1 :]]
-                        else:
-                            parameter_list = ["MOD"]
-                            parameter_value = [parameter]
-                        self.modeler.schematic.create_symbol(parameter, pins)
-                        already_exist = False
-                        for el in self.modeler.schematic.components:
-                            if self.modeler.schematic.components[el].name == parameter:
-                                already_exist = True
-                        if not already_exist:
-                            self.modeler.schematic.create_new_component_from_symbol(
-                                parameter, pins, refbase=fields[0][0], parameters=parameter_list, values=parameter_value
-                            )
-                        mycomp = self.modeler.schematic.create_component(
-                            fields[0],
-                            component_library=None,
-                            component_name=parameter,
-                            location=[xpos, ypos],
-                            use_instance_id_netlist=use_instance,
-                        )
-                        value = None
-                elif fields[0][0] == "J":
-                    numpins = len(fields) - 1
-                    i = 1
-                    pins = []
-                    while i <= numpins:
-                        pins.append("Pin" + str(i))
-                        i += 1
-                    parameter = fields[len(fields) - 1][:-1].strip()
-                    if "=" in parameter:
-                        parameter_list = [parameter[: parameter.find("=") - 1]]
-                        parameter_value = [parameter[parameter.find("=") + 1 :]]
-                    else:
-                        parameter_list = ["MOD"]
-                        parameter_value = [parameter]
-                    self.modeler.schematic.create_symbol(parameter, pins)
-                    already_exist = False
-                    for el in self.modeler.schematic.components:
-                        if self.modeler.schematic.components[el].name == parameter:
-                            already_exist = True
-                    if not already_exist:
-                        self.modeler.schematic.create_new_component_from_symbol(
-                            parameter, pins, refbase=fields[0][0], parameters=parameter_list, values=parameter_value
-                        )
-                    mycomp = self.modeler.schematic.create_component(
-                        fields[0],
-                        component_library=None,
-                        component_name=parameter,
-                        location=[xpos, ypos],
-                        use_instance_id_netlist=use_instance,
-                    )
-                    value = None
-                elif fields[0][0] == "D":
-                    value = self._get_number_from_string(fields[3])
-                    mycomp = self.modeler.schematic.create_diode(
-                        name, value, [xpos, ypos], use_instance_id_netlist=use_instance
-                    )
-                elif fields[0][0] == "V":
-                    if "PULSE" not in line:
-                        value = self._get_number_from_string(fields[3])
-                        mycomp = self.modeler.schematic.create_voltage_dc(
-                            name, value, [xpos, ypos], use_instance_id_netlist=use_instance
-                        )
-                    else:
-                        value = line[line.index("PULSE") + 6 : line.index(")") - 1].split(" ")
-                        value = [i.replace("{", "").replace("}", "") for i in value]
-                        fields[1], fields[2] = fields[2], fields[1]
-                        mycomp = self.modeler.schematic.create_voltage_pulse(
-                            name, value, [xpos, ypos], use_instance_id_netlist=use_instance
-                        )
-                elif fields[0][0].lower() == "k":
-                    value = self._get_number_from_string(fields[3])
-                    mycomp = self.modeler.schematic.create_coupling_inductors(
-                        name, fields[1], fields[2], value, [xpos, ypos], use_instance_id_netlist=use_instance
-                    )
-                elif fields[0][0] == "I":
-                    if "PULSE" not in line:
-                        value = self._get_number_from_string(fields[3])
-                        mycomp = self.modeler.schematic.create_current_dc(
-                            name, value, [xpos, ypos], use_instance_id_netlist=use_instance
-                        )
-                    else:
-                        value = line[line.index("PULSE") + 6 : line.index(")") - 1].split(" ")
-                        value = [i.replace("{", "").replace("}", "") for i in value]
-                        mycomp = self.modeler.schematic.create_current_pulse(
-                            name, value, [xpos, ypos], use_instance_id_netlist=use_instance
-                        )
-                elif not any(word in line.lower() for word in [".param", ".model", ".lib"]):
-                    self.logger.warning("%s could not be imported", line)
+        batch_size = max(int(batch_size), 1)
+        for first in range(0, len(netlist.elements), batch_size):
+            start = time.time()
+            created = []
+            for element, location in zip(
+                netlist.elements[first : first + batch_size], locations[first : first + batch_size]
+            ):
+                mycomp = self._create_netlist_component(element, location, definitions)
                 if mycomp:
-                    id = 1
-                    for pin in mycomp.pins:
-                        pos = pin.location
-                        if pos[0] < xpos:
-                            angle = 0.0
-                        else:
-                            angle = math.pi
-                        if fields[id] == "0":
-                            gnd_pos = self.modeler.schematic._convert_point_to_units([0, -0.00254])
-                            new_pos = [i + j for i, j in zip(pos, gnd_pos)]
-                            self.modeler.schematic.create_gnd([new_pos[0], new_pos[1]])
-                        else:
-                            self.modeler.schematic.create_page_port(fields[id], [pos[0], pos[1]], angle)
-                        id += 1
-                    ypos += delta
-                    if ypos > 0.254:
-                        xpos += delta
-                        ypos = 0
+                    created.append((element, location, mycomp))
                     counter += 1
                     if counter > 59:
                         self.modeler.oeditor.CreatePage("<Page Title>")
                         counter = 0
+            timing["components"] += time.time() - start
+
+            start = time.time()
+            for element, location, mycomp in created:
+                for pin, node in zip(mycomp.pins, element.nodes):
+                    pos = pin.location
+                    if pos[0] < location[0]:
+                        angle = 0.0
+                    else:
+                        angle = math.pi
+                    if node == "0":
+                        gnd_pos = self.modeler.schematic._convert_point_to_units([0, -0.00254])
+                        new_pos = [i + j for i, j in zip(pos, gnd_pos)]
+                        self.modeler.schematic.create_gnd([new_pos[0], new_pos[1]])
+                    else:
+                        self.modeler.schematic.create_page_port(node, [pos[0], pos[1]], angle)
+            timing["connections"] += time.time() - start
+            self.logger.info(
+                "Imported %s of %s netlist elements.",
+                min(first + batch_size, len(netlist.elements)),
+                len(netlist.elements),
+            )
         if autosave:
             self._desktop.EnableAutoSave(True)
         self.modeler.schematic_units = units
+        self.logger.info(
+            "Netlist import time: " + ", ".join(f"{phase} {elapsed:.2f}s" for phase, elapsed in timing.items())
+        )
         self.logger.info("Netlist was correctly imported into %s", self.design_name)
         return True
 
+    @staticmethod
+    def _netlist_grid(number, xpos=0, delta=0.0508, max_ypos=0.254):
+        """Get the locations of the netlist components, placed in columns from the bottom left corner."""
+        locations = []
+        ypos = 0
+        for _ in range(number):
+            locations.append([xpos, ypos])
+            ypos += delta
+            if ypos > max_ypos:
+                xpos += delta
+                ypos = 0
+        return locations
+
+    def _create_netlist_component(self, element, location, definitions):
+        """Create the schematic component of a netlist element.
+
+        The instance name is enabled in the netlist of each component definition only the first time
+        the definition is used, since the definition is shared by all the instances.
+        """
+        schematic = self.modeler.schematic
+        definition = (element.kind, element.model)
+        use_instance = definition not in definitions
+        if element.kind == "subcircuit" and use_instance:
+            schematic.create_symbol(element.model, element.pins)
+            schematic.create_new_component_from_symbol(
+                element.model,
+                element.pins,
+                refbase=element.name[0],
+                parameters=element.parameters,
+                values=element.values,
+            )
+        create_methods = {
+            "resistor": schematic.create_resistor,
+            "inductor": schematic.create_inductor,
+            "capacitor": schematic.create_capacitor,
+            "npn": schematic.create_npn,
+            "diode": schematic.create_diode,
+            "voltage_dc": schematic.create_voltage_dc,
+            "voltage_pulse": schematic.create_voltage_pulse,
+            "current_dc": schematic.create_current_dc,
+            "current_pulse": schematic.create_current_pulse,
+        }
+        if element.kind in create_methods:
+            component = create_methods[element.kind](
+                element.name, element.value, location, use_instance_id_netlist=use_instance
+            )
+        elif element.kind == "coupling":
+            component = schematic.create_coupling_inductors(
+                element.name,
+                element.nodes[0],
+                element.nodes[1],
+                element.value,
+                location,
+                use_instance_id_netlist=use_instance,
+            )
+        else:
+            component = schematic.create_component(
+                element.name,
+                component_library=None,
+                component_name=element.model,
+                location=location,
+                use_instance_id_netlist=use_instance,
+            )
+        # The definition is used only once a component is created, so that a failed creation
+        # does not prevent the next instance from enabling the instance name.
+        if component:
+            definitions.add(definition)
+        return component
+
     @pyaedt_function_handler(path="input_file")
     def get_ibis_model_from_file(self, input_file, is_ami=False):
         """Create an IBIS model based on the data contained in an IBIS file.
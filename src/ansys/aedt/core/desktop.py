@@ -62,7 +62,9 @@ from ansys.aedt.core import __version__
 from ansys.aedt.core.generic.aedt_versions import aedt_versions
 from ansys.aedt.core.generic.desktop_sessions import _desktop_sessions
 from ansys.aedt.core.generic.desktop_sessions import _edb_sessions
+from ansys.aedt.core.generic.general_methods import _cached_session_ports
 from ansys.aedt.core.generic.general_methods import active_sessions
+from ansys.aedt.core.generic.general_methods import clear_active_sessions_cache
 from ansys.aedt.core.generic.general_methods import com_active_sessions
 from ansys.aedt.core.generic.general_methods import get_string_version
 from ansys.aedt.core.generic.general_methods import grpc_active_sessions
@@ -111,9 +113,10 @@ def launch_aedt(full_path, non_graphical, port, student_version, first_run=True)
     _aedt_process_thread.daemon = True
     _aedt_process_thread.start()
     timeout = settings.desktop_launch_timeout
-    k = 0
+    start = time.time()
     while not _is_port_occupied(port):
-        if k > timeout:  # pragma: no cover
+        if time.time() - start > timeout:  # pragma: no cover
+            clear_active_sessions_cache()
             active_s = active_sessions(student_version=student_version)
             for pid in active_s:
                 if port == active_s[pid]:
@@ -125,8 +128,8 @@ def launch_aedt(full_path, non_graphical, port, student_version, first_run=True)
                 port = _find_free_port()
                 return launch_aedt(full_path, non_graphical, port, student_version, first_run=False)
             return False, _find_free_port()
-        time.sleep(1)
-        k += 1
+        time.sleep(0.2)
+    clear_active_sessions_cache()
     return True, port
 
 
@@ -233,9 +236,11 @@ def _find_free_port():
             s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
             return s.getsockname()[1]
 
+    # A port returned by the OS is not bound by any listening process. Only ports reserved
+    # by AEDT sessions still starting up, as known from the last session scan, are skipped.
     while True:
         new_port = _find()
-        if new_port not in list(active_sessions().values()) and new_port not in range(50051, 50070, 1):
+        if new_port not in range(50051, 50070, 1) and new_port not in _cached_session_ports():
             return new_port
         time.sleep(0.1)
 
@@ -931,6 +936,7 @@ class Desktop(object):
             self._initialize(new_session=False, is_grpc=False, version=version_key)
         processID2 = []
         if is_windows:
+            clear_active_sessions_cache()
             processID2 = com_active_sessions(version, student_version, non_graphical)
         proc = [i for i in processID2 if i not in processID]  # Looking for the "new" process
         if (
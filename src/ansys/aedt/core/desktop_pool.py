@@ -0,0 +1,400 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2024 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Pool of pre-launched AEDT gRPC sessions.
+
+Launching AEDT and connecting to it usually dominates the wall time of short jobs. The
+:class:`DesktopPool` class keeps a set of AEDT gRPC sessions running and lends them to
+callers as connected :class:`ansys.aedt.core.desktop.Desktop` objects.
+"""
+
+import atexit
+from contextlib import contextmanager
+import threading
+import time
+
+from ansys.aedt.core.aedt_logger import pyaedt_logger
+from ansys.aedt.core.generic.settings import settings
+
+
+class _PooledSession(object):
+    """Bookkeeping for one session of the pool."""
+
+    def __init__(self, desktop):
+        self.desktop = desktop
+        self.uses = 0
+        self.in_use = False
+        self.last_used = time.time()
+
+
+class DesktopPool(object):
+    """Keeps AEDT gRPC sessions running and lends them to callers.
+
+    Sessions are launched when the pool starts. A borrowed session is returned to the pool
+    with its projects closed, and it is replaced by a new session after ``max_uses`` loans or
+    when it stops responding. A background thread checks the idle sessions and closes the
+    ones that exceed ``idle_timeout`` while more than ``min_size`` sessions are running.
+
+    Several sessions can coexist in the same Python process only in multi-desktop mode, so
+    starting the pool sets ``settings.use_multi_desktop`` to ``True``. The setting is left enabled
+    when the pool is closed because other sessions or pools of the process may still rely on it.
+
+    Parameters
+    ----------
+    size : int, optional
+        Maximum number of AEDT sessions in the pool. The default is ``2``.
+    version : str, int, float, optional
+        Version of AEDT to launch. The default is ``None``, in which case the latest installed
+        version is used.
+    non_graphical : bool, optional
+        Whether to launch AEDT in non-graphical mode. The default is ``True``.
+    student_version : bool, optional
+        Whether to launch the student version of AEDT. The default is ``False``.
+    max_uses : int, optional
+        Number of loans after which a session is closed and replaced. The default is ``10``.
+        If ``0``, sessions are never recycled.
+    min_size : int, optional
+        Number of sessions kept running even when idle. The default is ``None``, in which case
+        ``size`` sessions are kept running.
+    idle_timeout : float, optional
+        Time in seconds after which an idle session above ``min_size`` is closed.
+        The default is ``600``.
+    health_check_interval : float, optional
+        Time in seconds between two health checks of the idle sessions. The default is ``30``.
+    desktop_factory : callable, optional
+        Function called without arguments to launch a session. It must return an object that
+        exposes ``port``, ``machine``, ``odesktop`` and ``release_desktop`` like
+        :class:`ansys.aedt.core.desktop.Desktop`. The default is ``None``, in which case a new
+        AEDT gRPC session is launched.
+
+    Examples
+    --------
+    >>> from ansys.aedt.core import Hfss
+    >>> from ansys.aedt.core.desktop_pool import DesktopPool
+    >>> with DesktopPool(size=2, version="2024.2") as pool:
+    ...     with pool.session() as desktop:
+    ...         hfss = Hfss(version="2024.2", new_desktop=False, port=desktop.port)
+    """
+
+    def __init__(
+        self,
+        size=2,
+        version=None,
+        non_graphical=True,
+        student_version=False,
+        max_uses=10,
+        min_size=None,
+        idle_timeout=600,
+        health_check_interval=30,
+        desktop_factory=None,
+    ):
+        self.size = size
+        self.min_size = size if min_size is None else min(min_size, size)
+        self.version = version
+        self.non_graphical = non_graphical
+        self.student_version = student_version
+        self.max_uses = max_uses
+        self.idle_timeout = idle_timeout
+        self.health_check_interval = health_check_interval
+        self._desktop_factory = desktop_factory or self._launch_desktop
+        self._sessions = []
+        self._launching = 0
+        self._condition = threading.Condition()
+        self._closed = False
+        self._started = False
+        self._stop_event = threading.Event()
+        self._monitor = None
+        self.logger = pyaedt_logger
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, ex_type, ex_value, ex_traceback):
+        self.close()
+
+    @property
+    def available(self):
+        """Number of idle sessions ready to be lent."""
+        with self._condition:
+            return len([s for s in self._sessions if not s.in_use])
+
+    @property
+    def running(self):
+        """Number of sessions running, including the sessions being launched."""
+        with self._condition:
+            return len(self._sessions) + self._launching
+
+    def start(self, wait=True):
+        """Launch the sessions of the pool and start the background health checks.
+
+        Parameters
+        ----------
+        wait : bool, optional
+            Whether to wait until ``min_size`` sessions are running. The default is ``True``.
+
+        Returns
+        -------
+        bool
+            ``True`` when successful.
+        """
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("The desktop pool is closed.")
+            if self._started:
+                return True
+            self._started = True
+            settings.use_multi_desktop = True
+            missing = self.min_size - len(self._sessions) - self._launching
+            self._launching += max(missing, 0)
+        if wait:
+            for _ in range(max(missing, 0)):
+                self._launch_session()
+        else:
+            for _ in range(max(missing, 0)):
+                threading.Thread(target=self._launch_session, daemon=True).start()
+        self._monitor = threading.Thread(target=self._monitor_sessions, daemon=True)
+        self._monitor.start()
+        atexit.register(self.close)
+        return True
+
+    def acquire(self, timeout=None):
+        """Borrow a connected session from the pool.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Time in seconds to wait for a session. The default is ``None``, in which case
+            the call waits until a session is available.
+
+        Returns
+        -------
+        :class:`ansys.aedt.core.desktop.Desktop`
+            Connected desktop session with no open projects.
+        """
+        if not self._started:
+            self.start()
+        deadline = None if timeout is None else time.time() + timeout
+        launch = False
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise RuntimeError("The desktop pool is closed.")
+                session = next((s for s in self._sessions if not s.in_use), None)
+                if session:
+                    session.in_use = True
+                    session.uses += 1
+                    return session.desktop
+                if not launch and len(self._sessions) + self._launching < self.size:
+                    self._launching += 1
+                    threading.Thread(target=self._launch_session, daemon=True).start()
+                    launch = True
+                remaining = None if deadline is None else deadline - time.time()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError("No AEDT session of the pool became available in time.")
+                self._condition.wait(remaining)
+
+    def release(self, desktop):
+        """Return a borrowed session to the pool.
+
+        The projects of the session are closed. The session is replaced if it reached
+        ``max_uses`` loans or if it does not respond anymore.
+
+        Parameters
+        ----------
+        desktop : :class:`ansys.aedt.core.desktop.Desktop`
+            Session obtained with :meth:`acquire`.
+
+        Returns
+        -------
+        bool
+            ``True`` when the session is returned to the pool, ``False`` when it is recycled.
+        """
+        with self._condition:
+            session = next((s for s in self._sessions if s.desktop is desktop), None)
+            if session is None or not session.in_use:
+                raise ValueError("The desktop session does not belong to this pool or is not borrowed.")
+        recycle = self._closed or (self.max_uses and session.uses >= self.max_uses)
+        if not recycle and not self._reset_session(session):
+            recycle = True
+        if recycle:
+            self._retire(session, replace=not self._closed)
+            return False
+        with self._condition:
+            session.in_use = False
+            session.last_used = time.time()
+            self._condition.notify_all()
+        return True
+
+    @contextmanager
+    def session(self, timeout=None):
+        """Borrow a session for the duration of a ``with`` block.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Time in seconds to wait for a session. The default is ``None``.
+
+        Yields
+        ------
+        :class:`ansys.aedt.core.desktop.Desktop`
+            Connected desktop session with no open projects.
+        """
+        desktop = self.acquire(timeout)
+        try:
+            yield desktop
+        finally:
+            self.release(desktop)
+
+    def check_health(self):
+        """Check the idle sessions and replace or close the ones that must not be lent anymore.
+
+        Returns
+        -------
+        int
+            Number of sessions closed.
+        """
+        now = time.time()
+        with self._condition:
+            idle = [s for s in self._sessions if not s.in_use]
+            running = len(self._sessions) + self._launching
+        closed = 0
+        for session in idle:
+            with self._condition:
+                if session.in_use or session not in self._sessions:
+                    continue
+                session.in_use = True
+            if not self._is_alive(session):
+                self.logger.warning(f"AEDT session on port {session.desktop.port} is not responding. Replacing it.")
+                self._retire(session, replace=True)
+                closed += 1
+            elif self.idle_timeout and running > self.min_size and now - session.last_used > self.idle_timeout:
+                self.logger.info(f"Closing AEDT session on port {session.desktop.port} after idle timeout.")
+                self._retire(session, replace=False)
+                running -= 1
+                closed += 1
+            else:
+                with self._condition:
+                    session.in_use = False
+                    self._condition.notify_all()
+        return closed
+
+    def close(self):
+        """Close all the sessions of the pool.
+
+        Borrowed sessions are closed when they are released.
+
+        Returns
+        -------
+        bool
+            ``True`` when successful.
+        """
+        with self._condition:
+            if self._closed:
+                return True
+            self._closed = True
+            idle = [s for s in self._sessions if not s.in_use]
+            for session in idle:
+                session.in_use = True
+            self._condition.notify_all()
+        self._stop_event.set()
+        for session in idle:
+            self._retire(session, replace=False)
+        if self._monitor and self._monitor is not threading.current_thread():
+            self._monitor.join(timeout=5)
+        atexit.unregister(self.close)
+        return True
+
+    def _launch_desktop(self):  # pragma: no cover
+        from ansys.aedt.core.desktop import Desktop
+        from ansys.aedt.core.desktop import _find_free_port
+
+        return Desktop(
+            version=self.version,
+            non_graphical=self.non_graphical,
+            new_desktop=True,
+            close_on_exit=False,
+            student_version=self.student_version,
+            port=_find_free_port(),
+        )
+
+    def _launch_session(self):
+        session = None
+        try:
+            desktop = self._desktop_factory()
+            if desktop:
+                session = _PooledSession(desktop)
+        except Exception as e:
+            self.logger.error(f"Failed to launch an AEDT session for the pool: {e}")
+        with self._condition:
+            self._launching -= 1
+            if session and not self._closed:
+                self._sessions.append(session)
+            self._condition.notify_all()
+        if session and self._closed:
+            self._close_desktop(session.desktop)
+        return session
+
+    def _retire(self, session, replace):
+        with self._condition:
+            if session in self._sessions:
+                self._sessions.remove(session)
+            if replace and not self._closed:
+                self._launching += 1
+            else:
+                replace = False
+            self._condition.notify_all()
+        self._close_desktop(session.desktop)
+        if replace:
+            threading.Thread(target=self._launch_session, daemon=True).start()
+
+    def _close_desktop(self, desktop):
+        try:
+            desktop.release_desktop(close_projects=True, close_on_exit=True)
+        except Exception as e:  # pragma: no cover
+            self.logger.warning(f"Failed to close AEDT session of the pool: {e}")
+
+    def _reset_session(self, session):
+        try:
+            odesktop = session.desktop.odesktop
+            for project in list(odesktop.GetProjectList()):
+                odesktop.CloseProject(project)
+            return self._is_alive(session)
+        except Exception as e:
+            self.logger.warning(f"Failed to reset AEDT session of the pool: {e}")
+            return False
+
+    @staticmethod
+    def _is_alive(session):
+        from ansys.aedt.core.desktop import _is_port_occupied
+
+        desktop = session.desktop
+        return _is_port_occupied(desktop.port, getattr(desktop, "machine", "") or "")
+
+    def _monitor_sessions(self):
+        while not self._stop_event.wait(self.health_check_interval):
+            try:
+                self.check_health()
+            except Exception as e:  # pragma: no cover
+                self.logger.debug(f"Health check of the desktop pool failed: {e}")
@@ -22,6 +22,7 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import threading
 import warnings
 
 from ansys.aedt.core.emit_core.emit_constants import EmiCategoryFilter
@@ -92,6 +93,12 @@ class Revision:
         self.parent_results = parent_results
         """Parent Results object"""
 
+        # interactions and band data shared by the classifications
+        self._interactions = {}
+        self._band_names = {}
+        self._active_frequencies = {}
+        self._cache_lock = threading.Lock()
+
         # load the revision after creating it
         self.revision_loaded = False
         """``True`` if the revision is loaded and ``False`` if it is not."""
@@ -426,13 +433,107 @@ class Revision:
         if self.revision_loaded:
             engine = self.emit_project._emit_api.get_engine()
             engine.n_to_1_limit = max_instances
+            self.clear_interaction_cache()
 
     @pyaedt_function_handler()
-    def interference_type_classification(self, domain, use_filter=False, filter_list=None):  # pragma: no cover
+    def clear_interaction_cache(self):
+        """Clear the interactions, band names, and active frequencies cached by the classifications.
+
+        Returns
+        -------
+        bool
+            ``True`` when successful.
+
+        Examples
+        --------
+        >>> rev.clear_interaction_cache()
+        """
+        with self._cache_lock:
+            self._interactions = {}
+            self._band_names = {}
+            self._active_frequencies = {}
+        return True
+
+    def _cached_band_names(self, radio_name, tx_rx_mode):
+        key = (radio_name, tx_rx_mode)
+        with self._cache_lock:
+            if key in self._band_names:
+                return self._band_names[key]
+        bands = self.get_band_names(radio_name, tx_rx_mode)
+        with self._cache_lock:
+            self._band_names[key] = bands
+        return bands
+
+    def _cached_active_frequencies(self, radio_name, band_name, tx_rx_mode):
+        key = (radio_name, band_name, tx_rx_mode)
+        with self._cache_lock:
+            if key in self._active_frequencies:
+                return self._active_frequencies[key]
+        freqs = self.get_active_frequencies(radio_name, band_name, tx_rx_mode)
+        with self._cache_lock:
+            self._active_frequencies[key] = freqs
+        return freqs
+
+    def _cached_interaction(self, domain, rx_radio, rx_band, tx_radio, tx_band):
+        """Run the interaction of a band pair once and share it between the classifications."""
+        key = (rx_radio, rx_band, tx_radio, tx_band)
+        with self._cache_lock:
+            if key in self._interactions:
+                return self._interactions[key]
+        domain.set_receiver(rx_radio, rx_band)
+        domain.set_interferer(tx_radio, tx_band)
+        interaction = self.run(domain)
+        with self._cache_lock:
+            self._interactions[key] = interaction
+        return interaction
+
+    def _classify_radio_pairs(self, domain, classify, max_workers, no_result):
+        """Evaluate ``classify`` for every transmitter and receiver pair and build the result matrices.
+
+        With more than one worker, each pair is evaluated on its own ``InteractionDomain`` object.
+        """
+        rx_radios = self.get_receiver_names()
+        tx_radios = self.get_interferer_names(InterfererType().TRANSMITTERS)
+        pairs = [(tx_radio, rx_radio) for tx_radio in tx_radios for rx_radio in rx_radios if tx_radio != rx_radio]
+        if max_workers and max_workers > 1 and len(pairs) > 1:
+            from concurrent.futures import ThreadPoolExecutor
+
+            def _classify_pair(pair):
+                return classify(self.parent_results.interaction_domain(), *pair)
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = dict(zip(pairs, executor.map(_classify_pair, pairs)))
+        else:
+            results = {pair: classify(domain, *pair) for pair in pairs}
+        power_matrix = []
+        all_colors = []
+        for tx_radio in tx_radios:
+            rx_powers = []
+            rx_colors = []
+            for rx_radio in rx_radios:
+                if tx_radio == rx_radio:
+                    # skip self-interaction
+                    rx_powers.append("N/A")
+                    rx_colors.append("white")
+                    continue
+                max_power, color = results[(tx_radio, rx_radio)]
+                rx_powers.append(no_result if max_power is None else max_power)
+                rx_colors.append(color)
+            all_colors.append(rx_colors)
+            power_matrix.append(rx_powers)
+        return all_colors, power_matrix
+
+    @pyaedt_function_handler()
+    def interference_type_classification(
+        self, domain, use_filter=False, filter_list=None, max_workers=1
+    ):  # pragma: no cover
         """
         Classify interference type as according to inband/inband,
         out of band/in band, inband/out of band, and out of band/out of band.
 
+        Interactions are cached per revision for each receiver band and transmitter band pair,
+        and they are shared with :meth:`protection_level_classification`.
+
         Parameters
         ----------
             domain :
@@ -441,6 +542,8 @@ class Revision:
                 Whether filtering is being used. The default is ``False``.
             filter_list : list, optional
                 List of filter values selected by the user via the GUI if filtering is in use.
+            max_workers : int, optional
+                Maximum number of radio pairs evaluated concurrently. The default is ``1``.
 
         Returns
         -------
@@ -453,115 +556,91 @@ class Revision:
         --------
         >>> interference_results = rev.interference_type_classification(domain)
         """
-        power_matrix = []
-        all_colors = []
-
-        # Get project results and radios
         modeRx = TxRxMode.RX
         modeTx = TxRxMode.TX
-        tx_interferer = InterfererType().TRANSMITTERS
-        rx_radios = self.get_receiver_names()
-        tx_radios = self.get_interferer_names(tx_interferer)
         radios = self.emit_project.modeler.components.get_radios()
 
-        for tx_radio in tx_radios:
-            rx_powers = []
-            rx_colors = []
-            for rx_radio in rx_radios:
-                # powerAtRx is the same for all Rx bands, so just use first one
-                rx_bands = self.get_band_names(rx_radio, modeRx)
-                rx_band_objects = radios[rx_radio].bands()
-                if tx_radio == rx_radio:
-                    # skip self-interaction
-                    rx_powers.append("N/A")
-                    rx_colors.append("white")
-                    continue
+        def _classify(pair_domain, tx_radio, rx_radio):
+            # powerAtRx is the same for all Rx bands, so just use first one
+            rx_bands = self._cached_band_names(rx_radio, modeRx)
+            rx_band_objects = radios[rx_radio].bands()
+            max_power = -200
+            tx_bands = self._cached_band_names(tx_radio, modeTx)
+
+            for i, rx_band in enumerate(rx_bands):
+                # Find the highest power level at the Rx input due to each Tx Radio.
+                # Can look at any Rx freq since susceptibility won't impact
+                # powerAtRx, but need to look at all tx channels since coupling
+                # can change over a transmitter's bandwidth
+                rx_freq = self._cached_active_frequencies(rx_radio, rx_band, modeRx)[0]
+
+                # The start and stop frequencies define the Band's extents,
+                # while the active frequencies are a subset of the Band's frequencies
+                # being used for this specific project as defined in the Radio's Sampling.
+                rx_start_freq = radios[rx_radio].band_start_frequency(rx_band_objects[i])
+                rx_stop_freq = radios[rx_radio].band_stop_frequency(rx_band_objects[i])
+                rx_channel_bandwidth = radios[rx_radio].band_channel_bandwidth(rx_band_objects[i])
 
-                max_power = -200
-                tx_bands = self.get_band_names(tx_radio, modeTx)
-
-                for i, rx_band in enumerate(rx_bands):
-                    # Find the highest power level at the Rx input due to each Tx Radio.
-                    # Can look at any Rx freq since susceptibility won't impact
-                    # powerAtRx, but need to look at all tx channels since coupling
-                    # can change over a transmitter's bandwidth
-                    rx_freq = self.get_active_frequencies(rx_radio, rx_band, modeRx)[0]
-
-                    # The start and stop frequencies define the Band's extents,
-                    # while the active frequencies are a subset of the Band's frequencies
-                    # being used for this specific project as defined in the Radio's Sampling.
-                    rx_start_freq = radios[rx_radio].band_start_frequency(rx_band_objects[i])
-                    rx_stop_freq = radios[rx_radio].band_stop_frequency(rx_band_objects[i])
-                    rx_channel_bandwidth = radios[rx_radio].band_channel_bandwidth(rx_band_objects[i])
-
-                    for tx_band in tx_bands:
-                        domain.set_receiver(rx_radio, rx_band)
-                        domain.set_interferer(tx_radio, tx_band)
-                        interaction = self.run(domain)
-                        # check for valid interaction, this would catch any disabled radio pairs
-                        if not interaction.is_valid():
-                            continue
+                for tx_band in tx_bands:
+                    interaction = self._cached_interaction(pair_domain, rx_radio, rx_band, tx_radio, tx_band)
+                    # check for valid interaction, this would catch any disabled radio pairs
+                    if not interaction.is_valid():
+                        continue
 
-                        domain.set_receiver(rx_radio, rx_band, rx_freq)
-                        tx_freqs = self.get_active_frequencies(tx_radio, tx_band, modeTx)
-                        for tx_freq in tx_freqs:
-                            domain.set_interferer(tx_radio, tx_band, tx_freq)
-                            instance = interaction.get_instance(domain)
-                            if not instance.has_valid_values():
-                                # check for saturation somewhere in the chain
-                                # set power so its flagged as strong interference
-                                if instance.get_result_warning() == "An amplifier was saturated.":
-                                    max_power = 200
-                                else:
-                                    # other warnings (e.g. no path from Tx to Rx,
-                                    # no power received, error in configuration, etc)
-                                    # should just be skipped
-                                    continue
-                            else:
-                                tx_prob = instance.get_largest_emi_problem_type().replace(" ", "").split(":")[1]
-                                power = instance.get_value(ResultType.EMI)
-                            if (
-                                rx_start_freq - rx_channel_bandwidth / 2
-                                <= tx_freq
-                                <= rx_stop_freq + rx_channel_bandwidth / 2
-                            ):
-                                rx_prob = "In-band"
+                    pair_domain.set_receiver(rx_radio, rx_band, rx_freq)
+                    tx_freqs = self._cached_active_frequencies(tx_radio, tx_band, modeTx)
+                    for tx_freq in tx_freqs:
+                        pair_domain.set_interferer(tx_radio, tx_band, tx_freq)
+                        instance = interaction.get_instance(pair_domain)
+                        if not instance.has_valid_values():
+                            # check for saturation somewhere in the chain
+                            # set power so its flagged as strong interference
+                            if instance.get_result_warning() == "An amplifier was saturated.":
+                                max_power = 200
                             else:
-                                rx_prob = "Out-of-band"
-                            prob_filter_val = tx_prob + ":" + rx_prob
+                                # other warnings (e.g. no path from Tx to Rx,
+                                # no power received, error in configuration, etc)
+                                # should just be skipped
+                                continue
+                        else:
+                            tx_prob = instance.get_largest_emi_problem_type().replace(" ", "").split(":")[1]
+                            power = instance.get_value(ResultType.EMI)
+                        if (
+                            rx_start_freq - rx_channel_bandwidth / 2
+                            <= tx_freq
+                            <= rx_stop_freq + rx_channel_bandwidth / 2
+                        ):
+                            rx_prob = "In-band"
+                        else:
+                            rx_prob = "Out-of-band"
+                        prob_filter_val = tx_prob + ":" + rx_prob
 
-                            # Check if problem type is in filtered list of problem types to analyze
-                            if use_filter:
-                                in_filters = any(prob_filter_val in sublist for sublist in filter_list)
-                            else:
-                                in_filters = True
-
-                            # Save the worst case interference values
-                            if power > max_power and in_filters:
-                                max_power = power
-                                largest_rx_prob = rx_prob
-                                prob = instance.get_largest_emi_problem_type()
-                                largest_tx_prob = prob.replace(" ", "").split(":")
-
-                if max_power > -200:
-                    rx_powers.append(max_power)
-
-                    if largest_tx_prob[-1] == "TxFundamental" and largest_rx_prob == "In-band":
-                        rx_colors.append("red")
-                    elif largest_tx_prob[-1] != "TxFundamental" and largest_rx_prob == "In-band":
-                        rx_colors.append("orange")
-                    elif largest_tx_prob[-1] == "TxFundamental" and not (largest_rx_prob == "In-band"):
-                        rx_colors.append("yellow")
-                    elif largest_tx_prob[-1] != "TxFundamental" and not (largest_rx_prob == "In-band"):
-                        rx_colors.append("green")
-                else:
-                    rx_powers.append("<= -200")
-                    rx_colors.append("white")
+                        # Check if problem type is in filtered list of problem types to analyze
+                        if use_filter:
+                            in_filters = any(prob_filter_val in sublist for sublist in filter_list)
+                        else:
+                            in_filters = True
 
-            all_colors.append(rx_colors)
-            power_matrix.append(rx_powers)
+                        # Save the worst case interference values
+                        if power > max_power and in_filters:
+                            max_power = power
+                            largest_rx_prob = rx_prob
+                            prob = instance.get_largest_emi_problem_type()
+                            largest_tx_prob = prob.replace(" ", "").split(":")
+
+            if max_power > -200:
+                if largest_tx_prob[-1] == "TxFundamental" and largest_rx_prob == "In-band":
+                    color = "red"
+                elif largest_tx_prob[-1] != "TxFundamental" and largest_rx_prob == "In-band":
+                    color = "orange"
+                elif largest_tx_prob[-1] == "TxFundamental" and not (largest_rx_prob == "In-band"):
+                    color = "yellow"
+                else:
+                    color = "green"
+                return max_power, color
+            return None, "white"
 
-        return all_colors, power_matrix
+        return self._classify_radio_pairs(domain, _classify, max_workers, "<= -200")
 
     @pyaedt_function_handler()
     def protection_level_classification(
@@ -572,6 +651,7 @@ class Revision:
         protection_levels=None,
         use_filter=False,
         filter_list=None,
+        max_workers=1,
     ):  # pragma: no cover
         """
         Classify worst-case power at each Rx radio according to interference type.
@@ -579,6 +659,9 @@ class Revision:
         Options for interference type are `inband/inband, out of band/in band,
         inband/out of band, and out of band/out of band.
 
+        Interactions are cached per revision for each receiver band and transmitter band pair,
+        and they are shared with :meth:`interference_type_classification`.
+
         Parameters
         ----------
             domain :
@@ -593,6 +676,8 @@ class Revision:
                 Whether to use filtering. The default is ``False``.
             filter_list : list, optional
                 List of filter values selected by the user via the GUI if filtering is in use.
+            max_workers : int, optional
+                Maximum number of radio pairs evaluated concurrently. The default is ``1``.
 
         Returns
         -------
@@ -605,119 +690,90 @@ class Revision:
         --------
         >>> protection_results = rev.protection_level_classification(domain)
         """
-        power_matrix = []
-        all_colors = []
-
-        # Get project results and radios
         modeRx = TxRxMode.RX
         modeTx = TxRxMode.TX
         mode_power = ResultType.POWER_AT_RX
-        tx_interferer = InterfererType().TRANSMITTERS
-        rx_radios = self.get_receiver_names()
-        tx_radios = self.get_interferer_names(tx_interferer)
 
         if global_protection_level and global_levels == None:
-            damage_threshold = 30
-            overload_threshold = 4
-            intermod_threshold = -20
+            global_thresholds = [30, 4, -20]
         elif global_protection_level:
-            damage_threshold = global_levels[0]
-            overload_threshold = global_levels[1]
-            intermod_threshold = global_levels[2]
-
-        for tx_radio in tx_radios:
-            rx_powers = []
-            rx_colors = []
-            for rx_radio in rx_radios:
-                # powerAtRx is the same for all Rx bands, so just
-                # use the first one
-                if not (global_protection_level):
-                    damage_threshold = protection_levels[rx_radio][0]
-                    overload_threshold = protection_levels[rx_radio][1]
-                    intermod_threshold = protection_levels[rx_radio][2]
-
-                rx_band = self.get_band_names(rx_radio, modeRx)[0]
-                if tx_radio == rx_radio:
-                    # skip self-interaction
-                    rx_powers.append("N/A")
-                    rx_colors.append("white")
+            global_thresholds = global_levels[:3]
+
+        def _classify(pair_domain, tx_radio, rx_radio):
+            # powerAtRx is the same for all Rx bands, so just
+            # use the first one
+            if global_protection_level:
+                damage_threshold, overload_threshold, intermod_threshold = global_thresholds
+            else:
+                damage_threshold = protection_levels[rx_radio][0]
+                overload_threshold = protection_levels[rx_radio][1]
+                intermod_threshold = protection_levels[rx_radio][2]
+
+            rx_band = self._cached_band_names(rx_radio, modeRx)[0]
+            max_power = -200
+            tx_bands = self._cached_band_names(tx_radio, modeTx)
+
+            for tx_band in tx_bands:
+                # Find the highest power level at the Rx input due to each Tx Radio.
+                # Can look at any Rx freq since susceptibility won't impact
+                # powerAtRx, but need to look at all tx channels since coupling
+                # can change over a transmitter's bandwidth
+                rx_freq = self._cached_active_frequencies(rx_radio, rx_band, modeRx)[0]
+                interaction = self._cached_interaction(pair_domain, rx_radio, rx_band, tx_radio, tx_band)
+                # check for valid interaction, this would catch any disabled radio pairs
+                if not interaction.is_valid():
                     continue
-
-                max_power = -200
-                tx_bands = self.get_band_names(tx_radio, modeTx)
-
-                for tx_band in tx_bands:
-                    # Find the highest power level at the Rx input due to each Tx Radio.
-                    # Can look at any Rx freq since susceptibility won't impact
-                    # powerAtRx, but need to look at all tx channels since coupling
-                    # can change over a transmitter's bandwidth
-                    rx_freq = self.get_active_frequencies(rx_radio, rx_band, modeRx)[0]
-                    domain.set_receiver(rx_radio, rx_band)
-                    domain.set_interferer(tx_radio, tx_band)
-                    interaction = self.run(domain)
-                    # check for valid interaction, this would catch any disabled radio pairs
-                    if not interaction.is_valid():
-                        continue
-                    domain.set_receiver(rx_radio, rx_band, rx_freq)
-                    tx_freqs = self.get_active_frequencies(tx_radio, tx_band, modeTx)
-
-                    power_list = []
-
-                    for tx_freq in tx_freqs:
-                        domain.set_interferer(tx_radio, tx_band, tx_freq)
-                        instance = interaction.get_instance(domain)
-                        if not instance.has_valid_values():
-                            # check for saturation somewhere in the chain
-                            # set power so its flagged as "damage threshold"
-                            if instance.get_result_warning() == "An amplifier was saturated.":
-                                max_power = 200
-                            else:
-                                # other warnings (e.g. no path from Tx to Rx,
-                                # no power received, error in configuration, etc)
-                                # should just be skipped
-                                continue
+                pair_domain.set_receiver(rx_radio, rx_band, rx_freq)
+                tx_freqs = self._cached_active_frequencies(tx_radio, tx_band, modeTx)
+
+                for tx_freq in tx_freqs:
+                    pair_domain.set_interferer(tx_radio, tx_band, tx_freq)
+                    instance = interaction.get_instance(pair_domain)
+                    if not instance.has_valid_values():
+                        # check for saturation somewhere in the chain
+                        # set power so its flagged as "damage threshold"
+                        if instance.get_result_warning() == "An amplifier was saturated.":
+                            max_power = 200
                         else:
-                            power = instance.get_value(mode_power)
-
-                        if power > damage_threshold:
-                            classification = "damage"
-                        elif power > overload_threshold:
-                            classification = "overload"
-                        elif power > intermod_threshold:
-                            classification = "intermodulation"
-                        else:
-                            classification = "desensitization"
-
-                        power_list.append(power)
-
-                        if use_filter:
-                            filtering = classification in filter_list
-                        else:
-                            filtering = True
-
-                        if power > max_power and filtering:
-                            max_power = power
+                            # other warnings (e.g. no path from Tx to Rx,
+                            # no power received, error in configuration, etc)
+                            # should just be skipped
+                            continue
+                    else:
+                        power = instance.get_value(mode_power)
+
+                    if power > damage_threshold:
+                        classification = "damage"
+                    elif power > overload_threshold:
+                        classification = "overload"
+                    elif power > intermod_threshold:
+                        classification = "intermodulation"
+                    else:
+                        classification = "desensitization"
 
-                # If the worst case for the band-pair is below the power thresholds, then
-                # there are no interference issues and no offset is required.
-                if max_power > -200:
-                    rx_powers.append(max_power)
-                    if max_power > damage_threshold:
-                        rx_colors.append("red")
-                    elif max_power > overload_threshold:
-                        rx_colors.append("orange")
-                    elif max_power > intermod_threshold:
-                        rx_colors.append("yellow")
+                    if use_filter:
+                        filtering = classification in filter_list
                     else:
-                        rx_colors.append("green")
+                        filtering = True
+
+                    if power > max_power and filtering:
+                        max_power = power
+
+            # If the worst case for the band-pair is below the power thresholds, then
+            # there are no interference issues and no offset is required.
+            if max_power > -200:
+                if max_power > damage_threshold:
+                    color = "red"
+                elif max_power > overload_threshold:
+                    color = "orange"
+                elif max_power > intermod_threshold:
+                    color = "yellow"
                 else:
-                    rx_powers.append("< -200")
-                    rx_colors.append("white")
+                    color = "green"
+                return max_power, color
+            return None, "white"
 
-            all_colors.append(rx_colors)
-            power_matrix.append(rx_powers)
-
-        return all_colors, power_matrix
+        return self._classify_radio_pairs(domain, _classify, max_workers, "< -200")
 
     def get_emi_category_filter_enabled(self, category: EmiCategoryFilter) -> bool:
         """Get whether the EMI category filter is enabled.
@@ -751,6 +807,7 @@ class Revision:
             raise RuntimeError("This function is only supported in AEDT version 2024 R1 and later.")
         engine = self.emit_project._emit_api.get_engine()
         engine.set_emi_category_filter_enabled(category, enabled)
+        self.clear_interaction_cache()
 
     def get_license_session(self):
         """Get a license session.
@@ -28,6 +28,11 @@ from enum import unique
 import math
 import warnings
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
 RAD2DEG = 180.0 / math.pi
 DEG2RAD = math.pi / 180
 HOUR2SEC = 3600.0
@@ -42,36 +47,50 @@ MILS2METER = 39370.078740157
 SpeedOfLight = 299792458.0
 
 
+def _log10(x):
+    """Compute the base 10 logarithm of a value or of a NumPy array."""
+    if np is not None and isinstance(x, np.ndarray):
+        return np.log10(x)
+    return math.log10(x)
+
+
+def _pow10(x):
+    """Compute 10 to the power of a value or of a NumPy array."""
+    if np is not None and isinstance(x, np.ndarray):
+        return np.power(10.0, x)
+    return math.pow(10, x)
+
+
 def db20(x, inverse=True):
     """Convert db20 to decimal and vice versa."""
     if inverse:
-        return 20 * math.log10(x)
+        return 20 * _log10(x)
     else:
-        return math.pow(10, x / 20.0)
+        return _pow10(x / 20.0)
 
 
 def db10(x, inverse=True):
     """Convert db10 to decimal and vice versa."""
     if inverse:
-        return 10 * math.log10(x)
+        return 10 * _log10(x)
     else:
-        return math.pow(10, x / 10.0)
+        return _pow10(x / 10.0)
 
 
 def dbw(x, inverse=True):
     """Convert W to decimal and vice versa."""
     if inverse:
-        return 10 * math.log10(x)
+        return 10 * _log10(x)
     else:
-        return math.pow(10, x / 10.0)
+        return _pow10(x / 10.0)
 
 
 def dbm(x, inverse=True):
     """Convert W to decimal and vice versa."""
     if inverse:
-        return 10 * math.log10(x) + 30
+        return 10 * _log10(x) + 30
     else:
-        return math.pow(10, x / 10.0) / 1000
+        return _pow10(x / 10.0) / 1000
 
 
 def fah2kel(val, inverse=True):
@@ -134,12 +153,7 @@ def unit_system(units):
     ``False`` when the units specified are not defined in AEDT units.
 
     """
-
-    for unit_type, unit_dict in AEDT_UNITS.items():
-        if units in unit_dict:
-            return unit_type
-
-    return False
+    return _UNIT_SYSTEMS.get(units, False)
 
 
 def _resolve_unit_system(unit_system_1, unit_system_2, operation):
@@ -170,13 +184,27 @@ def _resolve_unit_system(unit_system_1, unit_system_2, operation):
         return ""
 
 
+def _convert_values(values, input_scale, output_scale):
+    """Convert values using the scale factors or the conversion functions of the input and output units.
+
+    Values can be a scalar or a NumPy array.
+    """
+    if callable(input_scale):
+        values = input_scale(values, False)
+    else:
+        values = values * input_scale
+    if callable(output_scale):
+        return output_scale(values, True)
+    return values / output_scale
+
+
 def unit_converter(values, unit_system="Length", input_units="meter", output_units="mm"):
     """Convert unit in specified unit system.
 
     Parameters
     ----------
-    values : float, list
-        Values to convert.
+    values : float, list, :class:`numpy.ndarray`
+        Values to convert. Lists and arrays are converted without a loop on the values when NumPy is available.
     unit_system : str
         Unit system. Default is `"Length"`.
     input_units : str
@@ -186,47 +214,29 @@ def unit_converter(values, unit_system="Length", input_units="meter", output_uni
 
     Returns
     -------
-    float, list
+    float, list, :class:`numpy.ndarray`
         Converted value.
     """
     if unit_system in AEDT_UNITS:
-        if input_units not in AEDT_UNITS[unit_system]:
+        units = AEDT_UNITS[unit_system]
+        if input_units not in units:
             warnings.warn(f"Unknown units: '{input_units}'")
             return values
-        elif output_units not in AEDT_UNITS[unit_system]:
+        elif output_units not in units:
             warnings.warn(f"Unknown units: '{output_units}'")
             return values
-        else:
-            input_is_list = isinstance(values, list)
-            if not input_is_list:
-                values = [values]
-            converted_values = []
-            for value in values:
-                if unit_system == "Temperature":
-                    value = AEDT_UNITS[unit_system][input_units](value, False)
-                    value = AEDT_UNITS[unit_system][output_units](value, output_units != "kel")
-                elif not callable(AEDT_UNITS[unit_system][input_units]) and not callable(
-                    AEDT_UNITS[unit_system][output_units]
-                ):
-                    value = value * AEDT_UNITS[unit_system][input_units] / AEDT_UNITS[unit_system][output_units]
-                elif not callable(AEDT_UNITS[unit_system][input_units]) and callable(
-                    AEDT_UNITS[unit_system][output_units]
-                ):
-                    value = value * AEDT_UNITS[unit_system][input_units]
-                    value = AEDT_UNITS[unit_system][output_units](value, True)
-                elif callable(AEDT_UNITS[unit_system][input_units]) and not callable(
-                    AEDT_UNITS[unit_system][output_units]
-                ):
-                    value = AEDT_UNITS[unit_system][input_units](value, False) / AEDT_UNITS[unit_system][output_units]
-                else:
-                    value = AEDT_UNITS[unit_system][input_units](value, False)
-                    value = AEDT_UNITS[unit_system][output_units](value, True)
-
-                converted_values.append(value)
-            if input_is_list:
-                return converted_values
+        input_scale = units[input_units]
+        output_scale = units[output_units]
+        if not isinstance(values, list):
+            return _convert_values(values, input_scale, output_scale)
+        if np is not None:
+            try:
+                array_values = np.asarray(values, dtype=float)
+            except (TypeError, ValueError):
+                pass
             else:
-                return converted_values[0]
+                return _convert_values(array_values, input_scale, output_scale).tolist()
+        return [_convert_values(value, input_scale, output_scale) for value in values]
     warnings.warn("No system unit found")
     return values
 
@@ -244,16 +254,7 @@ def scale_units(scale_to_unit):
     float
         Return the scaling factor if any.
     """
-    sunit = 1.0
-    for val in list(AEDT_UNITS.values()):
-        for unit, scale_val in val.items():
-            if scale_to_unit.lower() == unit.lower():
-                sunit = scale_val
-                break
-        else:
-            continue
-        break
-    return sunit
+    return _SCALE_UNITS.get(scale_to_unit.lower(), 1.0)
 
 
 def validate_enum_class_value(cls, value):
@@ -573,6 +574,15 @@ UNIT_SYSTEM_OPERATIONS = {
     "Length_divide_Speed": "Time",
 }
 
+# Unit lookup tables built once from ``AEDT_UNITS``. The first unit system defining a unit wins.
+_UNIT_SYSTEMS = {}
+_SCALE_UNITS = {}
+for _unit_system, _unit_dict in AEDT_UNITS.items():
+    for _unit, _scale in _unit_dict.items():
+        _UNIT_SYSTEMS.setdefault(_unit, _unit_system)
+        _SCALE_UNITS.setdefault(_unit.lower(), _scale)
+del _unit_system, _unit_dict, _unit, _scale
+
 
 class INFINITE_SPHERE_TYPE(object):
     """INFINITE_SPHERE_TYPE Enumerator class."""
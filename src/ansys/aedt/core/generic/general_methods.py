@@ -1514,10 +1514,96 @@ def write_configuration_file(input_data, output_file):
 #     return sessions
 
 
+_AEDT_PROCESS_NAMES = ("ansysedt.exe", "ansysedt", "ansysedtsv.exe", "ansysedtsv")
+_SESSION_SCAN_TTL = 0.5
+_session_scan_cache = {"time": None, "processes": None, "com_ports": None}
+
+
+def _scan_aedt_processes():
+    """Read the process table once and return the AEDT processes.
+
+    The scan is cached for ``_SESSION_SCAN_TTL`` seconds so that callers polling in a loop
+    do not scan the whole process table on every iteration.
+
+    Returns
+    -------
+    list
+        List of tuples ``(pid, name, cmdline)``.
+    """
+    now = time.time()
+    cache_time = _session_scan_cache["time"]
+    if cache_time is not None and now - cache_time < _SESSION_SCAN_TTL:
+        return _session_scan_cache["processes"]
+    processes = []
+    for p in psutil.process_iter(["name"]):
+        try:
+            name = p.info["name"]
+            if name in _AEDT_PROCESS_NAMES:
+                processes.append((p.pid, name, p.cmdline()))
+        except psutil.NoSuchProcess as e:  # pragma: no cover
+            pyaedt_logger.debug(f"The process exited and cannot be an active session: {e}")
+        except psutil.AccessDenied:  # pragma: no cover
+            pass
+    _session_scan_cache["time"] = time.time()
+    _session_scan_cache["processes"] = processes
+    _session_scan_cache["com_ports"] = None
+    return processes
+
+
+def _scan_com_ports():
+    """Read the connection table once and map each AEDT process to its listening port.
+
+    Returns
+    -------
+    dict
+        Dictionary of ``{pid: port}`` for ports between 50051 and 50199.
+    """
+    if _session_scan_cache["com_ports"] is not None:
+        return _session_scan_cache["com_ports"]
+    pids = {pid for pid, _, _ in _session_scan_cache["processes"] or []}
+    com_ports = {}
+    try:
+        connections = psutil.net_connections(kind="tcp")
+    except (psutil.AccessDenied, OSError) as e:  # pragma: no cover
+        pyaedt_logger.debug(f"Connections of the AEDT sessions cannot be read: {e}")
+        connections = []
+    for i in connections:
+        if i.pid in pids and i.pid not in com_ports and i.laddr and 50050 < i.laddr.port < 50200:
+            com_ports[i.pid] = i.laddr.port
+    _session_scan_cache["com_ports"] = com_ports
+    return com_ports
+
+
+def clear_active_sessions_cache():
+    """Discard the cached scan of the AEDT processes.
+
+    The next call to :func:`active_sessions` reads the process table again.
+    """
+    _session_scan_cache["time"] = None
+    _session_scan_cache["processes"] = None
+    _session_scan_cache["com_ports"] = None
+
+
+def _cached_session_ports():
+    """Ports of the AEDT sessions found by the last scan, without scanning again."""
+    ports = set()
+    for _, _, cmd in _session_scan_cache["processes"] or []:
+        if "-grpcsrv" in cmd:
+            try:
+                ports.add(int(cmd[cmd.index("-grpcsrv") + 1]))
+            except (IndexError, ValueError):
+                ports.add(50051)
+    ports.update((_session_scan_cache["com_ports"] or {}).values())
+    return ports
+
+
 @pyaedt_function_handler()
 def active_sessions(version=None, student_version=False, non_graphical=False):
     """Get information for the active AEDT sessions.
 
+    The process table and, when COM sessions are found, the connection table are read
+    at most once per call. Results are reused for a short time across calls.
+
     Parameters
     ----------
     version : str, optional
@@ -1542,31 +1628,30 @@ def active_sessions(version=None, student_version=False, non_graphical=False):
         version = version[-4:].replace(".", "")
     if version and version < "221":
         version = version[:2] + "." + version[2]
-    for p in psutil.process_iter():
+    com_pids = []
+    for pid, name, cmd in _scan_aedt_processes():
         try:
-            if p.name() in keys:
-                cmd = p.cmdline()
+            if name in keys:
                 if non_graphical and "-ng" in cmd or not non_graphical:
                     if not version or (version and version in cmd[0]):
                         if "-grpcsrv" in cmd:
-                            if not version or (version and version in cmd[0]):
-                                try:
-                                    return_dict[p.pid] = int(cmd[cmd.index("-grpcsrv") + 1])
-                                except (IndexError, ValueError):
-                                    # default desktop grpc port.
-                                    return_dict[p.pid] = 50051
+                            try:
+                                return_dict[pid] = int(cmd[cmd.index("-grpcsrv") + 1])
+                            except (IndexError, ValueError):
+                                # default desktop grpc port.
+                                return_dict[pid] = 50051
                         else:
-                            return_dict[p.pid] = -1
-                            for i in psutil.net_connections():
-                                if i.pid == p.pid and (i.laddr.port > 50050 and i.laddr.port < 50200):
-                                    return_dict[p.pid] = i.laddr.port
-                                    break
-        except psutil.NoSuchProcess as e:  # pragma: no cover
-            pyaedt_logger.debug(f"The process exited and cannot be an active session: {e}")
+                            return_dict[pid] = -1
+                            com_pids.append(pid)
         except Exception as e:  # pragma: no cover
             pyaedt_logger.error(
                 f"A(n) {type(e)} error occurred while retrieving information for the active AEDT sessions: {e}"
             )
+    if com_pids:
+        com_ports = _scan_com_ports()
+        for pid in com_pids:
+            if pid in com_ports:
+                return_dict[pid] = com_ports[pid]
     return return_dict
 
 
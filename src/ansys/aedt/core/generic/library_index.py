@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2024 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Persistent index of the files of AEDT libraries."""
+
+import fnmatch
+import json
+import os
+import tempfile
+
+from ansys.aedt.core.aedt_logger import pyaedt_logger as logger
+from ansys.aedt.core.generic.settings import settings
+
+
+class LibraryIndex(object):
+    """Manages a persistent index of the files of AEDT libraries.
+
+    Each library file matching the pattern is parsed once by the parser function. Results are saved to a JSON
+    file in the ``settings.library_index_folder`` folder and reused in later sessions. A library is walked
+    again only when the modification time of one of its folders changes, and only new or modified files
+    are parsed again.
+
+    Parameters
+    ----------
+    name : str
+        Name of the index. It is used as the name of the JSON file.
+    pattern : str
+        Unix shell-style wildcard of the library files. For example, ``"*.amat"``.
+    parser : callable
+        Function taking the full path of a library file and returning JSON serializable data.
+    version : int, optional
+        Version of the parser. Indexes saved with another version are rebuilt. The default is ``1``.
+    check_files : bool, optional
+        Whether to also check the modification time of each indexed file, so that files modified in place
+        are parsed again. The default is ``False``, in which case only folders are checked.
+    """
+
+    def __init__(self, name, pattern, parser, version=1, check_files=False):
+        self.name = name
+        self.pattern = pattern
+        self.version = version
+        self.check_files = check_files
+        self._parser = parser
+        self._libraries = None
+        self._index_file = None
+
+    @property
+    def index_file(self):
+        """Full path of the JSON index file.
+
+        Returns
+        -------
+        str
+        """
+        folder = settings.library_index_folder or os.path.join(tempfile.gettempdir(), "pyaedt_library_index")
+        return os.path.join(folder, self.name + ".json")
+
+    def _load(self):
+        index_file = self.index_file
+        if self._libraries is not None and self._index_file == index_file:
+            return self._libraries
+        self._libraries = {}
+        self._index_file = index_file
+        if os.path.exists(index_file):
+            try:
+                with open(index_file, "r") as f:
+                    data = json.load(f)
+                if data.get("version") == self.version:
+                    self._libraries = data.get("libraries", {})
+            except (OSError, ValueError):
+                logger.debug(f"Library index {index_file} cannot be read. It is rebuilt.")
+        return self._libraries
+
+    def _save(self):
+        index_file = self.index_file
+        temp_file = f"{index_file}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(index_file), exist_ok=True)
+            with open(temp_file, "w") as f:
+                json.dump({"version": self.version, "libraries": self._libraries}, f)
+            os.replace(temp_file, index_file)
+        except OSError:
+            logger.debug(f"Library index {index_file} cannot be written.")
+
+    def _is_up_to_date(self, library_path, library):
+        if not library["folders"]:
+            return not os.path.isdir(library_path)
+        try:
+            for folder, mtime in library["folders"].items():
+                if os.stat(folder).st_mtime != mtime:
+                    return False
+            if self.check_files:
+                for file_path, file_entry in library["files"].items():
+                    if os.stat(file_path).st_mtime != file_entry["mtime"]:
+                        return False
+        except OSError:
+            return False
+        return True
+
+    def _build(self, library_path, library):
+        old_files = library["files"] if library else {}
+        folders = {}
+        files = {}
+        for dirpath, _, filenames in os.walk(library_path):
+            folders[dirpath] = os.stat(dirpath).st_mtime
+            for filename in filenames:
+                if not fnmatch.fnmatch(filename, self.pattern):
+                    continue
+                file_path = os.path.join(dirpath, filename)
+                mtime = os.stat(file_path).st_mtime
+                if file_path in old_files and old_files[file_path]["mtime"] == mtime:
+                    files[file_path] = old_files[file_path]
+                else:
+                    files[file_path] = {"mtime": mtime, "data": self._parser(file_path)}
+        return {"folders": folders, "files": files}
+
+    def get(self, library_path):
+        """Get the parsed data of all the files of a library.
+
+        Parameters
+        ----------
+        library_path : str
+            Full path of the library folder.
+
+        Returns
+        -------
+        dict
+            Dictionary with the full path of the library files as keys and the parsed data as values.
+        """
+        library_path = os.path.normpath(library_path)
+        libraries = self._load()
+        library = libraries.get(library_path)
+        if library is None or not self._is_up_to_date(library_path, library):
+            library = self._build(library_path, library)
+            libraries[library_path] = library
+            self._save()
+        return {file_path: file_entry["data"] for file_path, file_entry in library["files"].items()}
+
+    def clear(self):
+        """Remove the saved index so that all libraries are parsed again."""
+        self._libraries = {}
+        if os.path.exists(self.index_file):
+            os.remove(self.index_file)
@@ -72,6 +72,49 @@ def load_keyword_in_aedt_file(filename, keyword, design_name=None):
     return _load_keyword_in_aedt_file(filename, keyword, design_name)
 
 
+def load_keyword_in_aedt_file_at_offset(filename, keyword, offset=0):
+    """Load a top level keyword starting at a given byte offset of an AEDT file and return the dictionary.
+
+    Only the lines between the ``$begin`` and the matching ``$end`` lines of the keyword are read,
+    which avoids reading and decoding the entire file. Nested blocks with the same name are kept.
+
+    Parameters
+    ----------
+    filename : str
+        AEDT filename with path.
+    keyword : str
+        Keyword to load.
+    offset : int, optional
+        Byte offset of the ``$begin`` line of the keyword. The default is ``0``.
+
+    Returns
+    -------
+    dict
+        Dictionary containing the decoded keyword.
+
+    """
+    begin_key = f"$begin '{keyword}'".encode("utf-8")
+    end_key = f"$end '{keyword}'".encode("utf-8")
+    raw_lines = []
+    depth = 0
+    with open_file(filename, "rb") as aedt_fh:
+        aedt_fh.seek(offset)
+        for raw_line in aedt_fh:
+            raw_line = raw_line.rstrip(b"\r\n")
+            raw_lines.append(raw_line)
+            stripped_line = raw_line.lstrip(b" \t")
+            if stripped_line == begin_key:
+                depth += 1
+            elif stripped_line == end_key:
+                depth -= 1
+                if depth <= 0:
+                    break
+    _set_aedt_lines(raw_lines)
+    main_dict = {}
+    _walk_through_structure(keyword, main_dict)
+    return main_dict
+
+
 # --------------------------------------------------------------------
 # internals
 
@@ -466,14 +509,26 @@ def _read_aedt_file(filename):
     Returns
     -------
 
+    """
+    # read the AEDT file
+    with open_file(filename, "rb") as aedt_fh:
+        raw_lines = aedt_fh.read().splitlines()
+    _set_aedt_lines(raw_lines)
+
+
+def _set_aedt_lines(raw_lines):
+    """Decode the raw lines of an AEDT file and put the ascii lines in the parser buffer.
+
+    Parameters
+    ----------
+    raw_lines : list
+        List of bytes lines.
+
     """
     global _all_lines
     global _len_all_lines
     global _count
 
-    # read the AEDT file
-    with open_file(filename, "rb") as aedt_fh:
-        raw_lines = aedt_fh.read().splitlines()
     ascii_lines = []
     for raw_line in raw_lines:
         try:
@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2024 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Reader of HSpice netlists."""
+
+import re
+
+from ansys.aedt.core.generic.data_handlers import from_rkm_to_aedt
+from ansys.aedt.core.generic.general_methods import open_file
+
+
+def netlist_value(value):
+    """Convert a netlist value to a value accepted by AEDT.
+
+    Parameters
+    ----------
+    value : str
+        Netlist value. The text before an ``=`` character and curly brackets are removed.
+
+    Returns
+    -------
+    str
+        Value in AEDT format.
+    """
+    value = value[value.find("=") + 1 :].strip().replace("{", "").replace("}", "").replace(",", ".")
+    value = value.replace("µ", "u")
+    try:
+        float(value)
+        return value
+    except Exception:
+        return from_rkm_to_aedt(value)
+
+
+def _passive_value(field):
+    if "{" in field[0]:
+        return field.strip()[1:-1]
+    elif "/" in field and '"' not in field[0] and "'" not in field[0]:
+        return netlist_value(field.split("/")[0])
+    return netlist_value(field)
+
+
+def _pulse_values(line):
+    values = line[line.index("PULSE") + 6 : line.index(")") - 1].split(" ")
+    return [i.replace("{", "").replace("}", "") for i in values]
+
+
+class NetlistElement(object):
+    """Element of an HSpice netlist.
+
+    Parameters
+    ----------
+    kind : str
+        Kind of the element. Options are ``"resistor"``, ``"inductor"``, ``"capacitor"``, ``"npn"``,
+        ``"diode"``, ``"voltage_dc"``, ``"voltage_pulse"``, ``"current_dc"``, ``"current_pulse"``,
+        ``"coupling"`` and ``"subcircuit"``.
+    name : str
+        Instance name.
+    nodes : list
+        Fields following the instance name. The first fields are the nodes connected to the pins.
+    value : str or list, optional
+        Value of the element. The default is ``None``.
+    model : str, optional
+        Model of a subcircuit. The default is ``None``.
+    pins : list, optional
+        Pin names of a subcircuit. The default is ``None``.
+    parameters : list, optional
+        Parameter names of a subcircuit. The default is ``None``.
+    values : list, optional
+        Parameter values of a subcircuit. The default is ``None``.
+    """
+
+    def __init__(self, kind, name, nodes, value=None, model=None, pins=None, parameters=None, values=None):
+        self.kind = kind
+        self.name = name
+        self.nodes = nodes
+        self.value = value
+        self.model = model
+        self.pins = pins
+        self.parameters = parameters
+        self.values = values
+
+    def __repr__(self):
+        return f"NetlistElement({self.kind}, {self.name})"
+
+
+class NetlistReader(object):
+    """Reads an HSpice netlist into a table of elements.
+
+    The file is read once. Parameters, model lines and elements are stored in the
+    ``parameters``, ``models`` and ``elements`` attributes, while lines that cannot
+    be imported are stored in ``skipped`` with the reason.
+
+    Parameters
+    ----------
+    input_file : str
+        Full path to the HSpice file.
+
+    Examples
+    --------
+    >>> from ansys.aedt.core.generic.netlist_reader import NetlistReader
+    >>> netlist = NetlistReader("netlist.cir")
+    >>> netlist.parse_netlist_file()
+    >>> resistors = [e for e in netlist.elements if e.kind == "resistor"]
+    """
+
+    def __init__(self, input_file):
+        self._input_file = input_file
+        self.parameters = {}
+        self.models = []
+        self.elements = []
+        self.skipped = []
+
+    def parse_netlist_file(self):
+        """Parse the netlist file.
+
+        Returns
+        -------
+        :class:`ansys.aedt.core.generic.netlist_reader.NetlistReader`
+            Netlist reader with the parsed data.
+        """
+        self.parameters = {}
+        self.models = []
+        self.elements = []
+        self.skipped = []
+        with open_file(self._input_file, "rb") as f:
+            for line in f:
+                line = line.decode("utf-8")
+                if ".param" in line[:7].lower():
+                    try:
+                        param_re = re.split("[ =]", " ".join(line[7:].split()))
+                        self.parameters[param_re[0]] = param_re[1]
+                    except IndexError:
+                        self.skipped.append((line, f"Failed to parse line '{line}'."))
+                elif ".model" in line[:7].lower() or ".lib" in line[:4].lower():
+                    self.models.append(line)
+                else:
+                    try:
+                        element = self._parse_element(line)
+                    except (IndexError, ValueError):
+                        element = None
+                        self.skipped.append((line, f"{line} could not be imported"))
+                    if element:
+                        self.elements.append(element)
+        return self
+
+    def _parse_element(self, line):
+        fields = line.split(" ")
+        name = fields[0].replace(".", "")
+        prefix = fields[0][0]
+        if prefix == "R":
+            return NetlistElement("resistor", name, fields[1:], _passive_value(fields[3]))
+        elif prefix == "L":
+            if len(fields) > 4 and "=" not in fields[4]:
+                try:
+                    float(fields[4])
+                except Exception:
+                    self.skipped.append((line, f"Component {name} was not imported. Check it and manually import"))
+                    return
+            return NetlistElement("inductor", name, fields[1:], _passive_value(fields[3]))
+        elif prefix == "C":
+            return NetlistElement("capacitor", name, fields[1:], _passive_value(fields[3]))
+        elif prefix == "Q" and len(fields) == 4:
+            return NetlistElement("npn", fields[0], fields[1:], fields[3].strip())
+        elif prefix in ["Q", "U", "J"]:
+            numpins = len(fields) - 1 if prefix == "J" else len(fields) - 2
+            pins = ["Pin" + str(i) for i in range(1, numpins + 1)]
+            model = fields[len(fields) - 1][:-1].strip()
+            if "=" in model:
+                parameters = [model[: model.find("=") - 1]]
+                values = [model[model.find("=") + 1 :]]
+            else:
+                parameters = ["MOD"]
+                values = [model]
+            return NetlistElement("subcircuit", fields[0], fields[1:], None, model, pins, parameters, values)
+        elif prefix == "D":
+            return NetlistElement("diode", name, fields[1:], netlist_value(fields[3]))
+        elif prefix in ["V", "I"]:
+            source = "voltage" if prefix == "V" else "current"
+            if "PULSE" not in line:
+                return NetlistElement(source + "_dc", name, fields[1:], netlist_value(fields[3]))
+            nodes = fields[1:]
+            if prefix == "V":
+                nodes[0], nodes[1] = nodes[1], nodes[0]
+            return NetlistElement(source + "_pulse", name, nodes, _pulse_values(line))
+        elif prefix.lower() == "k":
+            return NetlistElement("coupling", name, fields[1:], netlist_value(fields[3]))
+        elif not any(word in line.lower() for word in [".param", ".model", ".lib"]):
+            self.skipped.append((line, f"{line} could not be imported"))
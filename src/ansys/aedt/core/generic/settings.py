@@ -101,6 +101,7 @@ ALLOWED_GENERAL_SETTINGS = [
     "pyaedt_server_path",
     "remote_rpc_session_temp_folder",
     "block_figure_plot",
+    "library_index_folder",
 ]
 ALLOWED_AEDT_ENV_VAR_SETTINGS = [
     "ANSYSEM_FEATURE_F335896_MECHANICAL_STRUCTURAL_SOLN_TYPE_ENABLE",
@@ -212,6 +213,7 @@ class Settings(object):
         self.__time_tick = time.time()
         self.__pyaedt_server_path = ""
         self.__block_figure_plot = False
+        self.__library_index_folder: str = ""
 
         # Load local settings if YAML configuration file exists.
         pyaedt_settings_path = os.environ.get("PYAEDT_LOCAL_SETTINGS_PATH", "")
@@ -754,6 +756,18 @@ class Settings(object):
         os.environ["PYAEDT_SERVER_AEDT_PATH"] = str(val)
         self.__pyaedt_server_path = os.environ["PYAEDT_SERVER_AEDT_PATH"]
 
+    @property
+    def library_index_folder(self):
+        """Folder where the persistent indexes of the AEDT material and component libraries are saved.
+
+        The default is ``""``, in which case the indexes are saved in the system temporary folder.
+        """
+        return self.__library_index_folder
+
+    @library_index_folder.setter
+    def library_index_folder(self, val):
+        self.__library_index_folder = val
+
     def load_yaml_configuration(self, path: str, raise_on_wrong_key: bool = False):
         """Update default settings from a YAML configuration file."""
         import yaml
@@ -29,10 +29,14 @@ from __future__ import absolute_import  # noreorder
 import csv
 import os
 import re
+import time
 import warnings
 
 import ansys.aedt.core
 from ansys.aedt.core.application.analysis_icepak import FieldAnalysisIcepak
+from ansys.aedt.core.application.variables import decompose_variable_value
+from ansys.aedt.core.generic.constants import AEDT_UNITS
+from ansys.aedt.core.generic.constants import unit_converter
 from ansys.aedt.core.generic.data_handlers import _arg2dict
 from ansys.aedt.core.generic.data_handlers import _dict2arg
 from ansys.aedt.core.generic.data_handlers import random_string
@@ -405,7 +409,9 @@ class Icepak(FieldAnalysisIcepak):
         return True
 
     @pyaedt_function_handler()
-    def create_source_blocks_from_list(self, list_powers, assign_material=True, default_material="Ceramic_material"):
+    def create_source_blocks_from_list(
+        self, list_powers, assign_material=True, default_material="Ceramic_material", group_by_power=False
+    ):
         """Assign to a box in Icepak the sources that come from the CSV file.
 
         Assignment is made by name.
@@ -421,6 +427,9 @@ class Icepak(FieldAnalysisIcepak):
         default_material : str, optional
             Default material to assign when ``assign_material=True``.
             The default is ``"Ceramic_material"``.
+        group_by_power : bool, optional
+            Whether to assign objects sharing the same input power to a single block boundary.
+            The default is ``False``. For more information, see the ``create_source_blocks()`` method.
 
         Returns
         -------
@@ -445,25 +454,142 @@ class Icepak(FieldAnalysisIcepak):
         >>> blocks[3].props
         {'Objects': ['BlockBox2'], 'Block Type': 'Solid', 'Use External Conditions': False, 'Total Power': '4W'}
         """
-        oObjects = self.modeler.solid_names
+        if not list_powers:
+            return []
+        num_power = len(list_powers[0]) - 1
+        solids = set(self.modeler.solid_names)
+        rows = [row for row in list_powers if row[0] in solids]
+        assignment = {}
+        if num_power > 1:
+            power_variables = {"P_index": 0}
+            for row in rows:
+                power_variables[row[0] + "_P"] = str(row[1:])
+                assignment[row[0]] = row[0] + "_P[P_index]"
+            self.variable_manager.set_variables(power_variables)
+        else:
+            for row in rows:
+                assignment[row[0]] = str(row[1]) + "W"
+        report = self.create_source_blocks(
+            assignment, assign_material=assign_material, material_name=default_material, group_by_power=group_by_power
+        )
+        boundaries = {}
+        for bound in report["boundaries"]:
+            boundaries[bound.props["Objects"][0]] = bound
         listmcad = []
-        num_power = None
-        for row in list_powers:
-            if not num_power:
-                num_power = len(row) - 1
-                self["P_index"] = 0
-            if row[0] in oObjects:
-                listmcad.append(row)
-                if num_power > 1:
-                    self[row[0] + "_P"] = str(row[1:])
-                    out = self.create_source_block(row[0], row[0] + "_P[P_index]", assign_material, default_material)
+        for row in rows:
+            listmcad.append(row)
+            if row[0] in boundaries:
+                listmcad.append(boundaries[row[0]])
+        return listmcad
 
-                else:
-                    out = self.create_source_block(row[0], str(row[1]) + "W", assign_material, default_material)
-                if out:
-                    listmcad.append(out)
+    @pyaedt_function_handler()
+    def create_source_blocks(
+        self, assignment, assign_material=False, material_name="Ceramic_material", group_by_power=False
+    ):
+        """Create source blocks on many objects in a single pass.
 
-        return listmcad
+        The object lookup is built once, materials are assigned with one call, and
+        a single summary message is logged instead of one message per block.
+
+        Parameters
+        ----------
+        assignment : dict
+            Dictionary with object names as keys and input powers as values.
+            Numeric powers are in watts. String powers are used as they are,
+            for example ``"2W"`` or ``"Obj1_P[P_index]"``.
+        assign_material : bool, optional
+            Whether to assign a material to the objects. The default is ``False``.
+        material_name : str, optional
+            Material to assign if ``assign_material=True``. The default is ``"Ceramic_material"``.
+        group_by_power : bool, optional
+            Whether to assign objects sharing the same input power and the same volume to a single
+            block boundary. The ``Total Power`` of the shared boundary is the sum of the powers of
+            its objects. Because AEDT distributes it over their combined volume, only objects of
+            identical volume are grouped, so that each object still dissipates its own power.
+            The default is ``False``, in which case one block boundary is created per object.
+
+        Returns
+        -------
+        dict
+            Dictionary with the ``"boundaries"`` created, the ``"applied"`` and ``"skipped"``
+            object names, the ``"total_power"`` applied in watts, and the ``"elapsed_time"`` in seconds.
+            Powers defined by variables are not included in ``"total_power"``.
+
+        References
+        ----------
+        >>> oModule.AssignBlockBoundary
+
+        Examples
+        --------
+        >>> box1 = icepak.modeler.create_box([1, 1, 1],[3, 3, 3],"BlockBox1","copper")
+        >>> box2 = icepak.modeler.create_box([2, 2, 2],[4, 4, 4],"BlockBox2","copper")
+        >>> report = icepak.create_source_blocks({"BlockBox1": 2, "BlockBox2": 4})
+        >>> report["total_power"]
+        6.0
+        """
+        start = time.time()
+        solids = set(self.modeler.solid_names)
+        power_units = AEDT_UNITS["Power"]
+        groups = {}
+        skipped = []
+        for object_name, power in assignment.items():
+            if object_name not in solids:
+                skipped.append(object_name)
+                continue
+            if isinstance(power, (int, float)):
+                power = f"{power}W"
+            key = object_name
+            if group_by_power:
+                value, units = decompose_variable_value(power)
+                if isinstance(value, (int, float)) and (units in power_units or not units):
+                    value = f"{unit_converter(value, 'Power', units or 'W', 'W'):.9g}W"
+                else:
+                    value = power
+                key = (value, f"{self.modeler[object_name].volume:.9g}")
+            groups.setdefault(key, (power, []))[1].append(object_name)
+
+        if assign_material and groups:
+            self.assign_material([name for _, names in groups.values() for name in names], material_name)
+
+        boundaries = []
+        applied = []
+        total_power = 0.0
+        for power, object_names in groups.values():
+            value, units = decompose_variable_value(power)
+            watts = None
+            if isinstance(value, (int, float)) and (units in power_units or not units):
+                watts = unit_converter(value, "Power", units or "W", "W") * len(object_names)
+            if len(object_names) > 1:
+                power = f"{watts:.9g}W" if watts is not None else f"{len(object_names)}*({power})"
+            props = {
+                "Objects": object_names,
+                "Block Type": "Solid",
+                "Use External Conditions": False,
+                "Total Power": power,
+            }
+            bound = BoundaryObject(self, object_names[0], props, "Block")
+            if not bound.create():
+                skipped.extend(object_names)
+                continue
+            self._boundaries[bound.name] = bound
+            boundaries.append(bound)
+            applied.extend(object_names)
+            if watts is not None:
+                total_power += watts
+        elapsed_time = time.time() - start
+        self.logger.info(
+            f"{len(boundaries)} blocks created on {len(applied)} objects with total power {total_power}W "
+            f"in {elapsed_time:.2f} seconds."
+        )
+        if skipped:
+            self.logger.warning(f"{len(skipped)} objects skipped: {', '.join(skipped)}.")
+        return {
+            "boundaries": boundaries,
+            "applied": applied,
+            "skipped": skipped,
+            "total_power": total_power,
+            "elapsed_time": elapsed_time,
+        }
 
     @pyaedt_function_handler()
     def create_source_block(
@@ -1026,13 +1152,16 @@ class Icepak(FieldAnalysisIcepak):
         )
 
     @pyaedt_function_handler()
-    def assign_block_from_sherlock_file(self, csv_name):
+    def assign_block_from_sherlock_file(self, csv_name, group_by_power=False):
         """Assign block power to components based on a CSV file from Sherlock.
 
         Parameters
         ----------
         csv_name : str
             Name of the CSV file.
+        group_by_power : bool, optional
+            Whether to assign components sharing the same applied power to a single block boundary.
+            The default is ``False``. For more information, see the ``create_source_blocks()`` method.
 
         Returns
         -------
@@ -1047,42 +1176,21 @@ class Icepak(FieldAnalysisIcepak):
             csv_input = csv.reader(csvfile)
             component_header = next(csv_input)
             data = list(csv_input)
-            k = 0
-            component_data = {}
-            for el in component_header:
-                component_data[el] = [i[k] for i in data]
-                k += 1
-        total_power = 0
-        i = 0
-        all_objects = self.modeler.object_names
-        for power in component_data["Applied Power (W)"]:
+        ref_des = component_header.index("Ref Des")
+        applied_power = component_header.index("Applied Power (W)")
+        all_objects = set(self.modeler.solid_names)
+        assignment = {}
+        for row in data:
             try:
-                float(power)
-                if "COMP_" + component_data["Ref Des"][i] in all_objects:
-                    status = self.create_source_block(
-                        "COMP_" + component_data["Ref Des"][i], str(power) + "W", assign_material=False
-                    )
-                    if not status:
-                        self.logger.warning(
-                            "Warning. Block %s skipped with %sW power.", component_data["Ref Des"][i], power
-                        )
-                    else:
-                        total_power += float(power)
-                elif component_data["Ref Des"][i] in all_objects:
-                    status = self.create_source_block(
-                        component_data["Ref Des"][i], str(power) + "W", assign_material=False
-                    )
-                    if not status:
-                        self.logger.warning(
-                            "Warning. Block %s skipped with %sW power.", component_data["Ref Des"][i], power
-                        )
-                    else:
-                        total_power += float(power)
-            except Exception:
-                pass
-            i += 1
-        self.logger.info("Blocks inserted with total power %sW.", total_power)
-        return total_power
+                power = float(row[applied_power])
+            except (IndexError, ValueError):
+                continue
+            object_name = "COMP_" + row[ref_des]
+            if object_name not in all_objects:
+                object_name = row[ref_des]
+            assignment.setdefault(object_name, power)
+        report = self.create_source_blocks(assignment, assign_material=False, group_by_power=group_by_power)
+        return report["total_power"]
 
     @pyaedt_function_handler()
     def assign_priority_on_intersections(self, component_prefix="COMP_"):
@@ -1107,12 +1215,10 @@ class Icepak(FieldAnalysisIcepak):
         temp_log = os.path.join(self.working_directory, "validation.log")
         validate = self.odesign.ValidateDesign(temp_log)
         self.save_project()
-        i = 2
         if validate == 0:
-            priority_list = []
+            priorities = {}
             with open_file(temp_log, "r") as f:
-                lines = f.readlines()
-                for line in lines:
+                for line in f:
                     if "[error]" in line and component_prefix in line and "intersect" in line:
                         id1 = line.find(component_prefix)
                         if self.aedt_version_id > "2023.2":
@@ -1120,12 +1226,11 @@ class Icepak(FieldAnalysisIcepak):
                         else:
                             id2 = line[id1:].find('"')
                         name = line[id1 : id1 + id2]
-                        if name not in priority_list:
-                            priority_list.append(name)
-            self.logger.info(f"{len(priority_list)} Intersections have been found. Applying Priorities")
-            for objname in priority_list:
-                self.mesh.add_priority(1, [objname], priority=i)
-                i += 1
+                        if name not in priorities:
+                            priorities[name] = len(priorities) + 2
+            self.logger.info(f"{len(priorities)} Intersections have been found. Applying Priorities")
+            if priorities:
+                self.mesh.assign_priority_map(priorities)
         return True
 
     @pyaedt_function_handler()
@@ -1364,7 +1364,19 @@ class HistoryProps(dict):
 
 
 class BinaryTreeNode:
-    """Manages an object's history structure."""
+    """Manages an object's history structure.
+
+    Children are resolved only when first accessed. Properties of the nodes of an object history
+    are cached until :meth:`update_property` or :meth:`refresh` is called.
+    """
+
+    _tree_child_object = None
+    _tree_root_object = None
+    _tree_child_getter = None
+    _tree_segments_node = None
+    _cache_props = False
+    _children_loaded = False
+    _first_level_pending = False
 
     def __init__(self, node, child_object, first_level=False, get_child_obj_arg=None, root_name=None):
         self._props = None
@@ -1373,23 +1385,70 @@ class BinaryTreeNode:
         self._saved_root_name = node if first_level else root_name
         self._get_child_obj_arg = get_child_obj_arg
         self._node = node
+        self._tree_child_getter = None
+        self._tree_segments_node = None
+        self._cache_props = first_level
         self.child_object = child_object
+        self._tree_root_object = child_object if first_level else None
         self.auto_update = True
         self._children = {}
+        self._children_loaded = False
         self.__first_level = first_level
-        if first_level:
+        self._first_level_pending = first_level
+
+    @classmethod
+    def _lazy_child(cls, node, parent_object, root_name, cache_props=False):
+        # Defer ``GetChildObject`` until the child is actually used.
+        child = cls(node, None, root_name=root_name)
+        child._tree_child_getter = lambda: parent_object.GetChildObject(node)
+        child._cache_props = cache_props
+        return child
+
+    @property
+    def child_object(self):
+        """AEDT child object of the node."""
+        if self._first_level_pending:
+            self._update_children()
+        if self._tree_child_object is None and self._tree_child_getter is not None:
+            getter, self._tree_child_getter = self._tree_child_getter, None
+            try:
+                self._tree_child_object = getter()
+            except Exception:  # pragma: no cover
+                self._tree_child_object = None
+        return self._tree_child_object
+
+    @child_object.setter
+    def child_object(self, value):
+        self._tree_child_object = value
+
+    @property
+    def segments(self):
+        """Segments of the first-level polyline history node.
+
+        Returns
+        -------
+        dict or None
+            Dictionary of segment nodes for polylines, ``None`` otherwise.
+        """
+        if self._first_level_pending:
             self._update_children()
+        if self._tree_segments_node is None:
+            return None
+        return self._tree_segments_node.children
 
     def _update_children(self):
+        self._first_level_pending = False
+        self._children_loaded = True
         self._children = {}
         name = None
+        parent_object = self._tree_root_object if self.__first_level else self.child_object
         try:
             if self._get_child_obj_arg is None:
-                child_names = [i for i in list(self.child_object.GetChildNames()) if not i.startswith("CachedBody")]
+                child_names = [i for i in list(parent_object.GetChildNames()) if not i.startswith("CachedBody")]
             else:
                 child_names = [
                     i
-                    for i in list(self.child_object.GetChildNames(self._get_child_obj_arg))
+                    for i in list(parent_object.GetChildNames(self._get_child_obj_arg))
                     if not i.startswith("CachedBody")
                 ]
         except Exception:  # pragma: no cover
@@ -1400,31 +1459,55 @@ class BinaryTreeNode:
             if i == "OperandPart_" + self._saved_root_name or i == "OperandPart_" + self._saved_root_name.split("_")[0]:
                 continue
             elif not i.startswith("OperandPart_"):
-                try:
-                    self._children[i] = BinaryTreeNode(
-                        i, self.child_object.GetChildObject(i), root_name=self._saved_root_name
-                    )
-                except Exception:  # nosec
-                    pass
+                self._children[i] = BinaryTreeNode._lazy_child(
+                    i, parent_object, self._saved_root_name, self._cache_props
+                )
             else:
-                names = self.child_object.GetChildObject(i).GetChildNames()
-                for name in names:
-                    self._children[name] = BinaryTreeNode(
-                        name, self.child_object.GetChildObject(i).GetChildObject(name), root_name=self._saved_root_name
+                operand_object = parent_object.GetChildObject(i)
+                for name in operand_object.GetChildNames():
+                    self._children[name] = BinaryTreeNode._lazy_child(
+                        name, operand_object, self._saved_root_name, self._cache_props
                     )
         if name and self.__first_level:
-            self.child_object = self._children[name].child_object
-            self._props = self._children[name].properties
+            first_child = self._children.pop(name)
+            self.child_object = first_child.child_object
+            self._props = None
             if name == "CreatePolyline:1":
-                self.segments = self._children[name].children
-            del self._children[name]
+                self._tree_segments_node = first_child
 
     @property
     def children(self):
-        if not self._children:
+        """Child nodes of the history tree.
+
+        Returns
+        -------
+        dict
+            Dictionary of child nodes keyed by name.
+        """
+        if self._first_level_pending or not self._children_loaded:
             self._update_children()
         return self._children
 
+    def refresh(self):
+        """Discard the cached properties and children of the node.
+
+        Call this method after the geometry of the object changes so that the next access
+        reads the history from AEDT again.
+
+        Returns
+        -------
+        bool
+            ``True`` when successful.
+        """
+        self._props = None
+        if self.__first_level:
+            self._tree_segments_node = None
+            self._tree_child_getter = None
+            self._first_level_pending = True
+        self._children = {}
+        self._children_loaded = False
+        return True
+
     @property
     def properties(self):
         """Properties data.
@@ -1433,26 +1516,29 @@ class BinaryTreeNode:
         -------
         :class:``ansys.aedt.coree.modeler.cad.elements_3d.HistoryProps``
         """
+        if self._cache_props and self._props is not None:
+            return self._props
+        child_object = getattr(self, "child_object", None)
         self._props = {}
-        if not getattr(self, "child_object", None):
+        if not child_object:
             return self._props
         if settings.aedt_version >= "2024.2":
             try:
                 from ansys.aedt.core.application import _get_data_model
 
-                props = _get_data_model(self.child_object)
-                for p in self.child_object.GetPropNames():
+                props = _get_data_model(child_object)
+                for p in child_object.GetPropNames():
                     self._props[p] = props.get(p, None)
             except Exception:
-                for p in self.child_object.GetPropNames():
+                for p in child_object.GetPropNames():
                     try:
-                        self._props[p] = self.child_object.GetPropValue(p)
+                        self._props[p] = child_object.GetPropValue(p)
                     except Exception:
                         self._props[p] = None
         else:
-            for p in self.child_object.GetPropNames():
+            for p in child_object.GetPropNames():
                 try:
-                    self._props[p] = self.child_object.GetPropValue(p)
+                    self._props[p] = child_object.GetPropValue(p)
                 except Exception:
                     self._props[p] = None
         self._props = HistoryProps(self, self._props)
@@ -1488,6 +1574,8 @@ class BinaryTreeNode:
             return
         try:
             result = self.child_object.SetPropValue(prop_name, prop_value)
+            if self._cache_props:
+                self._props = None
             if result:
                 if prop_name == "Name" and getattr(self, "_name", False):
                     setattr(self, "_name", prop_value)
@@ -1530,6 +1618,7 @@ class BinaryTreeNode:
                     ],
                 ]
             )
+            node._props = None
 
         for _, node in node.children.items():
             self._suppress(node, app, suppress)
@@ -426,8 +426,22 @@ class CircuitComponent(object):
         else:
             return self.name + ";" + str(self.schematic_id)
 
+    @property
+    def name(self):
+        """Component name."""
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        old_name = self._name
+        self._name = value
+        # Keep the name index of the components table in sync.
+        components = getattr(self._circuit_components, "components", None)
+        if old_name and old_name != value and hasattr(components, "_rename"):
+            components._rename(self, old_name, value)
+
     def __init__(self, circuit_components, tabname="PassedParameterTab", custom_editor=None):
-        self.name = ""
+        self._name = ""
         self._circuit_components = circuit_components
         if custom_editor:
             self._oeditor = custom_editor
@@ -24,6 +24,7 @@
 
 import math
 import os
+import re
 import secrets
 
 from ansys.aedt.core.application.variables import decompose_variable_value
@@ -33,11 +34,129 @@ from ansys.aedt.core.generic.general_methods import generate_unique_name
 from ansys.aedt.core.generic.general_methods import open_file
 from ansys.aedt.core.generic.general_methods import pyaedt_function_handler
 from ansys.aedt.core.generic.general_methods import recursive_glob
+from ansys.aedt.core.generic.library_index import LibraryIndex
 from ansys.aedt.core.generic.load_aedt_file import load_keyword_in_aedt_file
+from ansys.aedt.core.generic.load_aedt_file import load_keyword_in_aedt_file_at_offset
+from ansys.aedt.core.generic.settings import settings
 from ansys.aedt.core.modeler.circuits.object_3d_circuit import CircuitComponent
 from ansys.aedt.core.modeler.circuits.object_3d_circuit import Wire
 
 
+def _index_aclb_file(file_name):
+    """Get the names of the components of an ACLB file and the byte offsets of their definitions."""
+    comps = load_keyword_in_aedt_file(file_name, "DefInfo").get("DefInfo", {})
+    comps.update(load_keyword_in_aedt_file(file_name, "CompInfo").get("CompInfo", {}))
+    names = list(comps.keys())
+    offsets = {}
+    _begin_search = re.compile(rb"^[ \t]*\$begin '(.+)'")
+    offset = 0
+    with open_file(file_name, "rb") as aedt_fh:
+        for line in aedt_fh:
+            b = _begin_search.search(line)
+            if b:
+                try:
+                    name = b.group(1).decode("utf-8")
+                except UnicodeDecodeError:
+                    name = None
+                if name in comps:
+                    offsets.setdefault(name, offset)
+            offset += len(line)
+    return {"components": names, "offsets": offsets}
+
+
+_component_library_index = LibraryIndex("components", "*.aclb", _index_aclb_file, check_files=True)
+
+
+class CircuitComponentTable(dict):
+    """Circuit components indexed by ID and by name.
+
+    The table is a dictionary keyed by component ID that keeps a name index in sync
+    as components are added, deleted or renamed, so that name lookups do not scan the schematic.
+    """
+
+    def __init__(self, *args, **kwargs):
+        dict.__init__(self)
+        self._names = {}
+        self.update(*args, **kwargs)
+
+    def __setitem__(self, key, value):
+        if key in self:
+            self._unindex(key)
+        dict.__setitem__(self, key, value)
+        self._index(key, getattr(value, "name", None))
+
+    def __delitem__(self, key):
+        self._unindex(key)
+        dict.__delitem__(self, key)
+
+    def _index(self, key, name):
+        if name:
+            # Keys are kept in insertion order so that the first component added with a name is returned.
+            self._names.setdefault(name, {})[key] = None
+
+    def _unindex(self, key, name=None):
+        if name is None:
+            name = getattr(dict.__getitem__(self, key), "name", None)
+        keys = self._names.get(name)
+        if keys is not None:
+            keys.pop(key, None)
+            if not keys:
+                del self._names[name]
+
+    def _rename(self, component, old_name, new_name):
+        """Move a component in the name index after it is renamed."""
+        for key in list(self._names.get(old_name, [])):
+            if dict.__getitem__(self, key) is component:
+                self._unindex(key, old_name)
+                self._index(key, new_name)
+                return
+
+    def pop(self, key, *args):
+        if key in self:
+            self._unindex(key)
+        return dict.pop(self, key, *args)
+
+    def popitem(self):
+        key, value = dict.popitem(self)
+        name = getattr(value, "name", None)
+        if name:
+            self._unindex(key, name)
+        return key, value
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return dict.__getitem__(self, key)
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def clear(self):
+        dict.clear(self)
+        self._names.clear()
+
+    def get_id(self, name):
+        """Get the ID of a component from its name.
+
+        Parameters
+        ----------
+        name : str
+            Component name.
+
+        Returns
+        -------
+        int
+            Component ID or ``None`` if no component has this name.
+        """
+        if not isinstance(name, str):
+            return None
+        keys = self._names.get(name)
+        if not keys:
+            return None
+        return next(iter(keys))
+
+
 class CircuitComponents(object):
     """CircutComponents class.
 
@@ -66,10 +185,23 @@ class CircuitComponents(object):
         """
         if isinstance(partname, int):
             return self.components[partname]
-        for el in self.components:
-            if self.components[el].name == partname or self.components[el].composed_name == partname or el == partname:
-                return self.components[el]
-
+        obj_id = self.get_obj_id(partname)
+        if obj_id is not None:
+            return self.components[obj_id]
+        return self._get_component_by_composed_name(partname)
+
+    def _get_component_by_composed_name(self, composed_name):
+        """Get a component from its composed name, such as ``"CompInst@R;1;10"``, without scanning."""
+        if not isinstance(composed_name, str):
+            return None
+        if composed_name in self.components:
+            return self.components[composed_name]
+        # The component key is the ID, which is the second field of the composed name.
+        name = composed_name.split(";")
+        if len(name) > 1 and name[1].isdigit():
+            component = self.components.get(int(name[1]))
+            if component is not None and component.composed_name == composed_name:
+                return component
         return None
 
     def __init__(self, modeler):
@@ -80,7 +212,9 @@ class CircuitComponents(object):
 
         self.oeditor = self._modeler.oeditor
         self._currentId = 0
-        self.components = {}
+        self.components = CircuitComponentTable()
+        self._element_ids = set()
+        self._last_unique_id = None
         self.refresh_all_ids()
         self.current_position = [0, 0]
         self.increment_mils = [1000, 1000]
@@ -252,18 +386,25 @@ class CircuitComponents(object):
             Unique ID in the range of ``[1, 65535]``.
 
         """
-        element_ids = []
-        for el in self.oeditor.GetAllElements():
-            try:
-                element_ids.append(int(el.split("@")[1].split(";")[1].split(":")[0]))
-            except (IndexError, ValueError):
-                pass
         secure_random = secrets.SystemRandom()
         id = secure_random.randint(1, 65535)
-        while id in element_ids:
+        while id in self._element_ids or id in self.components:
             id = secure_random.randint(1, 65535)
+        self._element_ids.add(id)
+        self._last_unique_id = id
         return id
 
+    @pyaedt_function_handler()
+    def _refresh_element_ids(self):
+        """Refresh the IDs used by all schematic elements, including the ones not created by PyAEDT."""
+        for el in self.oeditor.GetAllElements() or []:
+            name = el.split(";")
+            if len(name) > 1:
+                try:
+                    self._element_ids.add(int(name[1].split(":")[0]))
+                except ValueError:
+                    pass
+
     @pyaedt_function_handler()
     def add_pin_iports(self, name, id_num):
         """Add ports on pins.
@@ -323,10 +464,10 @@ class CircuitComponents(object):
         id = self.create_unique_id()
         arg1 = ["NAME:IPortProps", "Name:=", name, "Id:=", id]
         arg2 = ["NAME:Attributes", "Page:=", 1, "X:=", xpos, "Y:=", ypos, "Angle:=", angle, "Flip:=", False]
-        id = self.oeditor.CreateIPort(arg1, arg2)
+        composed_name = self.oeditor.CreateIPort(arg1, arg2)
 
-        id = int(id.split(";")[1])
-        self.add_id_to_component(id)
+        id = int(composed_name.split(";")[1])
+        self.add_id_to_component(id, composed_name)
         # return id, self.components[id].composed_name
         for el in self.components:
             if ("IPort@" + name + ";" + str(id)) in self.components[el].composed_name:
@@ -360,13 +501,12 @@ class CircuitComponents(object):
         xpos, ypos = self._get_location(location)
 
         id = self.create_unique_id()
-        id = self.oeditor.CreatePagePort(
+        composed_name = self.oeditor.CreatePagePort(
             ["NAME:PagePortProps", "Name:=", name, "Id:=", id],
             ["NAME:Attributes", "Page:=", 1, "X:=", xpos, "Y:=", ypos, "Angle:=", angle, "Flip:=", False],
         )
-        id = int(id.split(";")[1])
-        # self.refresh_all_ids()
-        self.add_id_to_component(id)
+        id = int(composed_name.split(";")[1])
+        self.add_id_to_component(id, composed_name)
         return self.components[id]
 
     @pyaedt_function_handler()
@@ -400,7 +540,7 @@ class CircuitComponents(object):
             ["NAME:Attributes", "Page:=", 1, "X:=", xpos, "Y:=", ypos, "Angle:=", angle, "Flip:=", False],
         )
         id = int(name.split(";")[1])
-        self.add_id_to_component(id)
+        self.add_id_to_component(id, name)
         # return id, self.components[id].composed_name
         for el in self.components:
             if name in self.components[el].composed_name:
@@ -740,9 +880,9 @@ class CircuitComponents(object):
             model_name = self.create_model_from_touchstone(model_name, show_bitmap=show_bitmap)
         arg1 = ["NAME:ComponentProps", "Name:=", model_name, "Id:=", str(id)]
         arg2 = ["NAME:Attributes", "Page:=", 1, "X:=", xpos, "Y:=", ypos, "Angle:=", angle, "Flip:=", False]
-        id = self.oeditor.CreateComponent(arg1, arg2)
-        id = int(id.split(";")[1])
-        self.add_id_to_component(id)
+        composed_name = self.oeditor.CreateComponent(arg1, arg2)
+        id = int(composed_name.split(";")[1])
+        self.add_id_to_component(id, composed_name)
         return self.components[id]
 
     @pyaedt_function_handler(inst_name="name")
@@ -804,10 +944,9 @@ class CircuitComponents(object):
         xpos, ypos = self._get_location(location)
         angle = math.pi * angle / 180
         arg2 = ["NAME:Attributes", "Page:=", 1, "X:=", xpos, "Y:=", ypos, "Angle:=", angle, "Flip:=", False]
-        id = self.oeditor.CreateComponent(arg1, arg2)
-        id = int(id.split(";")[1])
-        # self.refresh_all_ids()
-        self.add_id_to_component(id)
+        composed_name = self.oeditor.CreateComponent(arg1, arg2)
+        id = int(composed_name.split(";")[1])
+        self.add_id_to_component(id, composed_name)
         if name:
             self.components[id].set_property("InstanceName", name)
         if use_instance_id_netlist:
@@ -1026,31 +1165,39 @@ class CircuitComponents(object):
         obj = self.oeditor.GetAllElements()
         if not obj:
             obj = []
-        obj = [i for i in obj if "Wire" not in i[:4]]
         for el in obj:
-            if not self.get_obj_id(el):
-                name = el.split(";")
-                if len(name) > 1:
-                    o = CircuitComponent(self, tabname=self.tab_name)
-                    o.name = name[0]
-                    if len(name) == 2:
-                        o.schematic_id = name[1]
-                        objID = int(o.schematic_id)
-                    else:
-                        o.id = int(name[1])
-                        o.schematic_id = name[2]
-                        objID = o.id
-                    self.components[objID] = o
+            name = el.split(";")
+            if len(name) > 1:
+                try:
+                    self._element_ids.add(int(name[1].split(":")[0]))
+                except ValueError:
+                    pass
+            if "Wire" in el[:4] or len(name) < 2:
+                continue
+            o = CircuitComponent(self, tabname=self.tab_name)
+            o.name = name[0]
+            if len(name) == 2:
+                o.schematic_id = name[1]
+                objID = int(o.schematic_id)
+            else:
+                o.id = int(name[1])
+                o.schematic_id = name[2]
+                objID = o.id
+            self.components[objID] = o
         return len(self.components)
 
     @pyaedt_function_handler()
-    def add_id_to_component(self, id):
+    def add_id_to_component(self, id, composed_name=None):
         """Add an ID to a component.
 
         Parameters
         ----------
         id : int
             ID to assign to the component.
+        composed_name : str, optional
+            Composed name of the element returned by AEDT when the element is created,
+            for example ``"CompInst@R;1;2"``. The default is ``None``, in which case
+            all schematic elements are listed to find the one with this ID.
 
         Returns
         -------
@@ -1058,7 +1205,15 @@ class CircuitComponents(object):
             Number of components.
 
         """
-        obj = self.oeditor.GetAllElements()
+        if composed_name:
+            obj = [composed_name]
+            if self._last_unique_id is not None and str(self._last_unique_id) != str(id):
+                # AEDT assigned another ID because the requested one collides with an element
+                # created outside PyAEDT, so the known IDs are stale.
+                self._refresh_element_ids()
+        else:
+            obj = self.oeditor.GetAllElements()
+        self._last_unique_id = None
         for el in obj:
             name = el.split(";")
             if len(name) > 1 and str(id) == name[1]:
@@ -1072,6 +1227,7 @@ class CircuitComponents(object):
                     o.schematic_id = int(name[1])
                     objID = o.schematic_id
                 self.components[objID] = o
+                self._element_ids.add(objID)
 
         return len(self.components)
 
@@ -1086,14 +1242,11 @@ class CircuitComponents(object):
 
         Returns
         -------
-        bool
-            ``True`` when successful, ``False`` when failed.
+        int
+            Object ID when successful, ``None`` when failed.
 
         """
-        for el in self.components:
-            if self.components[el].name == assignment:
-                return el
-        return None
+        return self.components.get_id(assignment)
 
     @pyaedt_function_handler(partid="assignment")
     def get_pins(self, assignment):
@@ -1243,18 +1396,22 @@ class CircuitComponents(object):
 class ComponentInfo(object):
     """Manages Circuit Catalog info."""
 
-    def __init__(self, name, component_manager, file_name, component_library):
+    def __init__(self, name, component_manager, file_name, component_library, offset=None):
         self._component_manager = component_manager
         self.file_name = file_name
         self.name = name
         self.component_library = component_library
+        self._offset = offset
         self._props = None
 
     @property
     def props(self):
         """Retrieve the component properties."""
-        if not self._props:
-            self._props = load_keyword_in_aedt_file(self.file_name, self.name)
+        if self._props is None:
+            if self._offset is None:
+                self._props = load_keyword_in_aedt_file(self.file_name, self.name)
+            else:
+                self._props = load_keyword_in_aedt_file_at_offset(self.file_name, self.name, self._offset)
         return self._props
 
     @pyaedt_function_handler(inst_name="assignment")
@@ -1331,25 +1488,24 @@ class ComponentCatalog(object):
     @pyaedt_function_handler()
     def _index_components(self, library_path=None):
         if library_path:
-            sys_files = recursive_glob(library_path, "*.aclb")
             root = os.path.normpath(library_path).split(os.path.sep)[-1]
         else:
-            sys_files = recursive_glob(os.path.join(self._app.syslib, self._component_manager.design_libray), "*.aclb")
+            library_path = os.path.join(self._app.syslib, self._component_manager.design_libray)
             root = os.path.normpath(self._app.syslib).split(os.path.sep)[-1]
-        for file in sys_files:
-            comps1 = load_keyword_in_aedt_file(file, "DefInfo")
-            comps2 = load_keyword_in_aedt_file(file, "CompInfo")
-            comps = comps1.get("DefInfo", {})
-            comps.update(comps2.get("CompInfo", {}))
-            for compname, comp_value in comps.items():
-                root_name, ext = os.path.splitext(os.path.normpath(file))
-                full_path = root_name.split(os.path.sep)
-                id = full_path.index(root) + 1
-                if self._component_manager.design_libray in full_path[id:]:
-                    id += 1
-                comp_lib = "\\".join(full_path[id:]) + ":" + compname
-                self.components[comp_lib] = ComponentInfo(
-                    compname, self._component_manager, file, comp_lib.split(":")[0]
+        if settings.remote_rpc_session:
+            sys_files = {file: _index_aclb_file(file) for file in recursive_glob(library_path, "*.aclb")}
+        else:
+            sys_files = _component_library_index.get(library_path)
+        for file, file_data in sys_files.items():
+            root_name, ext = os.path.splitext(os.path.normpath(file))
+            full_path = root_name.split(os.path.sep)
+            id = full_path.index(root) + 1
+            if self._component_manager.design_libray in full_path[id:]:
+                id += 1
+            comp_lib = "\\".join(full_path[id:])
+            for compname in file_data["components"]:
+                self.components[comp_lib + ":" + compname] = ComponentInfo(
+                    compname, self._component_manager, file, comp_lib, file_data["offsets"].get(compname)
                 )
 
     @pyaedt_function_handler()
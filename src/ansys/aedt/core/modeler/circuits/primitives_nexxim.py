@@ -83,6 +83,12 @@ class NexximComponents(CircuitComponents):
         """
         if isinstance(partname, int):
             return self.components[partname]
+        obj_id = self.get_obj_id(partname)
+        if obj_id is not None:
+            return self.components[obj_id]
+        component = self._get_component_by_composed_name(partname)
+        if component is not None:
+            return component
         for el in self.components:
             cmp = self.components[el]
             if (
@@ -124,6 +130,9 @@ class NexximComponents(CircuitComponents):
         """
         if name in self.components:
             return self.components[name]
+        obj_id = self.get_obj_id(name)
+        if obj_id is not None:
+            return self.components[obj_id]
         else:
             for comp in self.components.values():
                 if (
@@ -320,6 +320,7 @@ class Modeler3DLayout(Modeler, Primitives3DLayout):
         else:
             self.logger.error("Wrong Property Value")
             return False
+        self.clear_property_cache()
         self.logger.info(f"Property {name} Changed correctly.")
         return True
 
@@ -439,7 +440,7 @@ class Modeler3DLayout(Modeler, Primitives3DLayout):
                 self.number_with_units(tolerance),
             ]
         )
-
+        self.clear_property_cache()
         return True
 
     @pyaedt_function_handler(object_to_expand="assignment")
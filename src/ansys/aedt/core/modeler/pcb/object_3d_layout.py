@@ -97,8 +97,40 @@ class Object3DLayout(object):
         vOut = ["NAME:AllTabs", vGeo3dlayout]
 
         self._oeditor.ChangeProperty(vOut)
+        self._primitives.clear_property_cache()
         return True
 
+    def _get_property_value(self, name):
+        """Get a property value from the prefetched properties or from AEDT.
+
+        Parameters
+        ----------
+        name : str
+            Name of the property in the ``BaseElementTab`` tab.
+
+        Returns
+        -------
+        str
+            Property value.
+        """
+        cached_properties = self._primitives._property_cache.get(self.name)
+        if cached_properties is not None and name in cached_properties:
+            return cached_properties[name]
+        return self._oeditor.GetPropertyValue("BaseElementTab", self.name, name)
+
+    def _get_component_info(self):
+        """Get the component information from the prefetched properties or from AEDT.
+
+        Returns
+        -------
+        list
+            Component information.
+        """
+        cached_properties = self._primitives._property_cache.get(self.name)
+        if cached_properties is not None and "ComponentInfo" in cached_properties:
+            return cached_properties["ComponentInfo"]
+        return self._oeditor.GetComponentInfo(self.name)
+
     @pyaedt_function_handler(property_name="name", property_value="value")
     def set_property_value(self, name, value):
         """Set a property value.
@@ -140,7 +172,7 @@ class Object3DLayout(object):
         >>> oEditor.GetPropertyValue
         """
         if self.prim_type in ["component", "pin", "via"]:
-            return self._oeditor.GetPropertyValue("BaseElementTab", self.name, "Angle")
+            return self._get_property_value("Angle")
 
     @angle.setter
     def angle(self, value):
@@ -196,7 +228,7 @@ class Object3DLayout(object):
         >>> oEditor.GetPropertyValue
         """
         if self.prim_type not in ["component"]:
-            return self._oeditor.GetPropertyValue("BaseElementTab", self.name, "Net")
+            return self._get_property_value("Net")
 
     @net_name.setter
     def net_name(self, netname=""):
@@ -218,7 +250,7 @@ class Object3DLayout(object):
         >>> oEditor.GetPropertyValue
         """
         if self.prim_type not in ["pin", "via"]:
-            return self._oeditor.GetPropertyValue("BaseElementTab", self.name, "PlacementLayer")
+            return self._get_property_value("PlacementLayer")
 
     @placement_layer.setter
     def placement_layer(self, layer_name):
@@ -235,7 +267,7 @@ class Object3DLayout(object):
         list
             [BB_lower_left_X, BB_lower_left_Y, BB_upper_right_X, BB_upper_right_Y].
         """
-        info = self._oeditor.GetComponentInfo(self.name)
+        info = self._get_component_info()
         bbllx = bblly = bburx = bbury = 0
         for i in info:
             if "BBoxLLx" in i:
@@ -313,7 +345,7 @@ class Object3DLayout(object):
         >>> oEditor.GetPropertyValue
         """
         if self.prim_type == "component":
-            info = self._oeditor.GetComponentInfo(self.name)
+            info = self._get_component_info()
             bbllx = bblly = bburx = bbury = 0
             for i in info:
                 if "BBoxLLx" in i:
@@ -330,7 +362,7 @@ class Object3DLayout(object):
             loc_y = round(unit_converter(loc_y, output_units=self._primitives.model_units), 9)
             return [loc_x, loc_y]
         elif self.prim_type in ["pin", "via"]:
-            location = self._oeditor.GetPropertyValue("BaseElementTab", self.name, "Location").split(",")
+            location = self._get_property_value("Location").split(",")
             locs = []
             for i in location:
                 try:
@@ -397,11 +429,7 @@ class Object3DLayout(object):
         ----------
         >>> oEditor.ChangeProperty
         """
-        return (
-            True
-            if self._oeditor.GetPropertyValue("BaseElementTab", self.name, "LockPosition") in [True, "true"]
-            else False
-        )
+        return True if self._get_property_value("LockPosition") in [True, "true"] else False
 
     @lock_position.setter
     def lock_position(self, lock_position=True):
@@ -509,7 +537,7 @@ class Components3DLayout(Object3DLayout, object):
         ----------
         >>> oEditor.GetPropertyValue
         """
-        return self._oeditor.GetPropertyValue("BaseElementTab", self.name, "Part")
+        return self._get_property_value("Part")
 
     @property
     def part_type(self):
@@ -524,7 +552,7 @@ class Components3DLayout(Object3DLayout, object):
         ----------
         >>> oEditor.GetPropertyValue
         """
-        return self._oeditor.GetPropertyValue("BaseElementTab", self.name, "Part Type")
+        return self._get_property_value("Part Type")
 
     def __part_type_id(self):
         parts = {"Other": 0, "Resistor": 1, "Inductor": 2, "Capacitor": 3, "IC": 4, "IO": 5}
@@ -546,7 +574,7 @@ class Components3DLayout(Object3DLayout, object):
         bool
             `True` if succeeded.
         """
-        comp_info = self._oeditor.GetComponentInfo(self.name)
+        comp_info = self._get_component_info()
         for el in comp_info:
             if "ComponentProp=" in el and "CompPropEnabled=false" in el:
                 return False
@@ -644,7 +672,7 @@ class Components3DLayout(Object3DLayout, object):
         """
         if not self.__has_port_properties():
             return False
-        component_info = str(list(self._oeditor.GetComponentInfo(self.name))).replace("'", "").replace('"', "")
+        component_info = str(list(self._get_component_info())).replace("'", "").replace('"', "")
         if "sbsh=Cyl" in component_info or "sbsh=Sph" in component_info:
             return True
         return False
@@ -660,7 +688,7 @@ class Components3DLayout(Object3DLayout, object):
         """
         if not self.__has_port_properties():
             return False
-        component_info = str(list(self._oeditor.GetComponentInfo(self.name))).replace("'", "").replace('"', "")
+        component_info = str(list(self._get_component_info())).replace("'", "").replace('"', "")
         if "dt=1" in component_info or "dt=2" in component_info:
             return True
         return False
@@ -675,7 +703,7 @@ class Components3DLayout(Object3DLayout, object):
         """
         if not self.__has_port_properties():
             return False
-        component_info = str(list(self._oeditor.GetComponentInfo(self.name))).replace("'", "").replace('"', "")
+        component_info = str(list(self._get_component_info())).replace("'", "").replace('"', "")
         if "dt=1" in component_info:
             return "FlipChip"
         elif "dt=2" in component_info:
@@ -858,7 +886,7 @@ class Components3DLayout(Object3DLayout, object):
         return self.change_property(args)
 
     def __get_model_info(self):
-        props = self._oeditor.GetComponentInfo(self.name)
+        props = self._get_component_info()
         model_info = ""
         for p in props:
             if "PortProp(" in p:
@@ -909,10 +937,8 @@ class Nets3DLayout(object):
         -------
         :class:`ansys.aedt.core.modeler.cad.object_3dlayout.Components3DLayout`
         """
-        comps = {}
-        for c in self._oeditor.FilterObjectList("Type", "component", self._oeditor.FindObjects("Net", self.name)):
-            comps[c] = self._primitives.components[c]
-        return comps
+        components = self._primitives.components
+        return {c: components[c] for c in self._primitives._find_objects("Net", self.name) if c in components}
 
     @property
     def geometry_names(self):
@@ -922,8 +948,10 @@ class Nets3DLayout(object):
         -------
         list
             Geometries that belong to the selected net."""
-        comps = self._primitives._get_names(["component", "pin", "via"])
-        geo = [i for i in self._oeditor.FindObjects("Net", self.name) if i not in comps]
+        comps = set()
+        for category in ["component", "pin", "via"]:
+            comps.update(self._primitives._find_objects("Type", category))
+        geo = [i for i in self._primitives._find_objects("Net", self.name) if i not in comps]
         return geo
 
     @pyaedt_function_handler()
@@ -1001,7 +1029,7 @@ class Pins3DLayout(Object3DLayout, object):
         ----------
         >>> oEditor.GetPropertyValue
         """
-        return self._oeditor.GetPropertyValue("BaseElementTab", self.name, "Start Layer")
+        return self._get_property_value("Start Layer")
 
     @property
     def stop_layer(self):
@@ -1016,7 +1044,7 @@ class Pins3DLayout(Object3DLayout, object):
         ----------
         >>> oEditor.GetPropertyValue
         """
-        return self._oeditor.GetPropertyValue("BaseElementTab", self.name, "Stop Layer")
+        return self._get_property_value("Stop Layer")
 
     @property
     def holediam(self):
@@ -1031,7 +1059,7 @@ class Pins3DLayout(Object3DLayout, object):
         ----------
         >>> oEditor.GetPropertyValue
         """
-        return self._oeditor.GetPropertyValue("BaseElementTab", self.name, "HoleDiameter")
+        return self._get_property_value("HoleDiameter")
 
 
 class Geometries3DLayout(Object3DLayout, object):
@@ -1231,7 +1259,7 @@ class Geometries3DLayout(Object3DLayout, object):
         ----------
         >>> oEditor.GetPropertyValue
         """
-        return self._oeditor.GetPropertyValue("BaseElementTab", self.name, name)
+        return self._get_property_value(name)
 
     @property
     def negative(self):
@@ -1252,9 +1280,7 @@ class Geometries3DLayout(Object3DLayout, object):
         """
         if self.is_void:
             return False
-        return (
-            True if self._oeditor.GetPropertyValue("BaseElementTab", self.name, "Negative") in [True, "true"] else False
-        )
+        return True if self._get_property_value("Negative") in [True, "true"] else False
 
     @negative.setter
     def negative(self, negative=False):
@@ -1278,7 +1304,7 @@ class Geometries3DLayout(Object3DLayout, object):
         if self.is_void:
             return None
         if self.prim_type not in ["component"]:
-            return self._oeditor.GetPropertyValue("BaseElementTab", self.name, "Net")
+            return self._get_property_value("Net")
 
     @net_name.setter
     def net_name(self, netname=""):
@@ -1340,7 +1366,7 @@ class Circle3dLayout(Geometries3DLayout, object):
         ----------
         >>> oEditor.GetPropertyValue
         """
-        cent = self._oeditor.GetPropertyValue("BaseElementTab", self.name, "Center")
+        cent = self._get_property_value("Center")
         if cent:
             return cent.split(",")
 
@@ -1362,7 +1388,7 @@ class Circle3dLayout(Geometries3DLayout, object):
         ----------
         >>> oEditor.GetPropertyValue
         """
-        return self._oeditor.GetPropertyValue("BaseElementTab", self.name, "Radius")
+        return self._get_property_value("Radius")
 
     @radius.setter
     def radius(self, value):
@@ -1389,7 +1415,7 @@ class Rect3dLayout(Geometries3DLayout, object):
         ----------
         >>> oEditor.GetPropertyValue
         """
-        return self._oeditor.GetPropertyValue("BaseElementTab", self.name, "CornerRadius")
+        return self._get_property_value("CornerRadius")
 
     @corner_radius.setter
     def corner_radius(self, value):
@@ -1409,11 +1435,7 @@ class Rect3dLayout(Geometries3DLayout, object):
         ----------
         >>> oEditor.GetPropertyValue
         """
-        return (
-            True
-            if self._oeditor.GetPropertyValue("BaseElementTab", self.name, "2 pt Description") in [True, "true"]
-            else False
-        )
+        return True if self._get_property_value("2 pt Description") in [True, "true"] else False
 
     @two_point_description.setter
     def two_point_description(self, value):
@@ -1434,7 +1456,7 @@ class Rect3dLayout(Geometries3DLayout, object):
         >>> oEditor.GetPropertyValue
         """
         if not self.two_point_description:
-            cent = self._oeditor.GetPropertyValue("BaseElementTab", self.name, "Center")
+            cent = self._get_property_value("Center")
             if cent:
                 return cent.split(",")
 
@@ -1458,7 +1480,7 @@ class Rect3dLayout(Geometries3DLayout, object):
         >>> oEditor.GetPropertyValue
         """
         if not self.two_point_description:
-            return self._oeditor.GetPropertyValue("BaseElementTab", self.name, "Width")
+            return self._get_property_value("Width")
 
     @width.setter
     def width(self, value):
@@ -1480,7 +1502,7 @@ class Rect3dLayout(Geometries3DLayout, object):
         >>> oEditor.GetPropertyValue
         """
         if not self.two_point_description:
-            return self._oeditor.GetPropertyValue("BaseElementTab", self.name, "Height")
+            return self._get_property_value("Height")
 
     @height.setter
     def height(self, value):
@@ -1502,7 +1524,7 @@ class Rect3dLayout(Geometries3DLayout, object):
         >>> oEditor.GetPropertyValue
         """
         if self.two_point_description:
-            pa = self._oeditor.GetPropertyValue("BaseElementTab", self.name, "Pt A")
+            pa = self._get_property_value("Pt A")
             if pa:
                 return pa.split(",")
 
@@ -1526,7 +1548,7 @@ class Rect3dLayout(Geometries3DLayout, object):
         >>> oEditor.GetPropertyValue
         """
         if self.two_point_description:
-            pa = self._oeditor.GetPropertyValue("BaseElementTab", self.name, "Pt B")
+            pa = self._get_property_value("Pt B")
             if pa:
                 return pa.split(",")
 
@@ -1558,7 +1580,7 @@ class Line3dLayout(Geometries3DLayout, object):
         ----------
         >>> oEditor.GetPropertyValue
         """
-        return self._oeditor.GetPropertyValue("BaseElementTab", self.name, "BendType")
+        return self._get_property_value("BendType")
 
     @bend_type.setter
     def bend_type(self, value):
@@ -1578,7 +1600,7 @@ class Line3dLayout(Geometries3DLayout, object):
         ----------
         >>> oEditor.GetPropertyValue
         """
-        return self._oeditor.GetPropertyValue("BaseElementTab", self.name, "StartCapType")
+        return self._get_property_value("StartCapType")
 
     @start_cap_type.setter
     def start_cap_type(self, value):
@@ -1598,7 +1620,7 @@ class Line3dLayout(Geometries3DLayout, object):
         ----------
         >>> oEditor.GetPropertyValue
         """
-        return self._oeditor.GetPropertyValue("BaseElementTab", self.name, "EndCapType")
+        return self._get_property_value("EndCapType")
 
     @end_cap_type.setter
     def end_cap_type(self, value):
@@ -1618,7 +1640,7 @@ class Line3dLayout(Geometries3DLayout, object):
         ----------
         >>> oEditor.GetPropertyValue
         """
-        return self._oeditor.GetPropertyValue("BaseElementTab", self.name, "LineWidth")
+        return self._get_property_value("LineWidth")
 
     @width.setter
     def width(self, value):
@@ -1638,7 +1660,7 @@ class Line3dLayout(Geometries3DLayout, object):
         ----------
         >>> oEditor.GetPropertyValue
         """
-        return self._oeditor.GetPropertyValue("BaseElementTab", self.name, "TotalLength")
+        return self._get_property_value("TotalLength")
 
     @property
     def center_line(self):
@@ -1696,6 +1718,7 @@ class Line3dLayout(Geometries3DLayout, object):
         line = self._primitives.create_line(self.placement_layer, points)
         line_name = self.name
         self._primitives.oeditor.Delete([self.name])
+        self._primitives.clear_property_cache()
         line.name = line_name
         self._primitives._lines[self.name] = line
         return line
@@ -1724,6 +1747,7 @@ class Line3dLayout(Geometries3DLayout, object):
         line = self._primitives.create_line(self.placement_layer, points)
         line_name = self.name
         self._primitives.oeditor.Delete([self.name])
+        self._primitives.clear_property_cache()
         line.name = line_name
         self._primitives._lines[self.name] = line
         return line
@@ -1829,7 +1853,7 @@ class ComponentsSubCircuit3DLayout(Object3DLayout, object):
     @property
     def component_info(self):
         """Retrieve all component info."""
-        return self._oeditor.GetComponentInfo(self.name)
+        return self._get_component_info()
 
     @property
     def component_name(self):
@@ -1853,9 +1877,9 @@ class ComponentsSubCircuit3DLayout(Object3DLayout, object):
         >>> oEditor.GetPropertyValue
         """
         if self.is_3d_placement:
-            ang = self._oeditor.GetPropertyValue("BaseElementTab", self.name, "Rotation Angle")
+            ang = self._get_property_value("Rotation Angle")
         else:
-            ang = self._oeditor.GetPropertyValue("BaseElementTab", self.name, "Angle")
+            ang = self._get_property_value("Angle")
         try:
             return float(ang)
         except ValueError:
@@ -1875,7 +1899,7 @@ class ComponentsSubCircuit3DLayout(Object3DLayout, object):
     @property
     def is_3d_placement(self):
         """Retrieve if the component has 3d placement."""
-        if self._oeditor.GetPropertyValue("BaseElementTab", self.name, "3D Placement") in ["true", "True"]:
+        if self._get_property_value("3D Placement") in ["true", "True"]:
             return True
         else:
             return False
@@ -1888,7 +1912,7 @@ class ComponentsSubCircuit3DLayout(Object3DLayout, object):
     @property
     def is_flipped(self):
         """Retrieve if the component is flipped or not."""
-        if self._oeditor.GetPropertyValue("BaseElementTab", self.name, "Flipped").lower() == "true":
+        if self._get_property_value("Flipped").lower() == "true":
             return True
         else:
             return False
@@ -1902,7 +1926,7 @@ class ComponentsSubCircuit3DLayout(Object3DLayout, object):
     def rotation_axis(self):
         """Rotation axis around which the component is rotated."""
         if self.is_3d_placement:
-            return self._oeditor.GetPropertyValue("BaseElementTab", self.name, "Rotation Axis")
+            return self._get_property_value("Rotation Axis")
         return False
 
     @rotation_axis.setter
@@ -1915,12 +1939,7 @@ class ComponentsSubCircuit3DLayout(Object3DLayout, object):
     def rotation_axis_direction(self):
         """Axis direction of the rotation."""
         if self.is_3d_placement:
-            return [
-                float(i)
-                for i in self._oeditor.GetPropertyValue("BaseElementTab", self.name, "Rotation Axis Direction").split(
-                    ","
-                )
-            ]
+            return [float(i) for i in self._get_property_value("Rotation Axis Direction").split(",")]
         return [0, 0, 1]
 
     @rotation_axis_direction.setter
@@ -1939,7 +1958,7 @@ class ComponentsSubCircuit3DLayout(Object3DLayout, object):
             [x, y, z] position.
         """
         if self.is_3d_placement:
-            return [i for i in self._oeditor.GetPropertyValue("BaseElementTab", self.name, "Local Origin").split(",")]
+            return [i for i in self._get_property_value("Local Origin").split(",")]
         return [0, 0, 0]
 
     @local_origin.setter
@@ -1963,7 +1982,7 @@ class ComponentsSubCircuit3DLayout(Object3DLayout, object):
         ----------
         >>> oEditor.GetPropertyValue
         """
-        location = self._oeditor.GetPropertyValue("BaseElementTab", self.name, "Location").split(",")
+        location = self._get_property_value("Location").split(",")
         locs = []
         for i in location:
             try:
@@ -97,6 +97,7 @@ class Primitives3DLayout(object):
 
     @pyaedt_function_handler()
     def _init_prims(self):
+        self.clear_property_cache()
         self._components = {}
         self._rectangles = {}
         self._lines = {}
@@ -117,6 +118,117 @@ class Primitives3DLayout(object):
     def _modeler(self):
         return self._app.modeler
 
+    @pyaedt_function_handler()
+    def prefetch_properties(self, assignment=None, properties=None):
+        """Load the properties of many objects and cache them.
+
+        AEDT has no bulk property getter, so the data is loaded with as few calls as possible:
+
+        - The net of each pin, via, and geometry is derived from one ``FindObjects`` call per net.
+        - The component information is loaded with one ``GetComponentInfo`` call per component.
+        - Other properties are loaded with one ``GetPropertyValue`` call per object and property,
+          so only the properties listed in ``properties`` are loaded.
+
+        Cached values are returned by the object properties, such as ``net_name``,
+        ``bounding_box``, ``placement_layer``, ``location``, and ``start_layer``, without
+        querying AEDT again. While the cache is active, the ``FindObjects`` results used by the
+        net properties are cached as well. The cache is cleared when the layout is modified through
+        PyAEDT or when the ``clear_property_cache()`` method is called.
+
+        Parameters
+        ----------
+        assignment : list, optional
+            Names of the objects or objects to load the properties of. The default is ``None``,
+            in which case all components, pins, vias, and geometries are loaded.
+        properties : list, optional
+            Names of other ``BaseElementTab`` properties to load, such as ``"PlacementLayer"``,
+            ``"Location"``, or ``"Start Layer"``. The default is ``None``, in which case only the nets
+            and the component information are loaded.
+
+        Returns
+        -------
+        bool
+            ``True`` when successful, ``False`` when failed.
+
+        References
+        ----------
+        >>> oEditor.FindObjects
+        >>> oEditor.GetComponentInfo
+        >>> oEditor.GetPropertyValue
+
+        Examples
+        --------
+        >>> from ansys.aedt.core import Hfss3dLayout
+        >>> h3d = Hfss3dLayout()
+        >>> h3d.modeler.prefetch_properties(list(h3d.modeler.pins))
+        >>> nets = {pin.name: pin.net_name for pin in h3d.modeler.pins.values()}
+        """
+        if assignment is None:
+            objects = list(self.components.values()) + list(self.pins.values()) + list(self.vias.values())
+            objects += list(self.geometries.values())
+        else:
+            objects = []
+            for obj in assignment:
+                if isinstance(obj, str):
+                    obj = self.components.get(obj, None) or self.pins.get(obj, None) or self[obj]
+                if obj is not None:
+                    objects.append(obj)
+        if self._find_objects_cache is None:
+            self._find_objects_cache = {}
+        net_objects = {obj.name for obj in objects if obj.prim_type != "component"}
+        if net_objects:
+            for net in self.nets:
+                for name in self._find_objects("Net", net):
+                    if name in net_objects:
+                        self._property_cache.setdefault(name, {})["Net"] = net
+        properties = [name for name in properties or [] if name != "Net"]
+        for obj in objects:
+            cached_properties = self._property_cache.setdefault(obj.name, {})
+            if obj.prim_type == "component":
+                cached_properties["ComponentInfo"] = self.oeditor.GetComponentInfo(obj.name)
+            for name in properties:
+                try:
+                    cached_properties[name] = self.oeditor.GetPropertyValue("BaseElementTab", obj.name, name)
+                except Exception:
+                    continue
+        return True
+
+    @pyaedt_function_handler()
+    def clear_property_cache(self):
+        """Clear the properties loaded with the ``prefetch_properties()`` method.
+
+        Returns
+        -------
+        bool
+            ``True`` when successful, ``False`` when failed.
+        """
+        self._property_cache = {}
+        self._find_objects_cache = None
+        return True
+
+    def _find_objects(self, key, value):
+        """Find object names with a ``FindObjects`` call.
+
+        Results are cached only while a ``prefetch_properties()`` cache is active.
+
+        Parameters
+        ----------
+        key : str
+            Search key, such as ``"Net"`` or ``"Type"``.
+        value : str
+            Search value.
+
+        Returns
+        -------
+        list
+            Object names.
+        """
+        if self._find_objects_cache is None:
+            return list(self.oeditor.FindObjects(key, value))
+        if (key, value) not in self._find_objects_cache:
+            self._find_objects_cache[(key, value)] = list(self.oeditor.FindObjects(key, value))
+        return self._find_objects_cache[(key, value)]
+
     @property
     def opadstackmanager(self):
         """Aedt oPadstackManager.
@@ -370,6 +482,7 @@ class Primitives3DLayout(object):
             List of added objects, List of removed names.
 
         """
+        self.clear_property_cache()
         families = [
             [["poly", "plg"], self._polygons, Polygons3DLayout],
             [["line", "arc"], self._lines, Line3dLayout],
@@ -966,6 +1079,7 @@ class Primitives3DLayout(object):
             arg.append("lowest_layer:="), arg.append(bot_layer)
 
             self.oeditor.CreateVia(arg)
+            self.clear_property_cache()
             if net:
                 self.oeditor.ChangeProperty(
                     [
@@ -1030,6 +1144,7 @@ class Primitives3DLayout(object):
         vArg2.append("r:="), vArg2.append(self.number_with_units(radius))
         vArg1.append(vArg2)
         self.oeditor.CreateCircle(vArg1)
+        self.clear_property_cache()
         primitive = Circle3dLayout(self, name, False)
         self._circles[name] = primitive
 
@@ -1090,6 +1205,7 @@ class Primitives3DLayout(object):
         vArg2.append(self.number_with_units(angle, "deg"))
         vArg1.append(vArg2)
         self.oeditor.CreateRectangle(vArg1)
+        self.clear_property_cache()
         primitive = Rect3dLayout(self, name, False)
         self._rectangles[name] = primitive
 
@@ -1145,6 +1261,7 @@ class Primitives3DLayout(object):
             vArg2.append("y:="), vArg2.append(point[1])
         vArg1.append(vArg2)
         self.oeditor.CreatePolygon(vArg1)
+        self.clear_property_cache()
         primitive = Polygons3DLayout(self, name, is_void=False)
         self._polygons[name] = primitive
 
@@ -1202,6 +1319,7 @@ class Primitives3DLayout(object):
             vArg2.append("y:="), vArg2.append(point[1])
         vArg1.append(vArg2)
         self.oeditor.CreatePolygonVoid(vArg1)
+        self.clear_property_cache()
         primitive = Polygons3DLayout(self, name, is_void=True)
         self._polygons[name] = primitive
 
@@ -1287,6 +1405,7 @@ class Primitives3DLayout(object):
             arg2.append(a[1])
         arg.append(arg2)
         self.oeditor.CreateLine(arg)
+        self.clear_property_cache()
         primitive = Line3dLayout(self, name, False)
         self._lines[name] = primitive
 
@@ -1447,6 +1566,7 @@ class Primitives3DLayout(object):
             drawing,
         ]
         comp_name = self.modeler.oeditor.CreateComponent(args)
+        self.clear_property_cache()
         comp = ComponentsSubCircuit3DLayout(self, comp_name.split(";")[-1])
         if is_3d_placement or pos_z != 0:
             comp.is_3d_placement = True
@@ -1508,6 +1628,7 @@ class Primitives3DLayout(object):
                 pins,
             ]
         )
+        self.clear_property_cache()
         comp = Components3DLayout(self, comp_name.split(";")[-1])
         return comp
 
@@ -115,6 +115,8 @@ class BoundaryCommon(PropsManager):
             self._app.oboundary.DeleteBoundaries([self.name])
             if self.name in self._app.excitation_objects.keys():
                 self._app.excitation_objects.pop(self.name)
+        self._app._boundaries.pop(self.name, None)
+        self._app._boundary_registry_changed()
         return True
 
     def _get_boundary_data(self, ds):
@@ -333,7 +335,9 @@ class BoundaryObject(BoundaryCommon, BinaryTreeNode):
     def name(self, value):
         if getattr(self, "child_object", None):
             try:
+                old_name = self._name
                 self.properties["Name"] = value
+                self._app._boundaries.pop(old_name, None)
                 self._app._boundaries[value] = self
             except KeyError:
                 self._app.logger.error("Name %s already assigned in the design", value)
@@ -542,7 +546,11 @@ class BoundaryObject(BoundaryCommon, BinaryTreeNode):
         else:
             return False
 
-        return self._initialize_tree_node()
+        if not self._initialize_tree_node():
+            return False
+        self._app._boundaries[self.name] = self
+        self._app._boundary_registry_changed()
+        return True
 
     @pyaedt_function_handler()
     def update(self):
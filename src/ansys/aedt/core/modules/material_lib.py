@@ -26,7 +26,6 @@
 from __future__ import absolute_import  # noreorder
 
 import copy
-import fnmatch
 import math
 import os
 import re
@@ -39,7 +38,9 @@ from ansys.aedt.core.generic.general_methods import open_file
 from ansys.aedt.core.generic.general_methods import pyaedt_function_handler
 from ansys.aedt.core.generic.general_methods import read_json
 from ansys.aedt.core.generic.general_methods import write_configuration_file
+from ansys.aedt.core.generic.library_index import LibraryIndex
 from ansys.aedt.core.generic.load_aedt_file import load_entire_aedt_file
+from ansys.aedt.core.generic.load_aedt_file import load_keyword_in_aedt_file_at_offset
 from ansys.aedt.core.generic.settings import settings
 from ansys.aedt.core.modules.material import MatProperties
 from ansys.aedt.core.modules.material import Material
@@ -47,6 +48,28 @@ from ansys.aedt.core.modules.material import SurfaceMaterial
 from ansys.aedt.core.modules.material_workbench import MaterialWorkbench
 
 
+def _index_amat_file(file_name):
+    """Get the names and the byte offsets of the materials defined in an AMAT file."""
+    mats = {}
+    _begin_search = re.compile(rb"^\$begin '(.+)'")
+    offset = 0
+    with open_file(file_name, "rb") as aedt_fh:
+        for line in aedt_fh:
+            b = _begin_search.search(line)
+            if b:
+                try:
+                    name = b.group(1).decode("utf-8")
+                except UnicodeDecodeError:
+                    name = None
+                if name and name not in ["$index$", "$base_index$"]:
+                    mats.setdefault(name, offset)
+            offset += len(line)
+    return mats
+
+
+_material_library_index = LibraryIndex("materials", "*.amat", _index_amat_file, check_files=True)
+
+
 class Materials(object):
     """Contains the AEDT materials database and all methods for creating and editing materials.
 
@@ -67,6 +90,10 @@ class Materials(object):
         self._color_id = 0
         self._mats = []
         self._mats_lower = []
+        self._mats_index = {}
+        self._mats_index_length = 0
+        self._library_materials = {}
+        self._library_material_props = {}
         self._desktop = self._app.odesktop
         self._oproject = self._app.oproject
         self.logger = self._app.logger
@@ -152,6 +179,15 @@ class Materials(object):
             self._mats_lower = [i.lower() for i in self._mat_names_aedt]
         return self._mats_lower
 
+    @property
+    def _mat_names_aedt_index(self):
+        if self._mats_index_length != len(self._mat_names_aedt):
+            self._mats_index = {}
+            for name in self._mat_names_aedt:
+                self._mats_index.setdefault(name.lower(), name)
+            self._mats_index_length = len(self._mat_names_aedt)
+        return self._mats_index
+
     @property
     def mat_names_aedt(self):
         """List material names."""
@@ -164,63 +200,52 @@ class Materials(object):
 
     @pyaedt_function_handler()
     def _read_materials(self):
-        def get_mat_list(file_name):
-            mats = []
-            _begin_search = re.compile(r"^\$begin '(.+)'")
-            with open_file(file_name, "rb") as aedt_fh:
-                raw_lines = aedt_fh.read().splitlines()
-                for line in raw_lines:
-                    try:
-                        ascii_line = line.decode("utf-8")
-                    except UnicodeDecodeError:
-                        continue
-                    b = _begin_search.search(ascii_line)
-                    if b:  # walk down a level
-                        mats.append(b.group(1))
-            return mats
-
-        amat_sys = [
-            os.path.join(dirpath, filename)
-            for dirpath, _, filenames in os.walk(self._app.syslib)
-            for filename in filenames
-            if fnmatch.fnmatch(filename, "*.amat")
-        ]
-        amat_personal = [
-            os.path.join(dirpath, filename)
-            for dirpath, _, filenames in os.walk(self._app.personallib)
-            for filename in filenames
-            if fnmatch.fnmatch(filename, "*.amat")
-        ]
-        amat_user = [
-            os.path.join(dirpath, filename)
-            for dirpath, _, filenames in os.walk(self._app.userlib)
-            for filename in filenames
-            if fnmatch.fnmatch(filename, "*.amat")
-        ]
-        amat_libs = amat_sys + amat_personal + amat_user
         mats = []
-        for amat in amat_libs:
-            # m = load_entire_aedt_file(amat)
-            # mats.extend(list(m.keys()))
-            mats.extend(get_mat_list(amat))
-        try:
-            mats.remove("$index$")
-        except ValueError:
-            pass
-        try:
-            mats.remove("$base_index$")
-        except ValueError:
-            pass
+        self._library_materials = {}
+        for library_path in [self._app.syslib, self._app.personallib, self._app.userlib]:
+            if not library_path:
+                continue
+            for amat, amat_mats in _material_library_index.get(library_path).items():
+                for mat_name, offset in amat_mats.items():
+                    mats.append(mat_name)
+                    self._library_materials.setdefault(mat_name.lower(), (amat, mat_name, offset))
         mats.extend(self.odefinition_manager.GetProjectMaterialNames())
         return mats
 
+    @pyaedt_function_handler()
+    def _read_library_material(self, material_name):
+        """Read the properties of a library material from its AMAT file.
+
+        The material definition is parsed the first time it is requested.
+
+        Parameters
+        ----------
+        material_name : str
+            Name of the material.
+
+        Returns
+        -------
+        dict
+            Material properties or an empty dictionary if the material is not in the libraries.
+        """
+        key = material_name.lower()
+        if key not in self._library_material_props:
+            if not self._mats:
+                self._mats = self._read_materials()
+            if key not in self._library_materials:
+                return {}
+            amat, mat_name, offset = self._library_materials[key]
+            data = load_keyword_in_aedt_file_at_offset(amat, mat_name, offset).get(mat_name, {})
+            if "MaterialDef" in data and mat_name in data["MaterialDef"]:
+                data = data["MaterialDef"][mat_name]
+            self._library_material_props[key] = data
+        return self._library_material_props[key]
+
     @pyaedt_function_handler()
     def _get_aedt_case_name(self, material_name):
         if material_name.lower() in self.material_keys:
             return self.material_keys[material_name.lower()].name
-        if material_name.lower() in self.mat_names_aedt_lower:
-            return self._mat_names_aedt[self.mat_names_aedt_lower.index(material_name.lower())]
-        return False
+        return self._mat_names_aedt_index.get(material_name.lower(), False)
 
     @pyaedt_function_handler()
     def _get_surface_materials(self):
@@ -291,12 +316,12 @@ class Materials(object):
             else:
                 return False
         if material.lower() in self.material_keys:
-            if material.lower() in self.mat_names_aedt_lower:
+            if material.lower() in self._mat_names_aedt_index:
                 return self.material_keys[material.lower()]
             if material.lower() not in list(self.odefinition_manager.GetProjectMaterialNames()):
                 self.material_keys[material.lower()].update()
             return self.material_keys[material.lower()]
-        elif material.lower() in self.mat_names_aedt_lower:
+        elif material.lower() in self._mat_names_aedt_index:
             return self._aedmattolibrary(material)
         elif settings.remote_api or settings.remote_rpc_session:
             return self._aedmattolibrary(material)
@@ -713,9 +738,12 @@ class Materials(object):
             matname = self._get_aedt_case_name(matname)
         props = {}
         _arg2dict(list(self.omaterial_manager.GetData(matname)), props)
-        values_view = props.values()
-        value_iterator = iter(values_view)
-        first_value = next(value_iterator)
+        if props:
+            first_value = next(iter(props.values()))
+        else:
+            first_value = self._read_library_material(matname)
+            if not first_value:
+                return False
         newmat = Material(self, matname, first_value, material_update=False)
         newmat._material_update = True
         self.material_keys[matname.lower()] = newmat
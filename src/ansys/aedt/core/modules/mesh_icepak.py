@@ -702,6 +702,13 @@ class MeshRegionCommon(BinaryTreeNode):
             "child_object",
             "auto_update",
             "_children",
+            "_children_loaded",
+            "_cache_props",
+            "_first_level_pending",
+            "_tree_child_object",
+            "_tree_root_object",
+            "_tree_child_getter",
+            "_tree_segments_node",
             "_BinaryTreeNode__first_level",
         ]
         if ("settings" in self.__dict__) and (name in self.settings):
@@ -1571,6 +1578,72 @@ class IcepakMesh(object):
         self._modeler.oeditor.UpdatePriorityList(args)
         return True
 
+    @pyaedt_function_handler()
+    def assign_priority_map(self, priorities):
+        """Assign priorities to many objects and components with a single call.
+
+        The whole priority list is built in memory and sent to AEDT with one
+        ``UpdatePriorityList`` call. Entities sharing the same priority number are
+        grouped in the same entry. Priorities previously added with the
+        ``add_priority()`` method are kept.
+
+        Parameters
+        ----------
+        priorities : dict
+            Dictionary with the names of the objects or components as keys
+            and their priority numbers as values.
+
+        Returns
+        -------
+        bool
+            ``True`` when successful, ``False`` when failed.
+
+        References
+        ----------
+        >>> oEditor.UpdatePriorityList
+
+        Examples
+        --------
+        >>> from ansys.aedt.core import Icepak
+        >>> app = Icepak()
+        >>> app.mesh.assign_priority_map({"Box1": 2, "Box2": 3, "Fan1_1": 3})
+        """
+        non_user_defined_component_parts = set(self._modeler.oeditor.GetChildNames())
+        objects = self._modeler.objects_by_name
+        user_defined_components = self._modeler.user_defined_components
+        entries = {}
+        for name, priority in priorities.items():
+            if name != "Region" and name in non_user_defined_component_parts and name in objects:
+                keys = [("Object", priority, ["2D", "3D"][int(objects[name].is3d)])]
+            elif name in user_defined_components:
+                dimensions = {part.is3d for part in user_defined_components[name].parts.values()}
+                keys = [
+                    ("Component", priority, dim) for is3d, dim in [(True, "3D"), (False, "2D")] if is3d in dimensions
+                ]
+            else:
+                self._app.logger.warning(f"Priority on {name} skipped. No object or component with this name.")
+                continue
+            for key in keys:
+                entries.setdefault(key, []).append(name)
+        if not entries:
+            return False
+        for (entity_type, priority, dimension), names in entries.items():
+            self._priorities_args.append(
+                [
+                    "NAME:PriorityListParameters",
+                    "EntityType:=",
+                    entity_type,
+                    "EntityList:=",
+                    ", ".join(names),
+                    "PriorityNumber:=",
+                    priority,
+                    "PriorityListType:=",
+                    dimension,
+                ]
+            )
+        self._modeler.oeditor.UpdatePriorityList(["NAME:UpdatePriorityListData"] + self._priorities_args)
+        return True
+
     @pyaedt_function_handler(objectlist="assignment")
     def assign_mesh_region(self, assignment=None, level=5, name=None, **kwargs):
         """Assign a predefined surface mesh level to an object.
@@ -1,8 +1,11 @@
 import socket
 import os
+import hashlib
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+import threading
 import random
 import tempfile
-import shutil
 import logging
 import signal
 import sys
@@ -19,6 +22,11 @@ import subprocess  # nosec
 
 import rpyc
 
+try:
+    import lz4.frame
+except ImportError:
+    lz4 = None
+
 logging.basicConfig(stream=sys.stderr, level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -35,11 +43,175 @@ from ansys.aedt.core import Mechanical
 from ansys.aedt.core.generic.aedt_versions import aedt_versions
 
 
+CHUNK_SIZE = 4 * 1024 * 1024
+PARTIAL_SUFFIX = ".part"
+
+
+def _file_hash(filename):
+    """Compute the SHA-256 hash of a file.
+
+    Parameters
+    ----------
+    filename : str
+        Path to the file.
+
+    Returns
+    -------
+    str
+        Hexadecimal digest.
+    """
+    digest = hashlib.sha256()
+    with open(filename, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _file_info(filename, compute_hash=True):
+    """Get the size and the hash of a file.
+
+    Parameters
+    ----------
+    filename : str
+        Path to the file.
+    compute_hash : bool, optional
+        Whether to compute the hash of the file. The default is ``True``.
+
+    Returns
+    -------
+    tuple or None
+        Size in bytes and SHA-256 digest of the file, or ``None`` if the file does not exist.
+    """
+    if not os.path.isfile(filename):
+        return None
+    return os.path.getsize(filename), _file_hash(filename) if compute_hash else ""
+
+
+def _compress(data, compression=None):
+    """Compress a chunk of data.
+
+    Parameters
+    ----------
+    data : bytes
+        Data to compress.
+    compression : str, optional
+        Compression algorithm. Options are ``"zlib"`` and ``"lz4"``.
+        The default is ``None``, in which case data is not compressed.
+
+    Returns
+    -------
+    bytes
+    """
+    if not compression:
+        return data
+    if compression == "zlib":
+        return zlib.compress(data, 1)
+    if compression == "lz4" and lz4 is not None:
+        return lz4.frame.compress(data)
+    raise ValueError(f"Compression {compression} is not available.")
+
+
+def _decompress(data, compression=None):
+    """Decompress a chunk of data compressed with :func:`_compress`.
+
+    Parameters
+    ----------
+    data : bytes
+        Data to decompress.
+    compression : str, optional
+        Compression algorithm. Options are ``"zlib"`` and ``"lz4"``.
+        The default is ``None``, in which case data is not compressed.
+
+    Returns
+    -------
+    bytes
+    """
+    if not compression:
+        return data
+    if compression == "zlib":
+        return zlib.decompress(data)
+    if compression == "lz4" and lz4 is not None:
+        return lz4.frame.decompress(data)
+    raise ValueError(f"Compression {compression} is not available.")
+
+
+def _read_chunk(filename, offset, size, compression=None):
+    """Read a chunk of a file and compress it."""
+    with open(filename, "rb") as f:
+        f.seek(offset)
+        return _compress(f.read(size), compression)
+
+
+def _write_chunk(filename, offset, data, compression=None):
+    """Decompress a chunk and write it at a given offset of the partial file of ``filename``."""
+    partial_file = filename + PARTIAL_SUFFIX
+    data = _decompress(data, compression)
+    with open(partial_file, "r+b" if os.path.exists(partial_file) else "wb") as f:
+        f.seek(offset)
+        f.write(data)
+        f.truncate()
+    return offset + len(data)
+
+
+def _partial_size(filename):
+    """Get the size of the partial file of ``filename``, or ``0`` if it does not exist."""
+    partial_file = filename + PARTIAL_SUFFIX
+    return os.path.getsize(partial_file) if os.path.isfile(partial_file) else 0
+
+
+def _finalize_file(filename, size):
+    """Move the partial file of ``filename`` to its final location once it has the expected size."""
+    partial_file = filename + PARTIAL_SUFFIX
+    if not os.path.exists(partial_file):
+        open(partial_file, "wb").close()
+    if os.path.getsize(partial_file) != size:
+        return False
+    os.replace(partial_file, filename)
+    return True
+
+
 class FileManagement(object):
-    """Class to manage file transfer."""
+    """Class to manage file transfer.
+
+    Files are transferred in chunks, optionally compressed, with several files
+    transferred in parallel, each worker on its own connection to the server.
+    Files whose size and hash already match on the other
+    side are skipped, and interrupted transfers resume from the partial file left
+    next to the destination.
+
+    Parameters
+    ----------
+    client : :class:`rpyc.core.protocol.Connection`
+        Connection to the server.
+    chunk_size : int, optional
+        Size in bytes of the chunks. The default is 4 MB.
+    compression : str, optional
+        Compression algorithm. Options are ``"zlib"`` and ``"lz4"``, which needs the ``lz4``
+        package on both sides. The default is ``None``, in which case data is not compressed.
+    workers : int, optional
+        Number of files to transfer in parallel. The default is ``1``. When greater than ``1``,
+        each worker opens its own connection to the server.
+    """
 
-    def __init__(self, client):
+    def __init__(self, client, chunk_size=CHUNK_SIZE, compression=None, workers=1):
         self.client = client
+        self.chunk_size = chunk_size
+        self.compression = compression
+        self.workers = workers
+        self._local = threading.local()
+
+    @property
+    def _root(self):
+        """Root of the connection of the current worker, or of the main connection."""
+        connection = getattr(self._local, "connection", None)
+        return connection.root if connection else self.client.root
+
+    def _server_address(self):
+        """Get the host and port of the server, or ``None`` if the connection is not a socket."""
+        try:
+            return self.client._channel.stream.sock.getpeername()[:2]
+        except Exception:
+            return None
 
     def upload(self, localpath, remotepath, overwrite=False):
         """Upload a file or a directory to the given remote path.
@@ -51,12 +223,17 @@ class FileManagement(object):
         remotepath : str
             Remote path.
         overwrite : bool, optional
-            Either if overwrite the local file or not.
+            Either if overwrite the remote file or not when it differs from the local one.
+
+        Returns
+        -------
+        dict
+            Dictionary with the ``"transferred"``, ``"skipped"`` and ``"failed"`` files.
         """
         if os.path.isdir(localpath):
-            self._upload_dir(localpath, remotepath)
+            return self._upload_dir(localpath, remotepath, overwrite=overwrite)
         elif os.path.isfile(localpath):
-            self._upload_file(localpath, remotepath)
+            return self._transfer([(localpath, remotepath)], self._upload_file, overwrite)
 
     def download_folder(self, remotepath, localpath, overwrite=True):
         """Download a directory from a given remote path to the local path.
@@ -68,9 +245,14 @@ class FileManagement(object):
         localpath : str
             Path to the local file or directory.
         overwrite : bool, optional
-            Either if overwrite the local file or not.
-            """
-        self._download_dir(remotepath, localpath, overwrite=True)
+            Either if overwrite the local file or not when it differs from the remote one.
+
+        Returns
+        -------
+        dict
+            Dictionary with the ``"transferred"``, ``"skipped"`` and ``"failed"`` files.
+        """
+        return self._download_dir(remotepath, localpath, overwrite=overwrite)
 
     def download_file(self, remotepath, localpath, overwrite=True):
         """Download a file from a given remote path to the local path.
@@ -82,65 +264,161 @@ class FileManagement(object):
         localpath : str
             Path to the local file or directory.
         overwrite : bool, optional
-            Either if overwrite the local file or not.
+            Either if overwrite the local file or not when it differs from the remote one.
+
+        Returns
+        -------
+        dict
+            Dictionary with the ``"transferred"``, ``"skipped"`` and ``"failed"`` files.
         """
-        self._download_file(remotepath, localpath, overwrite=overwrite)
+        return self._transfer([(remotepath, localpath)], self._download_file, overwrite)
+
+    def _transfer(self, files, transfer_file, overwrite):
+        results = {"transferred": [], "skipped": [], "failed": []}
+
+        address = self._server_address() if self.workers > 1 and len(files) > 1 else None
+        config = {key: self.client._config[key] for key in ["allow_public_attrs", "sync_request_timeout"]}
+        connections = []
+        lock = threading.Lock()
 
-    def _upload_file(self, local_file, remote_file, overwrite=False):
-        if self.client.root.pathexists(remote_file):
+        def run(paths):
+            try:
+                if address and getattr(self._local, "connection", None) is None:
+                    self._local.connection = rpyc.connect(*address, config=config)
+                    with lock:
+                        connections.append(self._local.connection)
+                return transfer_file(paths[0], paths[1], overwrite=overwrite)
+            except Exception as e:
+                logger.error("Transfer of %s failed: %s", paths[0], e)
+                return "failed"
+
+        if address:
+            try:
+                with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                    statuses = list(executor.map(run, files))
+            finally:
+                for connection in connections:
+                    connection.close()
+        else:
+            statuses = [run(paths) for paths in files]
+        for paths, status in zip(files, statuses):
+            results[status].append(paths[0])
+        return results
+
+    def _upload_file(self, local_file, remote_file, overwrite=False, retry=True):
+        root = self._root
+        size = os.path.getsize(local_file)
+        local_hash = None
+        remote_info = root.file_info(remote_file, False)
+        if remote_info:
+            if remote_info[0] == size:
+                local_hash = _file_hash(local_file)
+                if root.file_info(remote_file)[1] == local_hash:
+                    logger.info("File %s already exists on the server. Skipping it.", remote_file)
+                    return "skipped"
             if overwrite:
                 logger.warning("File already exists on server. Overwriting it.")
             else:
                 logger.error("File already exists on the server. Skipping it")
-                return False
-        new_file = self.client.root.create(remote_file)
-        local = open(local_file, "rb")
-        shutil.copyfileobj(local, new_file)
-        new_file.close()
+                return "skipped"
+        offset = root.partial_size(remote_file)
+        if offset > size:
+            offset = 0
+        resumed = offset > 0
+        with open(local_file, "rb") as f:
+            f.seek(offset)
+            while offset < size:
+                data = f.read(self.chunk_size)
+                if not data:
+                    break
+                new_offset = root.write_chunk(remote_file, offset, _compress(data, self.compression), self.compression)
+                if new_offset <= offset:
+                    break
+                offset = new_offset
+        if not root.finalize_file(remote_file, size):
+            logger.error("File %s was not uploaded correctly.", local_file)
+            return "failed"
+        if (resumed or not retry) and root.file_info(remote_file)[1] != (local_hash or _file_hash(local_file)):
+            root.unlink(remote_file)
+            if not retry:
+                logger.error("Upload of %s does not match the local file.", local_file)
+                return "failed"
+            logger.warning("Upload of %s does not match the local file. Uploading it again.", local_file)
+            return self._upload_file(local_file, remote_file, overwrite=overwrite, retry=False)
         logger.info("File %s uploaded to %s", local_file, remote_file)
+        return "transferred"
 
     def _upload_dir(self, localpath, remotepath, overwrite=False):
         if self.client.root.pathexists(remotepath):
             logger.warning("Folder already exists on the server.")
-        self.client.root.makedirs(remotepath)
-        i = 0
-        for fn in os.listdir(localpath):
-            lfn = os.path.join(localpath, fn)
-            rfn = remotepath + "/" + fn
-            if os.path.isdir(rfn):
-                self._upload_dir(lfn, rfn, overwrite=overwrite)
-            else:
-                self._upload_file(lfn, rfn, overwrite=overwrite)
-            i += 1
-        logger.info("Directory %s uploaded. %s files copied", localpath, i)
-
-    def _download_file(self, remote_file, local_file, overwrite=True):
-        if self.client.root.pathexists(local_file):
+        files = []
+        for root, _, file_names in os.walk(localpath):
+            relative = os.path.relpath(root, localpath)
+            remote_root = remotepath if relative == "." else remotepath + "/" + relative.replace(os.sep, "/")
+            self.client.root.makedirs(remote_root)
+            files.extend((os.path.join(root, fn), remote_root + "/" + fn) for fn in file_names)
+        results = self._transfer(files, self._upload_file, overwrite)
+        logger.info("Directory %s uploaded. %s files copied", localpath, len(results["transferred"]))
+        return results
+
+    def _download_file(self, remote_file, local_file, overwrite=True, retry=True):
+        root = self._root
+        size = root.file_info(remote_file, False)[0]
+        remote_hash = None
+        local_info = _file_info(local_file, False)
+        if local_info:
+            if local_info[0] == size:
+                remote_hash = root.file_info(remote_file)[1]
+                if _file_hash(local_file) == remote_hash:
+                    logger.info("File %s already exists on the client. Skipping it.", local_file)
+                    return "skipped"
             if overwrite:
                 logger.warning("File already exists on the client. Overwriting it.")
             else:
                 logger.warning("File already exists on the client, skipping it.")
-                return
-        remote = self.client.root.open(remote_file)
-        new_file = open(local_file, "wb")
-        shutil.copyfileobj(remote, new_file)
+                return "skipped"
+        offset = _partial_size(local_file)
+        if offset > size:
+            offset = 0
+        resumed = offset > 0
+        while offset < size:
+            data = root.read_chunk(remote_file, offset, self.chunk_size, self.compression)
+            new_offset = _write_chunk(local_file, offset, data, self.compression)
+            if new_offset <= offset:
+                break
+            offset = new_offset
+        if not _finalize_file(local_file, size):
+            logger.error("File %s was not downloaded correctly.", remote_file)
+            return "failed"
+        if (resumed or not retry) and _file_hash(local_file) != (remote_hash or root.file_info(remote_file)[1]):
+            os.remove(local_file)
+            if not retry:
+                logger.error("Download of %s does not match the remote file.", remote_file)
+                return "failed"
+            logger.warning("Download of %s does not match the remote file. Downloading it again.", remote_file)
+            return self._download_file(remote_file, local_file, overwrite=overwrite, retry=False)
         logger.info("File %s downloaded to %s", remote_file, local_file)
+        return "transferred"
 
     def _download_dir(self, remotepath, localpath, overwrite=True):
         if os.path.exists(localpath):
             logger.warning("Folder already exists on the local machine.")
-        if not os.path.isdir(localpath):
-            os.makedirs(localpath)
-        i = 0
-        for fn in self.client.root.listdir(remotepath):
-            lfn = os.path.join(localpath, fn)
-            rfn = remotepath + "/" + fn
-            if self.client.root.isdir(rfn):
-                self._download_dir(rfn, lfn, overwrite=overwrite)
-            else:
-                self._download_file(rfn, lfn, overwrite=overwrite)
-            i += 1
-        logger.info("Directory %s downloaded. %s files copied", localpath, i)
+        files = []
+        folders = [(remotepath, localpath)]
+        while folders:
+            remote_folder, local_folder = folders.pop()
+            if not os.path.isdir(local_folder):
+                os.makedirs(local_folder)
+            for fn in self.client.root.listdir(remote_folder):
+                lfn = os.path.join(local_folder, fn)
+                rfn = remote_folder + "/" + fn
+                if self.client.root.isdir(rfn):
+                    folders.append((rfn, lfn))
+                else:
+                    files.append((rfn, lfn))
+        results = self._transfer(files, self._download_file, overwrite)
+        logger.info("Directory %s downloaded. %s files copied", localpath, len(results["transferred"]))
+        return results
 
     def open_file(self, remote_file, open_options="r", encoding=None):
         return self.client.root.open(remote_file, open_options=open_options, encoding=encoding)
@@ -1056,6 +1334,26 @@ class GlobalService(rpyc.Service):
         f = open(filename, create_options, encoding=encoding)
         return rpyc.restricted(f, ["read", "readlines", "write", "writelines", "close"], [])
 
+    @staticmethod
+    def exposed_file_info(filename, compute_hash=True):
+        return _file_info(filename, compute_hash)
+
+    @staticmethod
+    def exposed_read_chunk(filename, offset, size, compression=None):
+        return _read_chunk(filename, offset, size, compression)
+
+    @staticmethod
+    def exposed_write_chunk(filename, offset, data, compression=None):
+        return _write_chunk(filename, offset, data, compression)
+
+    @staticmethod
+    def exposed_partial_size(filename):
+        return _partial_size(filename)
+
+    @staticmethod
+    def exposed_finalize_file(filename, size):
+        return _finalize_file(filename, size)
+
     @staticmethod
     def exposed_makedirs(remotepath):
         if os.path.exists(remotepath):
@@ -22,7 +22,6 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-import csv
 import logging
 import os
 import re
@@ -37,6 +36,15 @@ from ansys.aedt.core.generic.general_methods import pyaedt_function_handler
 from ansys.aedt.core.generic.load_aedt_file import load_keyword_in_aedt_file
 from ansys.aedt.core.modeler.geometry_operators import GeometryOperators
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    warnings.warn(
+        "The NumPy module is required to run functionalities of ansys.aedt.core.visualization.advanced.misc.\n"
+        "Install with \n\npip install numpy"
+    )
+    np = None
+
 try:
     import pyvista as pv
 except ImportError:  # pragma: no cover
@@ -47,48 +55,42 @@ except ImportError:  # pragma: no cover
     pv = None
 
 
-class BoxFacePointsAndFields(object):
-    """Data model class containing field component and coordinates."""
-
-    def __init__(self):
-        self.x = []
-        self.y = []
-        self.z = []
-        self.re = {"Ex": [], "Ey": [], "Ez": [], "Hx": [], "Hy": [], "Hz": []}
-        self.im = {"Ex": [], "Ey": [], "Ez": [], "Hx": [], "Hy": [], "Hz": []}
-
-    def set_xyz_points(self, x, y, z):
-        """Set X, Y, Z coordinates."""
-        self.x = x
-        self.y = y
-        self.z = z
-
-    def set_field_component(self, field_component, real, imag, invert):
-        """Set Field component Real and imaginary parts."""
-        if field_component in self.re:
-            if invert:
-                self.re[field_component] = [str(-float(i)) for i in real]
-                self.im[field_component] = [str(-float(i)) for i in imag]
-            else:
-                self.re[field_component] = real
-                self.im[field_component] = imag
-        else:
-            print("Error in set_field_component function.")
+_NEARFIELD_FACES = ["xmin", "xmax", "ymin", "ymax", "zmin", "zmax"]
+_NEARFIELD_COMPONENTS = ["Ex", "Ey", "Ez", "Hx", "Hy", "Hz"]
 
-    def fill_empty_data(self):
-        """Fill empty data with zeros."""
-        for el, val in self.re.items():
-            if not val:
-                zero_field_z_faces = [0] * len(self.x)
-                self.re[el] = zero_field_z_faces
-        for el, val in self.im.items():
-            if not val:
-                zero_field_z_faces = [0] * len(self.x)
-                self.im[el] = zero_field_z_faces
+
+def _read_nearfield_dat(data_file):
+    """Read a near field ``.dat`` file into a ``(n, 5)`` array, or a list of rows if NumPy is not available.
+
+    Each row contains the ``x``, ``y`` and ``z`` coordinates followed by the real and imaginary parts of the field.
+    """
+    with open_file(data_file, "r") as f:
+        if np is not None:
+            return np.loadtxt(f, dtype=float, ndmin=2, usecols=(0, 1, 2, 3, 4))
+        return [[float(value) for value in line.split()[:5]] for line in f if len(line.split()) >= 5]
+
+
+def _set_nearfield_component(faces, face, data, field_component, invert):
+    """Store the real and imaginary parts of a field component in the rows of a face."""
+    column = 3 + 2 * _NEARFIELD_COMPONENTS.index(field_component)
+    sign = -1.0 if invert else 1.0
+    if np is not None:
+        if face not in faces:
+            faces[face] = np.zeros((data.shape[0], 3 + 2 * len(_NEARFIELD_COMPONENTS)))
+            faces[face][:, :3] = data[:, :3]
+        faces[face][:, column : column + 2] = sign * data[: faces[face].shape[0], 3:5]
+        return
+    if face not in faces:
+        faces[face] = [row[:3] + [0.0] * 2 * len(_NEARFIELD_COMPONENTS) for row in data]
+    for face_row, row in zip(faces[face], data):
+        face_row[column] = sign * row[3]
+        face_row[column + 1] = sign * row[4]
 
 
 @pyaedt_function_handler()
-def convert_nearfield_data(dat_folder, frequency=6, invert_phase_for_lower_faces=True, output_folder=None):
+def convert_nearfield_data(
+    dat_folder, frequency=6, invert_phase_for_lower_faces=True, output_folder=None, binary_output=False
+):
     """Convert a near field data folder to hfss `nfd` file and link it to `and` file.
 
     Parameters
@@ -102,21 +104,21 @@ def convert_nearfield_data(dat_folder, frequency=6, invert_phase_for_lower_faces
         Add 180 deg for all fields at 'negative' faces (xmin, ymin, zmin).
     output_folder : str, optional
         Output folder where files will be saved.
+    binary_output : bool, optional
+        Whether to also save the converted data to a NumPy ``.npz`` file next to the ``.nfd`` file.
+        The binary file can be loaded with :func:`load_nearfield_binary_data` to skip text parsing.
+        The default is ``False``.
 
     Returns
     -------
     str
         Full path to `.and` file.
     """
-    file_keys = ["xmin", "xmax", "ymin", "ymax", "zmin", "zmax"]
-    components = {
-        "xmin": BoxFacePointsAndFields(),
-        "ymin": BoxFacePointsAndFields(),
-        "zmin": BoxFacePointsAndFields(),
-        "xmax": BoxFacePointsAndFields(),
-        "ymax": BoxFacePointsAndFields(),
-        "zmax": BoxFacePointsAndFields(),
-    }
+    if binary_output and np is None:  # pragma: no cover
+        logging.getLogger("Global").error("NumPy is required to save near field data in binary format.")
+        return False
+    # Each face holds rows with columns: x, y, z, re_ex, im_ex, re_ey, im_ey, ..., re_hz, im_hz
+    faces = {}
 
     file_names = search_files(dat_folder, "*.dat")
     for data_file in file_names:
@@ -126,44 +128,25 @@ def convert_nearfield_data(dat_folder, frequency=6, invert_phase_for_lower_faces
 
         if not os.path.exists(data_file):
             continue
-        # Read in all data for the current file
-        x, y, z = [], [], []
-        real, imag = [], []
-        with open_file(data_file, "r") as f:
-            for line in f:
-                line = line.strip().split(" ")
-                if len(line) == 5:
-                    x.append(line[0])
-                    y.append(line[1])
-                    z.append(line[2])
-                    real.append(line[3])
-                    imag.append(line[4])
-
-        if face not in components:
+        if face not in _NEARFIELD_FACES:
             raise RuntimeError("Wrong file name format. Face not found.")
+        if field_component not in _NEARFIELD_COMPONENTS:
+            logging.getLogger("Global").error("Field component %s not recognized." % field_component)
+            continue
 
-        if not components[face].x:
-            components[face].set_xyz_points(x, y, z)
-            components[face].fill_empty_data()
-        if "min" in face:
-            components[face].set_field_component(field_component, real, imag, invert_phase_for_lower_faces)
-        else:
-            components[face].set_field_component(field_component, real, imag, False)
-
-    full_data = []
-    index = 1
-    for el in list(file_keys):
-        for k in range(index, index + len(components[el].x)):
-            row = []
-            row.append(k)
-            row.append(components[el].x[k - index])
-            row.append(components[el].y[k - index])
-            row.append(components[el].z[k - index])
-            for field in ["Ex", "Ey", "Ez", "Hx", "Hy", "Hz"]:
-                row.append(components[el].re[field][k - index])
-                row.append(components[el].im[field][k - index])
-            full_data.append(row)
-        index += len(components[el].x)
+        # Read in all data for the current file. Points are defined by the first file read for each face
+        data = _read_nearfield_dat(data_file)
+        _set_nearfield_component(faces, face, data, field_component, invert_phase_for_lower_faces and "min" in face)
+
+    missing_faces = [face for face in _NEARFIELD_FACES if face not in faces]
+    if missing_faces:
+        raise RuntimeError("Near field data missing for faces: {}.".format(", ".join(missing_faces)))
+
+    if np is not None:
+        full_data = np.vstack([faces[face] for face in _NEARFIELD_FACES])
+        index = np.arange(1, full_data.shape[0] + 1)
+    else:
+        full_data = [row for face in _NEARFIELD_FACES for row in faces[face]]
 
     # WRITE .NFD FILE
     ####################################################################################################
@@ -180,25 +163,45 @@ def convert_nearfield_data(dat_folder, frequency=6, invert_phase_for_lower_faces
     commented_header_line += "Hx(real, imag), Hy(real, imag), Hz(real, imag)\n"
 
     with open_file(nfd_full_file, "w") as file:
-        writer = csv.writer(file, delimiter=",", lineterminator="\n")
         file.write(commented_header_line)
         file.write("Frequencies 1\n")
         file.write("Frequency " + str(frequency) + "GHz\n")
-        writer.writerows(full_data)
+        if np is not None:
+            np.savetxt(
+                file,
+                np.column_stack((index, full_data)),
+                fmt=["%d"] + ["%.10g"] * full_data.shape[1],
+                delimiter=",",
+            )
+        else:
+            for row_index, row in enumerate(full_data, 1):
+                file.write(",".join([str(row_index)] + ["%.10g" % value for value in row]) + "\n")
 
     print(".nfd file written to %s" % nfd_full_file)  # Prints if running ipy64 through external editor
 
-    size_x = float(components["xmax"].x[0]) - float(components["xmin"].x[0])
-    size_y = float(components["ymax"].y[0]) - float(components["ymin"].y[0])
-    size_z = float(components["zmax"].z[0]) - float(components["zmin"].z[0])
-
-    center_x = float(components["xmin"].x[0]) + float(size_x / 2.0)
-    center_y = float(components["ymin"].y[0]) + float(size_y / 2.0)
-    center_z = float(components["zmin"].z[0]) + float(size_z / 2.0)
-
-    sx_mm = size_x * 1000
-    sy_mm = size_y * 1000
-    sz_mm = size_z * 1000
+    if binary_output:
+        fields = full_data[:, 3::2] + 1j * full_data[:, 4::2]
+        npz_full_file = os.path.join(output_folder, directory_name + ".npz")
+        np.savez(
+            npz_full_file,
+            index=index,
+            points=full_data[:, :3],
+            e_field=fields[:, :3],
+            h_field=fields[:, 3:],
+            frequency=str(frequency) + "GHz",
+        )
+
+    size_x = faces["xmax"][0][0] - faces["xmin"][0][0]
+    size_y = faces["ymax"][0][1] - faces["ymin"][0][1]
+    size_z = faces["zmax"][0][2] - faces["zmin"][0][2]
+
+    center_x = float(faces["xmin"][0][0] + size_x / 2.0)
+    center_y = float(faces["ymin"][0][1] + size_y / 2.0)
+    center_z = float(faces["zmin"][0][2] + size_z / 2.0)
+
+    sx_mm = float(size_x) * 1000
+    sy_mm = float(size_y) * 1000
+    sz_mm = float(size_z) * 1000
     cx_mm = center_x * 1000
     cy_mm = center_y * 1000
     cz_mm = center_z * 1000
@@ -218,6 +221,44 @@ def convert_nearfield_data(dat_folder, frequency=6, invert_phase_for_lower_faces
     return and_full_file
 
 
+@pyaedt_function_handler()
+def load_nearfield_binary_data(file_path):
+    """Load near field data saved by :func:`convert_nearfield_data` in binary format.
+
+    Parameters
+    ----------
+    file_path : str
+        Full path to the ``.npz`` file.
+
+    Returns
+    -------
+    dict
+        Dictionary with ``"index"``, ``"points"``, ``"e_field"``, ``"h_field"`` and ``"frequency"`` keys.
+        Points are a ``(n, 3)`` array and fields are complex ``(n, 3)`` arrays.
+    """
+    if np is None:  # pragma: no cover
+        logging.getLogger("Global").error("NumPy is required to load near field binary data.")
+        return False
+    with np.load(file_path) as data:
+        return {
+            "index": data["index"],
+            "points": data["points"],
+            "e_field": data["e_field"],
+            "h_field": data["h_field"],
+            "frequency": str(data["frequency"]),
+        }
+
+
+def _split_curves(values, curves_info):
+    """Split a flat column into consecutive curves using the number of points of each curve."""
+    curves = []
+    start = 0
+    for curve_data in curves_info.values():
+        curves.append(values[start : start + curve_data[0]])
+        start += curve_data[0]
+    return curves
+
+
 @pyaedt_function_handler()
 def parse_rdat_file(file_path):
     """
@@ -237,7 +278,10 @@ def parse_rdat_file(file_path):
         report_dict[report_name] = {}
         for _, trace_data in report_data[report_name]["Traces"].items():
             all_data = trace_data["TraceComponents"]["TraceDataComps"]["0"]
+            curves_info = trace_data["CurvesInfo"]
+            curve_names = [curve_data[1] for curve_data in curves_info.values()]
             if all_data["TraceDataCol"]["ParameterType"] == "ComplexParam":
+                # Real and imaginary parts are interleaved
                 all_data_values = all_data["TraceDataCol"]["ColumnValues"]
                 all_re_values = all_data_values[0::2]
                 all_im_values = all_data_values[1::2]
@@ -250,18 +294,13 @@ def parse_rdat_file(file_path):
                     "y_unit": si_unit_y,
                     "curves": {},
                 }
-                for _, curve_data in trace_data["CurvesInfo"].items():
-                    report_dict[report_name][trace_data["TraceName"]]["curves"][curve_data[1] + "real"] = {
-                        "x_data": all_x_values[0 : curve_data[0]],
-                        "y_data": all_re_values[0 : curve_data[0]],
-                    }
-                    report_dict[report_name][trace_data["TraceName"]]["curves"][curve_data[1] + "imag"] = {
-                        "x_data": all_x_values[0 : curve_data[0]],
-                        "y_data": all_im_values[0 : curve_data[0]],
-                    }
-                    all_x_values = all_x_values[curve_data[0] :]
-                    all_re_values = all_re_values[curve_data[0] :]
-                    all_im_values = all_im_values[curve_data[0] :]
+                curves = report_dict[report_name][trace_data["TraceName"]]["curves"]
+                x_curves = _split_curves(all_x_values, curves_info)
+                re_curves = _split_curves(all_re_values, curves_info)
+                im_curves = _split_curves(all_im_values, curves_info)
+                for curve_name, x_data, re_data, im_data in zip(curve_names, x_curves, re_curves, im_curves):
+                    curves[curve_name + "real"] = {"x_data": x_data, "y_data": re_data}
+                    curves[curve_name + "imag"] = {"x_data": x_data, "y_data": im_data}
 
             else:
                 y_data = trace_data["TraceComponents"]["TraceDataComps"]["1"]
@@ -275,13 +314,11 @@ def parse_rdat_file(file_path):
                     "y_unit": si_unit_y,
                     "curves": {},
                 }
-                for _, curve_data in trace_data["CurvesInfo"].items():
-                    report_dict[report_name][trace_data["TraceName"]]["curves"][curve_data[1]] = {
-                        "x_data": all_x_values[0 : curve_data[0]],
-                        "y_data": all_y_values[0 : curve_data[0]],
-                    }
-                    all_x_values = all_x_values[curve_data[0] :]
-                    all_y_values = all_y_values[curve_data[0] :]
+                curves = report_dict[report_name][trace_data["TraceName"]]["curves"]
+                x_curves = _split_curves(all_x_values, curves_info)
+                y_curves = _split_curves(all_y_values, curves_info)
+                for curve_name, x_data, y_data in zip(curve_names, x_curves, y_curves):
+                    curves[curve_name] = {"x_data": x_data, "y_data": y_data}
 
     return report_dict
 
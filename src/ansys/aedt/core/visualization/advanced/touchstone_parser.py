@@ -22,8 +22,11 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+from concurrent.futures import ThreadPoolExecutor
 from copy import copy
+import hashlib
 import itertools
+import json
 import os
 import re
 import subprocess
@@ -72,32 +75,31 @@ class TouchstoneData(rf.Network):
     """Contains data information from Touchstone Read call."""
 
     def __init__(self, solution_data=None, touchstone_file=None):
+        self._port_index = {}
+        self._port_index_key = None
         if solution_data is not None:
             self.solution_data = solution_data
             freq_points = solution_data.primary_sweep_values
-            ports = []
-            for i in solution_data.expressions:
-                m = re.search(r"S\(\s*(\S+)\s*,\s*(\S+)\s*\)", i)
-                if m:
-                    ports.append(m.group(1))
-                    ports.append(m.group(2))
-
-            ports = list(set(ports))
-            ports.sort()
-            port_order = {ports.index(p): p for p in ports}
-            sdata_3d = np.zeros([len(freq_points), len(ports), len(ports)], dtype=complex)
+            port_couples = {}
             for expression in solution_data.expressions:
                 m = re.search(r"S\(\s*(\S+)\s*,\s*(\S+)\s*\)", expression)
                 if m:
-                    p_a = m.group(1)
-                    p_b = m.group(2)
-                p_a_number = ports.index(p_a)
-                p_b_number = ports.index(p_b)
-                sdata_real = solution_data.data_real(expression, True)
-                sdata_img = solution_data.data_imag(expression, True)
-                sdata_2d = np.array(sdata_real, dtype=complex) + 1j * np.array(sdata_img, dtype=complex)
-                sdata_3d[:, p_a_number, p_b_number] = sdata_2d
-                sdata_3d[:, p_b_number, p_a_number] = sdata_2d
+                    port_couples[expression] = (m.group(1), m.group(2))
+
+            ports = sorted(set(itertools.chain.from_iterable(port_couples.values())))
+            port_order = dict(enumerate(ports))
+            port_index = {p: i for i, p in enumerate(ports)}
+            sdata_3d = np.zeros([len(freq_points), len(ports), len(ports)], dtype=complex)
+            if port_couples:
+                expressions = list(port_couples.keys())
+                p_a_numbers = np.array([port_index[port_couples[e][0]] for e in expressions], dtype=int)
+                p_b_numbers = np.array([port_index[port_couples[e][1]] for e in expressions], dtype=int)
+                sdata_real = np.array([solution_data.data_real(e, True) for e in expressions], dtype=float)
+                sdata_img = np.array([solution_data.data_imag(e, True) for e in expressions], dtype=float)
+                # Each row is one expression, each column one frequency
+                sdata_2d = (sdata_real + 1j * sdata_img).T
+                sdata_3d[:, p_a_numbers, p_b_numbers] = sdata_2d
+                sdata_3d[:, p_b_numbers, p_a_numbers] = sdata_2d
 
             var = {}
             for name, value in solution_data.active_variation.items():
@@ -111,6 +113,34 @@ class TouchstoneData(rf.Network):
             rf.Network.__init__(self, touchstone_file)
         self.log_x = True
 
+    @property
+    def port_index(self):
+        """Map of port names to port indexes.
+
+        The map is built once and rebuilt only when the port names change.
+
+        Returns
+        -------
+        dict
+            Dictionary with port names as keys and port indexes as values.
+        """
+        key = tuple(self.port_names)
+        if key != self._port_index_key:
+            self._port_index = {}
+            for i, name in enumerate(key):
+                self._port_index.setdefault(name, i)
+            self._port_index_key = key
+        return self._port_index
+
+    def _port_indexes_from_prefix(self, prefix, case_sensitive=True):
+        """Get the indexes of all the ports whose names contain a prefix."""
+        if not prefix:
+            return list(range(len(self.port_names)))
+        if case_sensitive:
+            return [i for i, name in enumerate(self.port_names) if prefix in name]
+        prefix = prefix.lower()
+        return [i for i, name in enumerate(self.port_names) if prefix in name.lower()]
+
     @pyaedt_function_handler()
     def get_insertion_loss_index(self, threshold=-3):
         """Get all insertion losses.
@@ -128,18 +158,13 @@ class TouchstoneData(rf.Network):
             List of index couples representing Insertion Losses of excitations.
 
         """
-        temp_list = []
         s_db = self.s_db[0:2, :, :]
-        for i in self.port_tuples:
-            if i[0] != i[1]:
-                loss = s_db[0, i[0], i[1]]
-                if loss > threshold:
-                    temp_list.append(i)
-                elif loss < -90:
-                    loss = s_db[1, i[0], i[1]]
-                    if loss > threshold:
-                        temp_list.append(i)
-        return temp_list
+        first_loss = s_db[0]
+        second_loss = s_db[-1]
+        is_loss = (first_loss > threshold) | ((first_loss < -90) & (second_loss > threshold))
+        np.fill_diagonal(is_loss, False)
+        # Keep the ``port_tuples`` ordering, which iterates over columns first
+        return [(int(i), int(j)) for j, i in np.argwhere(is_loss.T)]
 
     def plot_insertion_losses(self, threshold=-3, plot=True):
         """Plot all insertion losses.
@@ -268,14 +293,9 @@ class TouchstoneData(rf.Network):
             List of index couples representing return losses of excitations.
 
         """
-        values = []
-        if excitation_name_prefix:
-            excitation_names = [i for i in self.port_names if excitation_name_prefix.lower() in i.lower()]
-        else:
-            excitation_names = [i for i in self.port_names]
-        for i in excitation_names:
-            values.append([self.port_names.index(i), self.port_names.index(i)])
-        return values
+        port_index = self.port_index
+        excitation_names = [self.port_names[i] for i in self._port_indexes_from_prefix(excitation_name_prefix, False)]
+        return [[port_index[i], port_index[i]] for i in excitation_names]
 
     @pyaedt_function_handler()
     def get_insertion_loss_index_from_prefix(self, tx_prefix, rx_prefix):
@@ -294,15 +314,13 @@ class TouchstoneData(rf.Network):
             List of index couples representing Insertion Losses of excitations.
 
         """
-        trlist = [i for i in self.port_names if tx_prefix in i]
-        receiver_list = [i for i in self.port_names if rx_prefix in i]
-        values = []
+        port_index = self.port_index
+        trlist = [self.port_names[i] for i in self._port_indexes_from_prefix(tx_prefix)]
+        receiver_list = [self.port_names[i] for i in self._port_indexes_from_prefix(rx_prefix)]
         if len(trlist) != len(receiver_list):
             logger.error("TX and RX should be same length lists.")
             return False
-        for i, j in zip(trlist, receiver_list):
-            values.append([self.port_names.index(i), self.port_names.index(j)])
-        return values
+        return [[port_index[i], port_index[j]] for i, j in zip(trlist, receiver_list)]
 
     @pyaedt_function_handler()
     def get_next_xtalk_index(self, tx_prefix=""):
@@ -321,17 +339,9 @@ class TouchstoneData(rf.Network):
         list
             List of index couples representing Near End XTalks.
         """
-        if tx_prefix:
-            trlist = [i for i in self.port_names if tx_prefix in i]
-        else:
-            trlist = self.port_names
-        values = []
-        for i in trlist:
-            k = trlist.index(i) + 1
-            while k < len(trlist):
-                values.append([self.port_names.index(i), self.port_names.index(trlist[k])])
-                k += 1
-        return values
+        port_index = self.port_index
+        trlist = [port_index[self.port_names[i]] for i in self._port_indexes_from_prefix(tx_prefix)]
+        return [[i, j] for i, j in itertools.combinations(trlist, 2)]
 
     @pyaedt_function_handler()
     def get_fext_xtalk_index_from_prefix(self, tx_prefix, rx_prefix, skip_same_index_couples=True):
@@ -354,13 +364,14 @@ class TouchstoneData(rf.Network):
         list
             List of index couples representing Far End XTalks.
         """
-        trlist = [i for i in self.port_names if tx_prefix in i]
-        reclist = [i for i in self.port_names if rx_prefix in i]
+        port_index = self.port_index
+        trlist = [port_index[self.port_names[i]] for i in self._port_indexes_from_prefix(tx_prefix)]
+        reclist = [port_index[self.port_names[i]] for i in self._port_indexes_from_prefix(rx_prefix)]
         values = []
-        for i in trlist:
-            for k in reclist:
-                if not skip_same_index_couples or reclist.index(k) != trlist.index(i):
-                    values.append([self.port_names.index(i), self.port_names.index(k)])
+        for tx_position, i in enumerate(trlist):
+            for rx_position, k in enumerate(reclist):
+                if not skip_same_index_couples or rx_position != tx_position:
+                    values.append([i, k])
         return values
 
     def plot_next_xtalk_losses(self, tx_prefix=""):
@@ -427,32 +438,40 @@ class TouchstoneData(rf.Network):
 
         Returns
         -------
-        tuple
+        tuple or bool
             Worst element, dictionary of ordered expression.
+            ``False`` when no frequency point is at or above ``freq_min``.
+            When the range holds less than two points, its first point is used.
         """
-        return_loss_freq = [float(i.center) for i in list(self.frequency)]
+        return_loss_freq = self.f
         if not freq_min:
             lower_id = 0
         else:
-            lower_id = next(x[0] for x in enumerate(return_loss_freq) if x[1] >= freq_min * 1e9)
-        if not freq_max:
+            lower_id = int(np.searchsorted(return_loss_freq, freq_min * 1e9, side="left"))
+        if not freq_max or freq_max * 1e9 >= return_loss_freq[-1]:
             higher_id = len(return_loss_freq) - 1
         else:
-            if freq_max * 1e9 >= return_loss_freq[-1]:
-                higher_id = len(return_loss_freq) - 1
-            else:
-                higher_id = next(x[0] for x in enumerate(return_loss_freq) if x[1] >= freq_max * 1e9)
+            higher_id = int(np.searchsorted(return_loss_freq, freq_max * 1e9, side="left"))
+        if lower_id >= len(return_loss_freq):
+            logger.error(f"No frequency point at or above {freq_min} GHz.")
+            return False
+        if higher_id <= lower_id:
+            # Narrow range or single frequency point: use the first point of the range.
+            higher_id = lower_id + 1
 
-        dict_means = {}
         if not curve_list:
-            curve_list = list(itertools.combinations(range(0, len(self.port_names)), 2))
-            for i in range(0, len(self.port_names)):
-                curve_list.append([i, i])
-        for el in curve_list:
-            data1 = np.absolute(self.s[lower_id:higher_id, el[0], el[1]])
-            mean1 = sum(data1) / len(data1)
-            dict_means[tuple(el)] = mean1
-        dict_means = dict(sorted(dict_means.items(), key=lambda item: item[1], reverse=worst_is_higher))
+            rows, columns = np.triu_indices(len(self.port_names), k=1)
+            diagonal = np.arange(len(self.port_names))
+            rows = np.concatenate((rows, diagonal))
+            columns = np.concatenate((columns, diagonal))
+        else:
+            rows = np.array([el[0] for el in curve_list], dtype=int)
+            columns = np.array([el[1] for el in curve_list], dtype=int)
+
+        # Mean magnitude of all the curves in one reduction over the frequency axis
+        means = np.absolute(self.s[lower_id:higher_id, rows, columns]).mean(axis=0)
+        order = np.argsort(-means if worst_is_higher else means, kind="stable")
+        dict_means = {(int(rows[i]), int(columns[i])): means[i] for i in order}
         worst_el = next(iter(dict_means))
         if plot:  # pragma: no cover
             self.plot_s_db(*worst_el, logx=self.log_x)
@@ -479,10 +498,141 @@ def read_touchstone(input_file):
     return data
 
 
+_touchstone_check_cache = {}
+
+
+def _genequiv_path():
+    """Get the path to the ``genequiv`` executable of the first installed AEDT version."""
+    aedt_install_folder = list(aedt_versions.installed_versions.values())[0]
+    if os.name == "nt":
+        return os.path.join(aedt_install_folder, "genequiv.exe")
+    return os.path.join(aedt_install_folder, "genequiv")
+
+
+def _touchstone_file_hash(file_path):
+    """Compute the SHA-256 hash of a Touchstone file."""
+    file_hash = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+
+def _parse_genequiv_output(output_str, passivity=True, causality=True):
+    """Parse the output of ``genequiv`` into a list of checks."""
+    checks = []
+    output_lst = output_str.split("\\r\\n")
+
+    if len(output_lst) == 1:
+        output_lst = output_str.splitlines()
+    for line in output_lst:
+        if "Input data" in line and passivity:
+            msg_log = line[17:]
+            is_passive = True
+            if "non-passive" in msg_log:
+                is_passive = False
+            checks.append(["passivity", is_passive, msg_log])
+        if "Maximum causality" in line and causality:
+            msg_log = line[17:]
+            is_causal = True
+            try:
+                causality_check = float(msg_log.split("Maximum causality error: ")[-1].split("for entry")[0])
+                if not causality_check == 0.0:
+                    is_causal = False
+            except Exception:
+                is_causal = False
+                raise Exception("Failed evaluating causality value.")
+            checks.append(["causality", is_causal, msg_log])
+        if "Causality check is inconclusive" in line and causality:
+            is_causal = False
+            checks.append(["causality", is_causal, line[17:]])
+    return checks
+
+
+def _check_touchstone_file(cmd, passivity, causality, timeout):
+    """Run ``genequiv`` on one Touchstone file and return the status and the list of checks."""
+    try:
+        my_env = os.environ.copy()
+        p = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=my_env, timeout=timeout)  # nosec
+    except subprocess.TimeoutExpired:
+        return "timeout", []
+    return "done", _parse_genequiv_output(str(p.stdout), passivity, causality)
+
+
+@pyaedt_function_handler()
+def _run_touchstone_checks(input_dir, passivity, causality, max_workers, timeout, cache_file):
+    """Check all Touchstone files of a folder with a bounded pool of ``genequiv`` processes.
+
+    Returns
+    -------
+    list
+        List of dictionaries, one for each file, with ``"file"``, ``"path"``, ``"status"``, ``"cached"``
+        and ``"checks"`` keys.
+    """
+    results = []
+    snp_files = find_touchstone_files(input_dir)
+    if not snp_files:
+        return results
+
+    if cache_file and os.path.exists(cache_file):
+        try:
+            with open(cache_file, "r") as f:
+                _touchstone_check_cache.update(json.load(f))
+        except (OSError, ValueError):
+            logger.warning(f"Touchstone check cache file {cache_file} cannot be read.")
+
+    cmd = [_genequiv_path()]
+    if passivity:
+        cmd.append("-checkpassivity")
+    if causality:
+        cmd.append("-checkcausality")
+
+    to_run = {}
+    for snpf, file_path in snp_files.items():
+        cache_key = f"{_touchstone_file_hash(file_path)}:{int(passivity)}{int(causality)}"
+        result = {"file": snpf, "path": file_path, "status": "done", "cached": False, "checks": []}
+        if cache_key in _touchstone_check_cache:
+            result["cached"] = True
+            result["checks"] = copy(_touchstone_check_cache[cache_key])
+        else:
+            to_run[snpf] = cache_key
+        results.append(result)
+
+    if to_run:
+        if not max_workers:
+            max_workers = min(len(to_run), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                snpf: executor.submit(_check_touchstone_file, cmd + [snp_files[snpf]], passivity, causality, timeout)
+                for snpf in to_run
+            }
+            for result in results:
+                if result["file"] not in futures:
+                    continue
+                result["status"], result["checks"] = futures[result["file"]].result()
+                if result["status"] == "timeout":
+                    logger.warning(f"Touchstone check of {result['file']} timed out after {timeout} seconds.")
+                else:
+                    _touchstone_check_cache[to_run[result["file"]]] = result["checks"]
+
+        if cache_file:
+            try:
+                with open(cache_file, "w") as f:
+                    json.dump(_touchstone_check_cache, f, indent=2)
+            except OSError:
+                logger.warning(f"Touchstone check cache file {cache_file} cannot be written.")
+    return results
+
+
 @pyaedt_function_handler(folder="input_dir")
-def check_touchstone_files(input_dir="", passivity=True, causality=True):
+def check_touchstone_files(
+    input_dir="", passivity=True, causality=True, max_workers=None, timeout=None, cache_file=None
+):
     """Check passivity and causality for all Touchstone files included in the folder.
 
+    Files are checked in parallel by a bounded pool of ``genequiv`` processes. Results are cached by
+    file hash, so unchanged files are not checked again.
+
     Parameters
     ----------
     input_dir : str
@@ -491,6 +641,15 @@ def check_touchstone_files(input_dir="", passivity=True, causality=True):
         Whether the passivity check is enabled, The default is ``True``.
     causality : bool, optional
         Whether the causality check is enabled. The default is ``True``.
+    max_workers : int, optional
+        Maximum number of files checked at the same time. The default is ``None``,
+        in which case the number of CPUs is used.
+    timeout : float, optional
+        Maximum time in seconds allowed for the check of each file. The default is ``None``,
+        in which case there is no time limit. Files that time out have an empty list of checks.
+    cache_file : str, optional
+        Full path to a JSON file where check results are stored between sessions.
+        The default is ``None``, in which case results are cached only in memory.
 
     Returns
     -------
@@ -501,54 +660,57 @@ def check_touchstone_files(input_dir="", passivity=True, causality=True):
         is a string with the log information.
 
     """
-    out = {}
-    sNpFiles = find_touchstone_files(input_dir)
-    if not sNpFiles:
-        return out
-    aedt_install_folder = list(aedt_versions.installed_versions.values())[0]
-    for snpf in sNpFiles:
-        out[snpf] = []
-        if os.name == "nt":
-            genequiv_path = os.path.join(aedt_install_folder, "genequiv.exe")
-        else:
-            genequiv_path = os.path.join(aedt_install_folder, "genequiv")
-        cmd = [genequiv_path]
-        if passivity:
-            cmd.append("-checkpassivity")
-        if causality:
-            cmd.append("-checkcausality")
-
-        cmd.append(sNpFiles[snpf])
-        my_env = os.environ.copy()
-        p = subprocess.Popen(cmd, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=my_env)  # nosec
-        output = p.communicate()
-        output_str = str(output[0])
-        output_lst = output_str.split("\\r\\n")
-
-        if len(output_lst) == 1:
-            output_lst = output_str.splitlines()
-        for line in output_lst:
-            if "Input data" in line and passivity:
-                msg_log = line[17:]
-                is_passive = True
-                if "non-passive" in msg_log:
-                    is_passive = False
-                out[snpf].append(["passivity", is_passive, msg_log])
-            if "Maximum causality" in line and causality:
-                msg_log = line[17:]
-                is_causal = True
-                try:
-                    causality_check = float(msg_log.split("Maximum causality error: ")[-1].split("for entry")[0])
-                    if not causality_check == 0.0:
-                        is_causal = False
-                except Exception:
-                    is_causal = False
-                    raise Exception("Failed evaluating causality value.")
-                out[snpf].append(["causality", is_causal, msg_log])
-            if "Causality check is inconclusive" in line and causality:
-                is_causal = False
-                out[snpf].append(["causality", is_causal, line[17:]])
-    return out
+    results = _run_touchstone_checks(input_dir, passivity, causality, max_workers, timeout, cache_file)
+    return {result["file"]: result["checks"] for result in results}
+
+
+@pyaedt_function_handler()
+def touchstone_check_summary(
+    input_dir="", passivity=True, causality=True, max_workers=None, timeout=None, cache_file=None
+):
+    """Check passivity and causality for all Touchstone files in a folder and get a summary table.
+
+    Parameters
+    ----------
+    input_dir : str
+        Folder path. The default is ``""``.
+    passivity : bool, optional
+        Whether the passivity check is enabled, The default is ``True``.
+    causality : bool, optional
+        Whether the causality check is enabled. The default is ``True``.
+    max_workers : int, optional
+        Maximum number of files checked at the same time. The default is ``None``,
+        in which case the number of CPUs is used.
+    timeout : float, optional
+        Maximum time in seconds allowed for the check of each file. The default is ``None``,
+        in which case there is no time limit.
+    cache_file : str, optional
+        Full path to a JSON file where check results are stored between sessions.
+        The default is ``None``, in which case results are cached only in memory.
+
+    Returns
+    -------
+    list
+        List of dictionaries, one row for each file, with ``"file"``, ``"status"``, ``"cached"``,
+        ``"passivity"``, ``"passivity_log"``, ``"causality"`` and ``"causality_log"`` keys.
+        Status is ``"done"`` or ``"timeout"``. Check values are ``None`` when the check was not run.
+    """
+    summary = []
+    for result in _run_touchstone_checks(input_dir, passivity, causality, max_workers, timeout, cache_file):
+        row = {
+            "file": result["file"],
+            "status": result["status"],
+            "cached": result["cached"],
+            "passivity": None,
+            "passivity_log": "",
+            "causality": None,
+            "causality_log": "",
+        }
+        for check_name, check_value, check_log in result["checks"]:
+            row[check_name] = check_value if row[check_name] is None else row[check_name] and check_value
+            row[check_name + "_log"] = check_log
+        summary.append(row)
+    return summary
 
 
 @pyaedt_function_handler()
@@ -0,0 +1,295 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2024 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Streaming of animation frames.
+
+Text frames are converted on first read to a binary cache with a JSON sidecar that stores
+the shape of the data and the range of each column. Later reads memory-map the cache, and
+color ranges are computed from the sidecars without loading the frames.
+:class:`FramePrefetcher` loads the frames in a background thread and keeps only a small
+window of them in memory.
+"""
+
+import csv
+import itertools
+import json
+import os
+import queue
+import threading
+import warnings
+
+from ansys.aedt.core.generic.general_methods import pyaedt_function_handler
+from ansys.aedt.core.generic.settings import settings
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+_CACHE_FOLDER = ".pyaedt_frames"
+
+
+def _cache_paths(frame_file, cache_directory=None):
+    if not cache_directory:
+        cache_directory = os.path.join(os.path.dirname(os.path.abspath(frame_file)), _CACHE_FOLDER)
+    base_name = os.path.join(cache_directory, os.path.basename(frame_file))
+    return base_name + ".bin", base_name + ".json"
+
+
+def _read_info(frame_file, header_lines, info_path, data_path):
+    try:
+        with open(info_path, "r") as f:
+            info = json.load(f)
+    except (OSError, ValueError):
+        return None
+    source = os.stat(frame_file)
+    if (
+        info.get("source_mtime") != source.st_mtime
+        or info.get("source_size") != source.st_size
+        or info.get("header_lines") != header_lines
+        or not os.path.exists(data_path)
+    ):
+        return None
+    return info
+
+
+@pyaedt_function_handler()
+def convert_frame(frame_file, header_lines=1, cache_directory=None, chunk_size=200000):
+    """Convert a text frame to the binary frame cache.
+
+    The file is parsed in chunks, so only one chunk is held in memory. The conversion is
+    skipped when a cache of the same file already exists.
+
+    Parameters
+    ----------
+    frame_file : str
+        Full path to the frame file. Columns are separated by commas in CSV files and by spaces otherwise.
+    header_lines : int, optional
+        Number of header lines to skip. The default is ``1``.
+    cache_directory : str, optional
+        Directory of the cache. The default is ``None``, in which case a ``.pyaedt_frames``
+        directory next to the frame file is used.
+    chunk_size : int, optional
+        Number of lines parsed at once. The default is ``200000``.
+
+    Returns
+    -------
+    dict
+        Cache information with the ``"rows"`` and ``"columns"`` of the frame and the
+        ``"min"`` and ``"max"`` values of each column.
+    """
+    data_path, info_path = _cache_paths(frame_file, cache_directory)
+    info = _read_info(frame_file, header_lines, info_path, data_path)
+    if info:
+        return info
+    os.makedirs(os.path.dirname(data_path), exist_ok=True)
+    source = os.stat(frame_file)
+    rows = 0
+    columns = 0
+    mins = None
+    maxs = None
+    partial_path = data_path + ".part"
+    with open(frame_file, "r") as f, open(partial_path, "wb") as out:
+        lines = itertools.islice(f, header_lines, None)
+        delimiter = None
+        while True:
+            chunk_lines = [line for line in itertools.islice(lines, chunk_size) if line.strip()]
+            if not chunk_lines:
+                break
+            if rows == 0 and ".csv" in frame_file:
+                delimiter = csv.Sniffer().sniff(chunk_lines[0]).delimiter
+            chunk = np.loadtxt(chunk_lines, delimiter=delimiter, ndmin=2, dtype=np.float64)
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", RuntimeWarning)
+                chunk_min = np.nanmin(chunk, axis=0)
+                chunk_max = np.nanmax(chunk, axis=0)
+            mins = chunk_min if mins is None else np.fmin(mins, chunk_min)
+            maxs = chunk_max if maxs is None else np.fmax(maxs, chunk_max)
+            columns = chunk.shape[1]
+            rows += chunk.shape[0]
+            out.write(chunk.tobytes())
+    os.replace(partial_path, data_path)
+    info = {
+        "source_mtime": source.st_mtime,
+        "source_size": source.st_size,
+        "header_lines": header_lines,
+        "rows": rows,
+        "columns": columns,
+        "min": [] if mins is None else [float(i) for i in mins],
+        "max": [] if maxs is None else [float(i) for i in maxs],
+    }
+    with open(info_path + ".part", "w") as f:
+        json.dump(info, f)
+    os.replace(info_path + ".part", info_path)
+    return info
+
+
+@pyaedt_function_handler()
+def read_frame(frame_file, header_lines=1, cache_directory=None):
+    """Read a text frame through the binary frame cache.
+
+    Parameters
+    ----------
+    frame_file : str
+        Full path to the frame file.
+    header_lines : int, optional
+        Number of header lines to skip. The default is ``1``.
+    cache_directory : str, optional
+        Directory of the cache. The default is ``None``, in which case a ``.pyaedt_frames``
+        directory next to the frame file is used.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        Read-only memory-mapped array with one row per point.
+    """
+    info = convert_frame(frame_file, header_lines, cache_directory)
+    if not info["rows"]:
+        return np.empty((0, info["columns"]))
+    data_path, _ = _cache_paths(frame_file, cache_directory)
+    return np.memmap(data_path, dtype=np.float64, mode="r", shape=(info["rows"], info["columns"]))
+
+
+@pyaedt_function_handler()
+def frame_statistics(frame_files, column=3, header_lines=1, cache_directory=None):
+    """Compute the range of a column over several text frames.
+
+    Frames are converted one at a time, and the range is read from the cache information.
+
+    Parameters
+    ----------
+    frame_files : list
+        Full paths to the frame files.
+    column : int, optional
+        Index of the column. The default is ``3``, which is the field value. Negative indices
+        count from the last column.
+    header_lines : int, optional
+        Number of header lines to skip. The default is ``1``.
+    cache_directory : str, optional
+        Directory of the cache. The default is ``None``, in which case a ``.pyaedt_frames``
+        directory next to each frame file is used.
+
+    Returns
+    -------
+    tuple
+        Minimum and maximum values. Both are ``None`` when the frames have no values.
+    """
+    v_min = None
+    v_max = None
+    for frame_file in frame_files:
+        info = convert_frame(frame_file, header_lines, cache_directory)
+        if not info["rows"] or np.isnan(info["min"][column]):
+            continue
+        v_min = info["min"][column] if v_min is None else min(v_min, info["min"][column])
+        v_max = info["max"][column] if v_max is None else max(v_max, info["max"][column])
+    return v_min, v_max
+
+
+class _FrameError(object):
+    def __init__(self, index, error):
+        self.index = index
+        self.error = error
+
+
+class FramePrefetcher(object):
+    """Load frames in a background thread with a bounded lookahead.
+
+    Iterating over the prefetcher returns the loaded frames in order. At most ``lookahead``
+    frames wait in memory while the consumer processes the current one.
+
+    Parameters
+    ----------
+    count : int
+        Number of frames.
+    load : callable
+        Function that takes the index of a frame and returns the loaded frame.
+    lookahead : int, optional
+        Number of frames loaded ahead of the consumer. The default is ``4``.
+
+    Examples
+    --------
+    >>> from ansys.aedt.core.visualization.plot.frame_stream import FramePrefetcher, read_frame
+    >>> with FramePrefetcher(len(files), lambda i: read_frame(files[i])) as frames:
+    ...     for frame in frames:
+    ...         print(frame.shape)
+    """
+
+    def __init__(self, count, load, lookahead=4):
+        self.count = count
+        self._load = load
+        self._queue = queue.Queue(maxsize=max(1, lookahead))
+        self._stop = threading.Event()
+        self._thread = None
+        self._delivered = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._delivered >= self.count or self._stop.is_set():
+            raise StopIteration
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="pyaedt-frame-prefetch", daemon=True)
+            self._thread.start()
+        item = self._queue.get()
+        self._delivered += 1
+        if isinstance(item, _FrameError):
+            self.close()
+            raise RuntimeError(f"Failed to load frame {item.index}.") from item.error
+        return item
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _run(self):
+        for index in range(self.count):
+            if self._stop.is_set():
+                return
+            try:
+                item = self._load(index)
+            except Exception as e:
+                settings.logger.debug(f"Failed to load frame {index}: {e}")
+                item = _FrameError(index, e)
+            while not self._stop.is_set():
+                try:
+                    self._queue.put(item, timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+            if isinstance(item, _FrameError):
+                return
+
+    def close(self):
+        """Stop the background thread and release the loaded frames."""
+        self._stop.set()
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
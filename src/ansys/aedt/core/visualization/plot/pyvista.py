@@ -36,6 +36,10 @@ from ansys.aedt.core.generic.constants import AEDT_UNITS
 from ansys.aedt.core.generic.constants import CSS4_COLORS
 from ansys.aedt.core.generic.general_methods import open_file
 from ansys.aedt.core.generic.general_methods import pyaedt_function_handler
+from ansys.aedt.core.visualization.plot.frame_stream import FramePrefetcher
+from ansys.aedt.core.visualization.plot.frame_stream import convert_frame
+from ansys.aedt.core.visualization.plot.frame_stream import frame_statistics
+from ansys.aedt.core.visualization.plot.frame_stream import read_frame
 
 try:
     import numpy as np
@@ -440,6 +444,9 @@ class CommonPlotter(object):
         self._z_scale = 1.0
         self._convert_fields_in_db = False
         self._log_multiplier = 10.0
+        self.stream_frames = False
+        self.frames_lookahead = 4
+        self.frames_cache_directory = None
 
     @property
     def convert_fields_in_db(self):
@@ -893,6 +900,9 @@ class ModelPlotter(CommonPlotter):
         label_name="Field",
         surface_mapping_tolerance=1e-3,
         header_lines=2,
+        streaming=False,
+        lookahead=4,
+        cache_directory=None,
     ):
         """Add a field file to the scenario. It can be aedtplt, fld or csv file.
 
@@ -914,11 +924,24 @@ class ModelPlotter(CommonPlotter):
             Delauny tolerance value used for interpolating points.
         header_lines : int
             Number of lines to of the file containing header info that has to be removed.
+        streaming : bool, optional
+            Whether to load the frames in a background thread during the animation instead of
+            reading all of them before it starts. Text frames are converted to a binary cache on
+            first read. The default is ``False``.
+        lookahead : int, optional
+            Number of frames loaded ahead of the displayed one when streaming. The default is ``4``.
+        cache_directory : str, optional
+            Directory of the binary cache of text frames. The default is ``None``, in which case
+            a ``.pyaedt_frames`` directory next to each frame file is used.
 
         Returns
         -------
         bool
         """
+        if streaming:
+            self.stream_frames = True
+            self.frames_lookahead = lookahead
+            self.frames_cache_directory = cache_directory
         for field in field_files:
             self._frames.append(
                 FieldClass(
@@ -1002,111 +1025,169 @@ class ModelPlotter(CommonPlotter):
                 obj_to_iterate.append(i)
         for field in obj_to_iterate:
             if field.path and not field._cached_polydata:
-                if ".case" in field.path:
-                    reader = pv.get_reader(os.path.abspath(field.path)).read()
-                    field._cached_polydata = reader[reader.keys()[0]].extract_surface()
-
-                    if (
-                        hasattr(field._cached_polydata.point_data, "active_vectors")
-                        and field._cached_polydata.point_data.active_vectors_name
-                    ):
-                        field.scalar_name = field._cached_polydata.point_data.active_scalars_name
-                        vector_scale = (max(field._cached_polydata.bounds) - min(field._cached_polydata.bounds)) / (
-                            10
-                            * (
-                                np.vstack(field._cached_polydata.active_vectors).max()
-                                - np.vstack(field._cached_polydata.active_vectors).min()
-                            )
-                        )
-                        field._cached_polydata["vectors"] = field._cached_polydata.active_vectors * vector_scale
+                self._read_field(field)
 
-                        field.is_vector = True
-                    else:
-                        field.scalar_name = field._cached_polydata.point_data.active_scalars_name
-
-                elif ".aedtplt" in field.path:  # pragma no cover
-                    vertices, faces, scalars, log1 = _parse_aedtplt(field.path)
-                    if self.convert_fields_in_db:
-                        scalars = [np.multiply(np.log10(i), self.log_multiplier) for i in scalars]
-                    fields_vals = pv.PolyData(vertices[0], faces[0])
-                    field._cached_polydata = fields_vals
-                    if isinstance(scalars[0], list):
-                        vector_scale = (max(fields_vals.bounds) - min(fields_vals.bounds)) / (
-                            50 * (np.vstack(scalars[0]).max() - np.vstack(scalars[0]).min())
-                        )
+    @pyaedt_function_handler()
+    def _read_field(self, field):
+        if ".case" in field.path:
+            reader = pv.get_reader(os.path.abspath(field.path)).read()
+            field._cached_polydata = reader[reader.keys()[0]].extract_surface()
+
+            if (
+                hasattr(field._cached_polydata.point_data, "active_vectors")
+                and field._cached_polydata.point_data.active_vectors_name
+            ):
+                field.scalar_name = field._cached_polydata.point_data.active_scalars_name
+                vector_scale = (max(field._cached_polydata.bounds) - min(field._cached_polydata.bounds)) / (
+                    10
+                    * (
+                        np.vstack(field._cached_polydata.active_vectors).max()
+                        - np.vstack(field._cached_polydata.active_vectors).min()
+                    )
+                )
+                field._cached_polydata["vectors"] = field._cached_polydata.active_vectors * vector_scale
 
-                        field._cached_polydata["vectors"] = np.vstack(scalars).T * vector_scale
-                        field.label = "Vector " + field.label
-                        field._cached_polydata.point_data[field.label] = np.array(
-                            [np.linalg.norm(x) for x in np.vstack(scalars[0]).T]
-                        )
-                        try:
-                            field.scalar_name = field._cached_polydata.point_data.active_scalars_name + " Magnitude"
-                            field.is_vector = True
-                        except Exception:
-                            field.is_vector = False
+                field.is_vector = True
+            else:
+                field.scalar_name = field._cached_polydata.point_data.active_scalars_name
+
+        elif ".aedtplt" in field.path:  # pragma no cover
+            vertices, faces, scalars, log1 = _parse_aedtplt(field.path)
+            if self.convert_fields_in_db:
+                scalars = [np.multiply(np.log10(i), self.log_multiplier) for i in scalars]
+            fields_vals = pv.PolyData(vertices[0], faces[0])
+            field._cached_polydata = fields_vals
+            if isinstance(scalars[0], list):
+                vector_scale = (max(fields_vals.bounds) - min(fields_vals.bounds)) / (
+                    50 * (np.vstack(scalars[0]).max() - np.vstack(scalars[0]).min())
+                )
+
+                field._cached_polydata["vectors"] = np.vstack(scalars).T * vector_scale
+                field.label = "Vector " + field.label
+                field._cached_polydata.point_data[field.label] = np.array(
+                    [np.linalg.norm(x) for x in np.vstack(scalars[0]).T]
+                )
+                try:
+                    field.scalar_name = field._cached_polydata.point_data.active_scalars_name + " Magnitude"
+                    field.is_vector = True
+                except Exception:
+                    field.is_vector = False
+            else:
+                field._cached_polydata.point_data[field.label] = scalars[0]
+                field.scalar_name = field._cached_polydata.point_data.active_scalars_name
+                field.is_vector = False
+            field.log = log1
+        else:
+            nodes = []
+            values = []
+            is_vector = False
+            with open_file(field.path, "r") as f:
+                try:
+                    lines = f.read().splitlines()[field.header_lines :]
+                    if ".csv" in field.path:
+                        sniffer = csv.Sniffer()
+                        delimiter = sniffer.sniff(lines[0]).delimiter
                     else:
-                        field._cached_polydata.point_data[field.label] = scalars[0]
-                        field.scalar_name = field._cached_polydata.point_data.active_scalars_name
-                        field.is_vector = False
-                    field.log = log1
+                        delimiter = " "
+                    if len(lines) > 2000 and not field._is_frame:
+                        lines = list(dict.fromkeys(lines))
+                        # decimate = 2
+                        # del lines[decimate - 1 :: decimate]
+                except Exception:
+                    lines = []
+                for line in lines:
+                    tmp = line.strip().split(delimiter)
+                    if len(tmp) < 4:
+                        continue
+                    nodes.append([float(tmp[0]), float(tmp[1]), float(tmp[2])])
+                    if len(tmp) == 6:
+                        values.append([float(tmp[3]), float(tmp[4]), float(tmp[5])])
+                        is_vector = True
+                    elif len(tmp) == 9:
+                        values.append([float(tmp[3]), float(tmp[5]), float(tmp[7])])
+                        is_vector = True
+                    else:
+                        values.append(float(tmp[3]))
+            if self.convert_fields_in_db:
+                if not isinstance(values[0], list):
+                    values = [self.log_multiplier * math.log10(abs(i)) for i in values]
                 else:
-                    nodes = []
-                    values = []
-                    is_vector = False
-                    with open_file(field.path, "r") as f:
-                        try:
-                            lines = f.read().splitlines()[field.header_lines :]
-                            if ".csv" in field.path:
-                                sniffer = csv.Sniffer()
-                                delimiter = sniffer.sniff(lines[0]).delimiter
-                            else:
-                                delimiter = " "
-                            if len(lines) > 2000 and not field._is_frame:
-                                lines = list(dict.fromkeys(lines))
-                                # decimate = 2
-                                # del lines[decimate - 1 :: decimate]
-                        except Exception:
-                            lines = []
-                        for line in lines:
-                            tmp = line.strip().split(delimiter)
-                            if len(tmp) < 4:
-                                continue
-                            nodes.append([float(tmp[0]), float(tmp[1]), float(tmp[2])])
-                            if len(tmp) == 6:
-                                values.append([float(tmp[3]), float(tmp[4]), float(tmp[5])])
-                                is_vector = True
-                            elif len(tmp) == 9:
-                                values.append([float(tmp[3]), float(tmp[5]), float(tmp[7])])
-                                is_vector = True
-                            else:
-                                values.append(float(tmp[3]))
-                    if self.convert_fields_in_db:
-                        if not isinstance(values[0], list):
-                            values = [self.log_multiplier * math.log10(abs(i)) for i in values]
-                        else:
-                            values = [[self.log_multiplier * math.log10(abs(i)) for i in value] for value in values]
-                    if nodes:
-                        try:
-                            conv = 1 / AEDT_UNITS["Length"][self.units]
-                        except Exception:
-                            conv = 1
-                        vertices = np.array(nodes) * conv
-                        filedata = pv.PolyData(vertices)
-                        if is_vector:
-                            vector_scale = (max(filedata.bounds) - min(filedata.bounds)) / (
-                                20 * (np.vstack(values).max() - np.vstack(values).min())
-                            )
-                            filedata["vectors"] = np.vstack(values) * vector_scale
-                            field.label = "Vector " + field.label
-                            filedata.point_data[field.label] = np.array([np.linalg.norm(x) for x in np.vstack(values)])
-                            field.scalar_name = field._cached_polydata.point_data.active_scalars_name
-                            field.is_vector = True
-                        else:
-                            filedata = filedata.delaunay_2d(tol=field.surface_mapping_tolerance)
-                            filedata.point_data[field.label] = np.array(values)
-                            field.scalar_name = filedata.point_data.active_scalars_name
-                        field._cached_polydata = filedata
+                    values = [[self.log_multiplier * math.log10(abs(i)) for i in value] for value in values]
+            if nodes:
+                try:
+                    conv = 1 / AEDT_UNITS["Length"][self.units]
+                except Exception:
+                    conv = 1
+                vertices = np.array(nodes) * conv
+                filedata = pv.PolyData(vertices)
+                if is_vector:
+                    vector_scale = (max(filedata.bounds) - min(filedata.bounds)) / (
+                        20 * (np.vstack(values).max() - np.vstack(values).min())
+                    )
+                    filedata["vectors"] = np.vstack(values) * vector_scale
+                    field.label = "Vector " + field.label
+                    filedata.point_data[field.label] = np.array([np.linalg.norm(x) for x in np.vstack(values)])
+                    field.scalar_name = field._cached_polydata.point_data.active_scalars_name
+                    field.is_vector = True
+                else:
+                    filedata = filedata.delaunay_2d(tol=field.surface_mapping_tolerance)
+                    filedata.point_data[field.label] = np.array(values)
+                    field.scalar_name = filedata.point_data.active_scalars_name
+                field._cached_polydata = filedata
+
+    @pyaedt_function_handler()
+    def _load_frame(self, frame):
+        """Load the mesh of a frame without keeping it in the frame object."""
+        if ".case" not in frame.path and ".aedtplt" not in frame.path:
+            data = read_frame(frame.path, frame.header_lines, self.frames_cache_directory)
+        else:
+            data = None
+        if data is None or data.shape[1] != 4:
+            label = frame.label
+            self._read_field(frame)
+            polydata = frame._cached_polydata
+            frame._cached_polydata = None
+            frame.label = label
+            return polydata
+        values = np.array(data[:, 3])
+        if self.convert_fields_in_db:
+            values = self.log_multiplier * np.log10(np.abs(values))
+        try:
+            conv = 1 / AEDT_UNITS["Length"][self.units]
+        except Exception:
+            conv = 1
+        polydata = pv.PolyData(np.array(data[:, :3]) * conv)
+        polydata = polydata.delaunay_2d(tol=frame.surface_mapping_tolerance)
+        polydata.point_data[frame.label] = values
+        frame.scalar_name = polydata.point_data.active_scalars_name
+        return polydata
+
+    @pyaedt_function_handler()
+    def _frames_range(self):
+        """Compute the range of the frames one frame at a time.
+
+        The range of scalar frames is read from the frame cache. Vector frames are loaded
+        because their plotted value is the magnitude, which is not stored in the cache.
+        """
+        text_frames = [i.path for i in self.frames if ".case" not in i.path and ".aedtplt" not in i.path]
+        mins, maxs = None, None
+        if len(text_frames) == len(self.frames) and not self.convert_fields_in_db:
+            header_lines = self.frames[0].header_lines
+            infos = [convert_frame(i, header_lines, self.frames_cache_directory) for i in text_frames]
+            if all(info and info["columns"] == 4 for info in infos):
+                statistics = frame_statistics(
+                    text_frames, header_lines=header_lines, cache_directory=self.frames_cache_directory
+                )
+                if statistics:
+                    mins, maxs = statistics
+        if mins is None:
+            mins = 1e20
+            maxs = -1e20
+            for el in self.frames:
+                polydata = self._load_frame(el)
+                mins = min(mins, np.min(polydata.point_data[el.scalar_name]))
+                maxs = max(maxs, np.max(polydata.point_data[el.scalar_name]))
+        return mins, maxs
 
     @pyaedt_function_handler()
     def _add_buttons(self):
@@ -1410,7 +1491,7 @@ class ModelPlotter(CommonPlotter):
             self.pv.add_background_image(self.background_image)
         else:
             self.pv.background_color = [i / 255 for i in self.background_color]
-        self._read_mesh_files(read_frames=True)
+        self._read_mesh_files(read_frames=not self.stream_frames)
 
         axes_color = [0 if i >= 128 else 1 for i in self.background_color]
 
@@ -1480,6 +1561,8 @@ class ModelPlotter(CommonPlotter):
         if self.range_min is not None and self.range_max is not None:
             mins = self.range_min
             maxs = self.range_max
+        elif self.stream_frames:
+            mins, maxs = self._frames_range()
         else:
             mins = 1e20
             maxs = -1e20
@@ -1489,8 +1572,14 @@ class ModelPlotter(CommonPlotter):
                 if np.max(el._cached_polydata.point_data[el.scalar_name]) > maxs:
                     maxs = np.max(el._cached_polydata.point_data[el.scalar_name])
 
+        stream = None
+        if self.stream_frames:
+            stream = self._frames_stream()
+            first_frame = next(stream)
+        else:
+            first_frame = self.frames[0]._cached_polydata
         self.frames[0]._cached_mesh = self.pv.add_mesh(
-            self.frames[0]._cached_polydata,
+            first_frame,
             scalars=self.frames[0].scalar_name,
             log_scale=False if self.convert_fields_in_db else self.frames[0].log_scale,
             scalar_bar_args=sargs,
@@ -1548,9 +1637,29 @@ class ModelPlotter(CommonPlotter):
                     break
                 i = 0
                 first_loop = False
-            mesh_i = self.frames[i]._cached_polydata
-            scalars = mesh_i.point_data[self.frames[i].scalar_name]
-            mesh_i.point_data[self.frames[i].scalar_name] = scalars
+                if stream:
+                    stream.close()
+                    stream = self._frames_stream()
+            if stream:
+                mesh_i = next(stream)
+                self.frames[i]._cached_mesh = self.pv.add_mesh(
+                    mesh_i,
+                    scalars=self.frames[i].scalar_name,
+                    log_scale=False if self.convert_fields_in_db else self.frames[i].log_scale,
+                    scalar_bar_args=sargs,
+                    cmap=self.frames[i].color_map,
+                    clim=[mins, maxs],
+                    show_edges=False,
+                    pickable=True,
+                    smooth_shading=True,
+                    name="FieldPlot",
+                    opacity=self.frames[i].opacity,
+                    reset_camera=False,
+                )
+            else:
+                mesh_i = self.frames[i]._cached_polydata
+                scalars = mesh_i.point_data[self.frames[i].scalar_name]
+                mesh_i.point_data[self.frames[i].scalar_name] = scalars
             if not hasattr(self.pv, "ren_win"):
                 break
             time.sleep(max(0, (1 / self.frame_per_seconds) - (time.time() - start)))
@@ -1562,12 +1671,18 @@ class ModelPlotter(CommonPlotter):
             if first_loop:
                 self.pv.write_frame()
             i += 1
+        if stream:
+            stream.close()
         self.pv.close()
         if self.gif_file:
             return self.gif_file
         else:
             return True
 
+    def _frames_stream(self):
+        """Start loading the frames in a background thread."""
+        return FramePrefetcher(len(self.frames), lambda i: self._load_frame(self.frames[i]), self.frames_lookahead)
+
     @pyaedt_function_handler()
     def generate_geometry_mesh(self):
         """Generate mesh for objects only.
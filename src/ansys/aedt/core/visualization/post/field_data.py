@@ -1231,6 +1231,7 @@ class FieldPlot:
 
         .. note::
            This method does not work in non-graphical mode.
+           To probe many points, use the ``probe_points()`` method instead.
 
         Parameters
         ----------
@@ -1324,6 +1325,34 @@ class FieldPlot:
         else:
             return out_dict
 
+    @pyaedt_function_handler()
+    def probe_points(self, points, pandas_output=False):
+        """Get the values of the plot quantity at many points.
+
+        All points are evaluated with a single field calculator export on the plot
+        solution and intrinsics. The plot does not need to be visible.
+
+        Parameters
+        ----------
+        points : list or :class:`numpy.ndarray`
+            Point coordinates ``[x, y, z]`` in model units, or list of them.
+        pandas_output : bool, optional
+            Whether to return the values as a pandas DataFrame. The default is ``False``.
+
+        Returns
+        -------
+        :class:`numpy.ndarray` or :class:`pandas.DataFrame`
+            Array with one row per point with the point coordinates and the quantity components.
+            For more information, see the ``PostProcessor3D.probe_field_values()`` method.
+        """
+        return self._postprocessor.probe_field_values(
+            self.quantity,
+            points,
+            solution=self.solution,
+            intrinsics=self.intrinsics or None,
+            pandas_output=pandas_output,
+        )
+
     @property
     def surfacePlotInstruction(self):
         """Surface plot settings.
@@ -31,9 +31,20 @@ from ansys.aedt.core.generic.general_methods import generate_unique_project_name
 from ansys.aedt.core.generic.general_methods import open_file
 from ansys.aedt.core.generic.general_methods import pyaedt_function_handler
 from ansys.aedt.core.generic.general_methods import read_configuration_file
+from ansys.aedt.core.generic.settings import settings
 from jsonschema import exceptions
 from jsonschema import validate
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+try:
+    import pandas as pd
+except ImportError:  # pragma: no cover
+    pd = None
+
 
 class FieldsCalculator:
     """Provides the Advanced fields calculator methods.
@@ -107,6 +118,7 @@ class FieldsCalculator:
         self.__app = app
         self.design_type = app.design_type
         self.ofieldsreporter = app.ofieldsreporter
+        self._top_entry_value = True
 
     @property
     def expression_names(self):
@@ -670,6 +682,229 @@ class FieldsCalculator:
                 pass
         return value
 
+    @pyaedt_function_handler()
+    def evaluate_many(
+        self, expressions, assignments=None, setup=None, intrinsics=None, variations=None, pandas_output=False
+    ):
+        """Evaluate several expressions and return their values.
+
+        Every expression is evaluated for each combination of assignment, intrinsics and variation.
+        Each named expression is pushed to the calculator stack once, and the values of all the
+        intrinsics and variation combinations are read from the top of the stack instead of being
+        exported to a temporary file each. If reading the stack is not supported, values are exported
+        to files as in :func:`evaluate`.
+
+        Parameters
+        ----------
+        expressions : str or list
+            Expression names. Each name is either a named expression already in AEDT Fields Calculator
+            or a calculation of the expression catalog.
+        assignments : list, optional
+            Assignments to evaluate catalog calculations on. A named expression is added for each
+            calculation and assignment, and deleted after the evaluation if it did not exist before.
+            The default is ``None``, in which case the expressions are evaluated as they are defined.
+        setup : str, optional
+            Solution name.
+            If not provided the nominal adaptive solution is taken.
+        intrinsics : dict or list, optional
+            Intrinsics variables provided as a dictionary or a list of dictionaries.
+            Keys depend on the solution type and can be ``"Freq"``, ``"Time"`` or ``"Phase"``.
+            The default is ``None`` in which case the intrinsics value is automatically computed based on the setup.
+        variations : dict or list, optional
+            Design variable values provided as a dictionary or a list of dictionaries.
+            The default is ``None``, in which case the current design variable values are used.
+        pandas_output : bool, optional
+            Whether to return a pandas DataFrame. The default is ``False``.
+
+        Returns
+        -------
+        :class:`numpy.ndarray` or :class:`pandas.DataFrame` or bool
+            Array of values with shape ``(expressions, assignments, intrinsics, variations)``,
+            or DataFrame with a ``"value"`` column indexed by expression, assignment, intrinsics and variation.
+            Values that cannot be evaluated are ``NaN``. ``False`` is returned when failed.
+
+        Examples
+        --------
+        >>> from ansys.aedt.core import Hfss
+        >>> hfss = Hfss()
+        >>> values = hfss.post.fields_calculator.evaluate_many(
+        ...     "voltage_line",
+        ...     assignments=["Polyline1", "Polyline2"],
+        ...     intrinsics=[{"Freq": "1GHz", "Phase": "0deg"}, {"Freq": "2GHz", "Phase": "0deg"}],
+        ... )
+        >>> values.shape
+        (1, 2, 2, 1)
+        >>> hfss.release_desktop(False, False)
+        """
+        if np is None:  # pragma: no cover
+            self.__app.logger.error("NumPy is required to evaluate many expressions.")
+            return False
+        if pandas_output and pd is None:  # pragma: no cover
+            self.__app.logger.error("Pandas is required to return a DataFrame.")
+            return False
+        if isinstance(expressions, str):
+            expressions = [expressions]
+        if assignments is None or not isinstance(assignments, (list, tuple)):
+            assignments = [assignments]
+        if intrinsics is None or isinstance(intrinsics, dict):
+            intrinsics = [intrinsics]
+        if variations is None or isinstance(variations, dict):
+            variations = [variations]
+        if not setup:
+            setup = self.__app.nominal_adaptive
+        setup_name = setup.split(":")[0].strip(" ")
+        if setup_name not in self.__app.existing_analysis_setups:
+            self.__app.logger.error("Invalid setup name.")
+            return False
+
+        created = []
+        try:
+            return self.__evaluate_many(
+                expressions, assignments, setup, setup_name, intrinsics, variations, pandas_output, created
+            )
+        finally:
+            for name in created:
+                self.delete_expression(name)
+
+    def __evaluate_many(
+        self, expressions, assignments, setup, setup_name, intrinsics, variations, pandas_output, created
+    ):
+        """Evaluate many expressions and store the names of the named expressions added in ``created``."""
+        names = {}
+        for expression in expressions:
+            for assignment in assignments:
+                names[(expression, assignment)] = self.__named_expression(expression, assignment, created)
+
+        design_variables = {k: v.expression for k, v in self.__app.variable_manager.design_variables.items()}
+        default_intrinsics = None
+        arguments = []
+        for variation_index, variation in enumerate(variations):
+            variables = dict(design_variables)
+            variables.update(variation or {})
+            for intrinsics_index, intrinsic in enumerate(intrinsics):
+                if intrinsic is None:
+                    if default_intrinsics is None:
+                        default_intrinsics = self.__app.get_setup(setup_name).default_intrinsics
+                    intrinsic = default_intrinsics
+                args = []
+                for k, v in list(variables.items()) + list(intrinsic.items()):
+                    args.append(f"{k}:=")
+                    args.append(v)
+                arguments.append((intrinsics_index, variation_index, args))
+
+        values = np.full((len(expressions), len(assignments), len(intrinsics), len(variations)), np.nan)
+        for expression_index, expression in enumerate(expressions):
+            for assignment_index, assignment in enumerate(assignments):
+                name = names[(expression, assignment)]
+                if not name:
+                    continue
+                self.ofieldsreporter.CalcStack("clear")
+                self.ofieldsreporter.CopyNamedExprToStack(name)
+                for intrinsics_index, variation_index, args in arguments:
+                    values[expression_index, assignment_index, intrinsics_index, variation_index] = self.read_stack_top(
+                        setup, args
+                    )
+        self.ofieldsreporter.CalcStack("clear")
+
+        if not pandas_output:
+            return values
+        index = pd.MultiIndex.from_product(
+            [
+                expressions,
+                [str(i) if i is not None else "" for i in assignments],
+                [" ".join(f"{k}={v}" for k, v in i.items()) if i else "" for i in intrinsics],
+                [" ".join(f"{k}={v}" for k, v in i.items()) if i else "" for i in variations],
+            ],
+            names=["expression", "assignment", "intrinsics", "variation"],
+        )
+        return pd.DataFrame({"value": values.ravel()}, index=index)
+
+    def __named_expression(self, expression, assignment, created):
+        """Get the named expression to evaluate for an expression and an assignment.
+
+        Names of the named expressions added to the design, including the dependent expressions
+        of catalog calculations, are appended to ``created`` so that they can be deleted.
+        """
+        if expression in self.expression_names:
+            name = None
+            if assignment is not None and not self.is_general_expression(expression):
+                assignment_name = self.__app.modeler.convert_to_selections(assignment, return_list=True)[0]
+                name = f"{expression}_{assignment_name}"
+            new_names = [
+                i
+                for i in [name or self.expression_catalog[expression]["name"]] + self.__dependent_names(expression)
+                if i not in created and not self.is_expression_defined(i)
+            ]
+            name = self.add_expression(expression, assignment, name)
+            created.extend(i for i in new_names if self.is_expression_defined(i))
+            return name
+        if not self.is_expression_defined(expression):
+            self.__app.logger.error(f"Expression {expression} does not exist in current stack.")
+            return False
+        return expression
+
+    def __dependent_names(self, expression):
+        """Get the names of the dependent expressions of a catalog calculation, recursively."""
+        names = []
+        for dependent in self.expression_catalog[expression].get("dependent_expressions", []):
+            names.append(self.expression_catalog[dependent]["name"])
+            names.extend(self.__dependent_names(dependent))
+        return names
+
+    @pyaedt_function_handler()
+    def read_stack_top(self, setup, variations):
+        """Read the value at the top of the calculator stack.
+
+        The value is read with ``GetTopEntryValue``. If this method is not supported by
+        the AEDT version, the value is exported to a temporary file instead, as in :func:`evaluate`.
+
+        Parameters
+        ----------
+        setup : str
+            Solution name.
+        variations : list
+            Calculator arguments with the variation and intrinsics values.
+            For example, ``["width:=", "1mm", "Freq:=", "1GHz"]``.
+
+        Returns
+        -------
+        float
+            Value at the top of the stack, ``NaN`` when it cannot be read.
+
+        References
+        ----------
+        >>> oModule.GetTopEntryValue
+        >>> oModule.CalculatorWrite
+        """
+        value = None
+        read = False
+        if self._top_entry_value:
+            try:
+                value = self.ofieldsreporter.GetTopEntryValue(setup, variations)
+                if isinstance(value, (list, tuple)):
+                    value = value[0] if value else None
+                read = True
+            except AttributeError:
+                self.__app.logger.debug("Calculator stack values are not supported. Values are exported to files.")
+                self._top_entry_value = False
+            except Exception:
+                self.__app.logger.debug("Calculator stack value cannot be read. It is exported to a file.")
+        if not read:
+            out_file = os.path.join(self.__app.working_directory, generate_unique_name("expression") + ".fld")
+            self.ofieldsreporter.CalculatorWrite(out_file, ["Solution:=", setup], variations)
+            if os.path.exists(out_file) or settings.remote_rpc_session:
+                with open_file(out_file, "r") as f:
+                    lines = [line.strip() for line in f.readlines()]
+                value = lines[-1] if lines else None
+                try:
+                    os.remove(out_file)
+                except OSError:
+                    pass
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return float("nan")
+
     @pyaedt_function_handler()
     def export(
         self,
@@ -0,0 +1,295 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2024 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Chunked binary store for fields exported on a grid.
+
+A grid is exported tile by tile. Each completed tile is saved as a NumPy file so that an
+interrupted export can resume. When all tiles are available, they are consolidated into a
+single ``.npy`` file that is read lazily through memory mapping.
+"""
+
+import json
+import math
+import os
+
+from ansys.aedt.core.generic.general_methods import pyaedt_function_handler
+from ansys.aedt.core.generic.settings import settings
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+def grid_tiles(grid_start, grid_stop, grid_step, tile_size):
+    """Split a grid into tiles.
+
+    Parameters
+    ----------
+    grid_start : list
+        Starting point of the grid, one value per axis.
+    grid_stop : list
+        Stopping point of the grid, one value per axis.
+    grid_step : list
+        Step of the grid, one value per axis. A step of ``0`` gives a single point on the axis.
+    tile_size : int or list
+        Maximum number of grid points per axis in a tile.
+
+    Returns
+    -------
+    list
+        List of ``(tile_start, tile_stop)`` tuples. Stops are inclusive grid points.
+    """
+    if isinstance(tile_size, int):
+        tile_size = [tile_size] * len(grid_start)
+    axes = []
+    for start, stop, step, size in zip(grid_start, grid_stop, grid_step, tile_size):
+        count = int(math.floor((stop - start) / step + 1e-9)) + 1 if step else 1
+        size = max(int(size), 1)
+        axis = []
+        for first in range(0, count, size):
+            last = min(first + size, count) - 1
+            axis.append((_round(start + first * step), _round(start + last * step)))
+        axes.append(axis)
+    tiles = [([], [])]
+    for axis in axes:
+        tiles = [(s + [a], e + [b]) for s, e in tiles for a, b in axis]
+    return [(tuple(s), tuple(e)) for s, e in tiles]
+
+
+def _round(value):
+    return float(f"{value:.12g}")
+
+
+class GridFieldStore(object):
+    """Stores a field exported on a grid as tiles and as a single memory-mapped array.
+
+    Rows of the dataset are grid points. Columns are the point coordinates followed by
+    the field components, as in the exported field files.
+
+    Parameters
+    ----------
+    directory : str
+        Directory of the store. It is created if it does not exist.
+
+    Examples
+    --------
+    >>> from ansys.aedt.core.visualization.post.grid_field_store import GridFieldStore
+    >>> store = GridFieldStore("C:/results/E_grid")
+    >>> values = store.values[:, 0]
+    """
+
+    manifest_name = "manifest.json"
+    data_name = "field.npy"
+
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self._manifest = self._read_manifest()
+
+    @property
+    def manifest_path(self):
+        """Path of the manifest file."""
+        return os.path.join(self.directory, self.manifest_name)
+
+    @property
+    def data_path(self):
+        """Path of the consolidated array file."""
+        return os.path.join(self.directory, self.data_name)
+
+    @property
+    def parameters(self):
+        """Export parameters of the store."""
+        return self._manifest.get("parameters", {})
+
+    @property
+    def tiles(self):
+        """List of ``(tile_start, tile_stop)`` tiles of the store."""
+        return [tuple(tuple(i) for i in tile) for tile in self._manifest.get("tiles", [])]
+
+    @property
+    def completed_tiles(self):
+        """Indices of the tiles already exported."""
+        return set(self._manifest.get("completed", []))
+
+    @property
+    def is_complete(self):
+        """Whether the store is consolidated into a single array."""
+        return bool(self._manifest.get("consolidated")) and os.path.exists(self.data_path)
+
+    def tile_path(self, index):
+        """Path of the array file of a tile.
+
+        Parameters
+        ----------
+        index : int
+            Index of the tile.
+
+        Returns
+        -------
+        str
+            Path of the tile file.
+        """
+        return os.path.join(self.directory, f"tile_{index:05d}.npy")
+
+    @pyaedt_function_handler()
+    def initialize(self, parameters, tiles, overwrite=False):
+        """Prepare the store for an export.
+
+        Completed tiles are kept if the parameters match those of the existing store.
+        Otherwise the store is reset.
+
+        Parameters
+        ----------
+        parameters : dict
+            JSON-serializable export parameters.
+        tiles : list
+            Tiles of the grid as returned by :func:`grid_tiles`.
+        overwrite : bool, optional
+            Whether to reset the store even if the parameters match. The default is ``False``.
+
+        Returns
+        -------
+        bool
+            ``True`` when completed tiles are resumed, ``False`` when the store starts empty.
+        """
+        parameters = json.loads(json.dumps(parameters))
+        tiles = [[list(s), list(e)] for s, e in tiles]
+        if not overwrite and self._manifest.get("parameters") == parameters and self._manifest.get("tiles") == tiles:
+            completed = [i for i in self._manifest.get("completed", []) if os.path.exists(self.tile_path(i))]
+            self._manifest["completed"] = completed
+            self._write_manifest()
+            return bool(completed) or self.is_complete
+        if self._manifest and not overwrite:
+            settings.logger.info(f"Export parameters changed. Resetting grid store {self.directory}.")
+        self._remove_arrays()
+        self._manifest = {"parameters": parameters, "tiles": tiles, "completed": [], "consolidated": False}
+        self._write_manifest()
+        return False
+
+    @pyaedt_function_handler()
+    def write_tile(self, index, array):
+        """Save the array of a tile and mark the tile as completed.
+
+        Parameters
+        ----------
+        index : int
+            Index of the tile.
+        array : :class:`numpy.ndarray`
+            Two-dimensional array with one row per point.
+
+        Returns
+        -------
+        bool
+            ``True`` when successful.
+        """
+        tile_path = self.tile_path(index)
+        partial_path = tile_path + ".part"
+        with open(partial_path, "wb") as f:
+            np.save(f, np.asarray(array, dtype=float))
+        os.replace(partial_path, tile_path)
+        completed = self.completed_tiles
+        completed.add(index)
+        self._manifest["completed"] = sorted(completed)
+        self._write_manifest()
+        return True
+
+    @pyaedt_function_handler()
+    def consolidate(self):
+        """Concatenate the tiles into a single array file and remove the tile files.
+
+        Tiles are copied one at a time, so the whole dataset never needs to fit in memory.
+
+        Returns
+        -------
+        bool
+            ``True`` when successful, ``False`` when tiles are missing.
+        """
+        if self.is_complete:
+            return True
+        n_tiles = len(self._manifest.get("tiles", []))
+        if len(self.completed_tiles) != n_tiles:
+            settings.logger.error("Grid store cannot be consolidated because some tiles are missing.")
+            return False
+        shapes = [np.load(self.tile_path(i), mmap_mode="r").shape for i in range(n_tiles)]
+        columns = max([shape[1] for shape in shapes if shape[0]] or [0])
+        rows = sum(shape[0] for shape in shapes if shape[0])
+        partial_path = self.data_path + ".part"
+        data = np.lib.format.open_memmap(partial_path, mode="w+", dtype=float, shape=(rows, columns))
+        row = 0
+        for i, shape in enumerate(shapes):
+            if not shape[0]:
+                continue
+            data[row : row + shape[0]] = np.load(self.tile_path(i), mmap_mode="r")
+            row += shape[0]
+        data.flush()
+        del data
+        os.replace(partial_path, self.data_path)
+        self._manifest["consolidated"] = True
+        self._write_manifest()
+        for i in range(n_tiles):
+            if os.path.exists(self.tile_path(i)):
+                os.remove(self.tile_path(i))
+        return True
+
+    @property
+    def data(self):
+        """Memory-mapped array of the dataset with one row per grid point.
+
+        Returns
+        -------
+        :class:`numpy.memmap`
+            Read-only array.
+        """
+        return np.load(self.data_path, mmap_mode="r")
+
+    @property
+    def points(self):
+        """Memory-mapped coordinates of the grid points."""
+        return self.data[:, :3]
+
+    @property
+    def values(self):
+        """Memory-mapped field values at the grid points."""
+        return self.data[:, 3:]
+
+    def _read_manifest(self):
+        if os.path.exists(self.manifest_path):
+            try:
+                with open(self.manifest_path, "r") as f:
+                    return json.load(f)
+            except (OSError, ValueError):  # pragma: no cover
+                settings.logger.warning(f"Manifest of grid store {self.directory} is not readable.")
+        return {}
+
+    def _write_manifest(self):
+        partial_path = self.manifest_path + ".part"
+        with open(partial_path, "w") as f:
+            json.dump(self._manifest, f)
+        os.replace(partial_path, self.manifest_path)
+
+    def _remove_arrays(self):
+        for file_name in os.listdir(self.directory):
+            if file_name.startswith("tile_") or file_name.startswith(self.data_name):
+                os.remove(os.path.join(self.directory, file_name))
@@ -24,6 +24,7 @@
 from pathlib import Path
 import re
 
+from ansys.aedt.core.generic.general_methods import generate_unique_name
 from ansys.aedt.core.generic.general_methods import pyaedt_function_handler
 from ansys.aedt.core.generic.settings import settings
 from ansys.aedt.core.visualization.post.post_common_3d import PostProcessor3D
@@ -45,6 +46,7 @@ class PostProcessor3DLayout(PostProcessor3D):
 
     def __init__(self, app):
         PostProcessor3D.__init__(self, app)
+        self._power_loss_tables = {}
 
     @pyaedt_function_handler
     def _compute_power_loss(self, net_filter=None, layer_filter=None, solution=None):
@@ -66,75 +68,67 @@ class PostProcessor3DLayout(PostProcessor3D):
                 self._app.logger.error(f"Solution {solution} doesn't exist.")
                 return
 
+        power_loss_table = self._power_loss_table(solution)
+        if power_loss_table is None:
+            return
+        return [
+            i
+            for i in power_loss_table
+            if (net_filter is None or i["net"] in net_filter) and (layer_filter is None or i["layer"] in layer_filter)
+        ]
+
+    def _power_loss_table(self, solution):
+        """Get the power loss of every net on every signal layer of a SIwave DC IR solution.
+
+        The table is computed once per solution result and reused until the solution net file changes.
+        """
         solution_data_dir = Path(self._app.project_file).with_suffix(".aedtresults") / "main"
-        subfolders = [f for f in solution_data_dir.iterdir() if f.is_dir()]
         dcir_solution_folder = None
-        for folder in subfolders:
+        for folder in [f for f in solution_data_dir.iterdir() if f.is_dir()]:
             file_exec = folder / "SIwave.exec"
             if not file_exec.exists():
                 continue  # pragma: no cover
             with open(file_exec, "r") as f:
-                siwave_exec = f.read()
-                match = re.search(r'SetupName\s+"(.*?)"', siwave_exec)
-                if match.group(1) == solution:
-                    dcir_solution_folder = folder
-                    break
-        if dcir_solution_folder is None:  # pragma: no cover
+                match = re.search(r'SetupName\s+"(.*?)"', f.read())
+            if match and match.group(1) == solution:
+                dcir_solution_folder = folder
+                break
+        file_net = None
+        if dcir_solution_folder is not None:
+            file_net = next((i for i in dcir_solution_folder.iterdir() if i.suffix == ".net"), None)
+        if file_net is None:  # pragma: no cover
             self._app.logger.error(f"Solution {solution} has no result.")
-        else:
-            file_net = None
-            for i in dcir_solution_folder.iterdir():
-                if i.suffix == ".net":
-                    file_net = i
-                    break
-            with open(file_net, "r") as f:
-                file_net_text = f.read()
-                match = re.search(r"B_NET_CLASSIFICATION\s+(.*?)\s+E_NET_CLASSIFICATION", file_net_text, re.DOTALL)
-                nets = []
-                for i in match.group(1).split("\n"):
-                    net_name = i.lstrip(" ").split(" ")[1]
-                    nets.append(net_name)
+            return
 
-        if net_filter is not None:
-            nets = [i for i in nets if i in net_filter]
+        mtime = file_net.stat().st_mtime
+        if solution in self._power_loss_tables and self._power_loss_tables[solution][0] == mtime:
+            return self._power_loss_tables[solution][1]
 
-        edbapp = self._app.modeler.edb
-
-        if layer_filter is None:
-            net_per_layer_names = {i: [] for i in edbapp.stackup.signal_layers.keys()}
-        else:
-            net_per_layer_names = {i: [] for i in edbapp.stackup.signal_layers.keys() if i in layer_filter}
+        with open(file_net, "r") as f:
+            match = re.search(r"B_NET_CLASSIFICATION\s+(.*?)\s+E_NET_CLASSIFICATION", f.read(), re.DOTALL)
+        nets = [i.lstrip(" ").split(" ")[1] for i in match.group(1).split("\n")]
 
+        edbapp = self._app.modeler.edb
+        net_per_layer_names = {i: [] for i in edbapp.stackup.signal_layers.keys()}
         for net_name in nets:
-            net_obj = edbapp.nets[net_name]
-            layer_names = [i.layer_name for i in net_obj.primitives]
-            layer_names = list(set(layer_names))
-            for i in layer_names:
-                if i in net_per_layer_names:
-                    net_per_layer_names[i].append(net_name)
-
-        power_loss_per_layer = []
-        operations = []
+            for layer_name in {i.layer_name for i in edbapp.nets[net_name].primitives}:
+                if layer_name in net_per_layer_names:
+                    net_per_layer_names[layer_name].append(net_name)
+
+        fields_calculator = self._app.post.fields_calculator
+        solution_type = ["DC Fields"] if settings.aedt_version < "2025.1" else ["DCIR Fields"]
+        power_loss_table = []
+        names = []
+        # Temporary named expressions, deleted once evaluated.
+        prefix = generate_unique_name("pyaedt_dcir_power")
         for layer_name, net_names in net_per_layer_names.items():
             if not net_names:
                 continue
             thickness = edbapp.stackup[layer_name].thickness
             for net_name in net_names:
                 assignment = f"{layer_name}_{net_name}"
-                operations.extend(
-                    [
-                        "Fundamental_Quantity('P')",
-                        f"EnterSurface('{assignment}')",
-                        "Operation('SurfaceValue')",
-                        "Operation('Integrate')",
-                    ]
-                )
-
-                operations.extend([f"Scalar_Constant({thickness})", "Operation('*')"])
-
-                solution_type = ["DC Fields"] if settings.aedt_version < "2025.1" else ["DCIR Fields"]
                 my_expression = {
-                    "name": f"Power_{layer_name}",
+                    "name": f"{prefix}_{len(names)}",
                     "description": "Power Density",
                     "design_type": ["HFSS 3D Layout Design"],
                     "fields_type": solution_type,
@@ -142,18 +136,33 @@ class PostProcessor3DLayout(PostProcessor3D):
                     "primary_sweep": "",
                     "assignment": "",
                     "assignment_type": ["Surface"],
-                    "operations": operations,
+                    "operations": [
+                        "Fundamental_Quantity('P')",
+                        f"EnterSurface('{assignment}')",
+                        "Operation('SurfaceValue')",
+                        "Operation('Integrate')",
+                        f"Scalar_Constant({thickness})",
+                        "Operation('*')",
+                    ],
                     "report": ["Data Table", "Rectangular Plot"],
                 }
-                if self._app.post.fields_calculator.is_expression_defined(my_expression["name"]):
-                    self._app.post.fields_calculator.delete_expression(my_expression["name"])
-                self._app.post.fields_calculator.add_expression(my_expression, "")
-
-                loss = self._app.post.fields_calculator.evaluate(my_expression["name"], solution, intrinsics={})
-
-                power_loss_per_layer.append({"layer": layer_name, "net": net_name, "loss": float(loss)})
-
-        return power_loss_per_layer
+                names.append(my_expression["name"])
+                power_loss_table.append({"layer": layer_name, "net": net_name, "loss": None})
+                fields_calculator.add_expression(my_expression, "")
+
+        if names:
+            try:
+                losses = fields_calculator.evaluate_many(names, setup=solution, intrinsics={})
+            finally:
+                for name in names:
+                    fields_calculator.delete_expression(name)
+            if losses is False:  # pragma: no cover
+                self._app.logger.error(f"Power loss of solution {solution} cannot be evaluated.")
+                return
+            for row, loss in zip(power_loss_table, losses[:, 0, 0, 0]):
+                row["loss"] = float(loss)
+        self._power_loss_tables[solution] = (mtime, power_loss_table)
+        return power_loss_table
 
     @pyaedt_function_handler()
     def compute_power_by_layer(self, layers=None, solution=None):
@@ -44,6 +44,7 @@ from ansys.aedt.core.generic.general_methods import open_file
 from ansys.aedt.core.generic.general_methods import pyaedt_function_handler
 from ansys.aedt.core.generic.settings import settings
 from ansys.aedt.core.modeler.cad.elements_3d import FacePrimitive
+from ansys.aedt.core.visualization.plot.frame_stream import frame_statistics
 from ansys.aedt.core.visualization.plot.pyvista import ModelPlotter
 from ansys.aedt.core.visualization.post.common import PostProcessorCommon
 from ansys.aedt.core.visualization.post.fields_calculator import FieldsCalculator
@@ -57,11 +58,65 @@ except ImportError:
         "Install with \n\npip install numpy"
     )
 
+try:
+    import pandas as pd
+except ImportError:  # pragma: no cover
+    pd = None
+
 from ansys.aedt.core.visualization.post.field_data import FieldPlot
 from ansys.aedt.core.visualization.post.vrt_data import VRTFieldPlot
 from ansys.aedt.core.visualization.report.constants import ORIENTATION_TO_VIEW
 
 
+def _latest_modification_time(directory):
+    """Get the latest modification time of the files and folders in a directory tree.
+
+    Parameters
+    ----------
+    directory : str
+        Full path to the directory.
+
+    Returns
+    -------
+    float or None
+        Latest modification time, ``None`` if the directory does not exist.
+    """
+    if not directory or not os.path.isdir(directory):
+        return None
+    latest = os.path.getmtime(directory)
+    for root, folders, files in os.walk(directory):
+        for name in folders + files:
+            try:
+                latest = max(latest, os.path.getmtime(os.path.join(root, name)))
+            except OSError:  # pragma: no cover
+                continue
+    return latest
+
+
+def _read_field_points_file(file_name):
+    """Read the values of a field file exported on sample points.
+
+    Parameters
+    ----------
+    file_name : str
+        Full path to the field file.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        Array with one row per point.
+    """
+    header_lines = 0
+    with open_file(file_name, "r") as f:
+        for line in f:
+            try:
+                float(line.split()[0])
+                break
+            except (IndexError, ValueError):
+                header_lines += 1
+    return np.loadtxt(file_name, skiprows=header_lines, ndmin=2)
+
+
 class PostProcessor3D(PostProcessorCommon):
     """Manages the main AEDT postprocessing functions.
 
@@ -469,6 +524,146 @@ class PostProcessor3D(PostProcessorCommon):
         if not solution:
             solution = self._app.existing_analysis_sweeps[0]
         self.ofieldsreporter.CalcStack("clear")
+        self._enter_scalar_quantity(quantity, scalar_function, is_vector, object_name, object_type, adjacent_side)
+        variation = self._sweep_variation_arguments(variations)
+        variation.extend(intrinsics)
+
+        file_name = os.path.join(self._app.working_directory, generate_unique_name("temp_fld") + ".fld")
+        self.ofieldsreporter.CalculatorWrite(file_name, ["Solution:=", solution], variation)
+        value = None
+        if os.path.exists(file_name) or settings.remote_rpc_session:
+            with open_file(file_name, "r") as f:
+                lines = f.readlines()
+                lines = [line.strip() for line in lines]
+                value = lines[-1]
+            os.remove(file_name)
+        self.ofieldsreporter.CalcStack("clear")
+        return float(value)
+
+    @pyaedt_function_handler()
+    def get_scalar_field_values(self, requests, solution=None, pandas_output=False):
+        """Use the field calculator to compute many scalars of fields at once.
+
+        Requests that share the same quantity, object and scalar function share one calculator
+        stack, which is evaluated for each of their variations and intrinsics. Values are read from
+        the top of the calculator stack. If reading the stack is not supported, values are exported
+        to temporary files as in :func:`get_scalar_field_value`.
+
+        Parameters
+        ----------
+        requests : list
+            List of requests. Each request is either a tuple
+            ``(quantity, object_name, scalar_function, intrinsics, variations)``, where trailing items
+            can be omitted, or a dictionary whose keys are the arguments of
+            :func:`get_scalar_field_value`.
+        solution : str, optional
+            Name of the solution in the format ``"solution : sweep"`` used by the requests that do not
+            specify one. The default is ``None``, in which case the first existing sweep is used.
+        pandas_output : bool, optional
+            Whether to return a ``pandas.DataFrame`` with one row per request. The default is ``False``.
+
+        Returns
+        -------
+        :class:`numpy.ndarray` or :class:`pandas.DataFrame` or bool
+            Array of values in the order of the requests, or DataFrame with the request columns and
+            a ``"value"`` column. Values that cannot be computed are ``NaN``. ``False`` is returned when failed.
+
+        References
+        ----------
+        >>> oModule.EnterQty
+        >>> oModule.CopyNamedExprToStack
+        >>> oModule.CalcOp
+        >>> oModule.EnterVol
+        >>> GetTopEntryValue
+
+        Examples
+        --------
+        >>> from ansys.aedt.core import Maxwell3d
+        >>> m3d = Maxwell3d()
+        >>> requests = [("Ohmic_Loss", coil, "Integrate") for coil in ["Coil1", "Coil2", "Coil3"]]
+        >>> losses = m3d.post.get_scalar_field_values(requests)
+        """
+        if np is None:  # pragma: no cover
+            self.logger.error("NumPy is required to compute many scalar field values.")
+            return False
+        if pandas_output and pd is None:  # pragma: no cover
+            self.logger.error("Pandas is required to return a DataFrame.")
+            return False
+        keys = ["quantity", "object_name", "scalar_function", "intrinsics", "variations"]
+        defaults = {
+            "scalar_function": "Maximum",
+            "solution": solution,
+            "variations": None,
+            "is_vector": False,
+            "intrinsics": None,
+            "phase": None,
+            "object_name": "AllObjects",
+            "object_type": "volume",
+            "adjacent_side": False,
+        }
+        entries = []
+        for request in requests:
+            entry = dict(defaults)
+            if isinstance(request, dict):
+                entry.update(request)
+            else:
+                entry.update(zip(keys, request if isinstance(request, (list, tuple)) else [request]))
+            if not entry["solution"]:
+                entry["solution"] = self._app.existing_analysis_sweeps[0]
+            entries.append(entry)
+
+        groups = {}
+        for index, entry in enumerate(entries):
+            stack_key = repr(
+                [entry[k] for k in ["quantity", "scalar_function", "is_vector", "object_name", "object_type"]]
+                + [entry["adjacent_side"]]
+            )
+            groups.setdefault(stack_key, []).append(index)
+
+        self.logger.info(f"Computing {len(entries)} scalar field values with {len(groups)} calculator stacks.")
+        sweep_variables = {k for k, v in self._app.variable_manager.variables.items() if v.sweep}
+        arguments = {}
+        values = np.full(len(entries), np.nan)
+        for indices in groups.values():
+            first = entries[indices[0]]
+            self.ofieldsreporter.CalcStack("clear")
+            self._enter_scalar_quantity(
+                first["quantity"],
+                first["scalar_function"],
+                first["is_vector"],
+                first["object_name"],
+                first["object_type"],
+                first["adjacent_side"],
+            )
+            for index in indices:
+                entry = entries[index]
+                args_key = repr([entry["variations"], entry["intrinsics"], entry["phase"], entry["solution"]])
+                if args_key not in arguments:
+                    args = self._sweep_variation_arguments(entry["variations"], sweep_variables)
+                    args.extend(
+                        self._app._check_intrinsics(
+                            entry["intrinsics"], entry["phase"], entry["solution"], return_list=True
+                        )
+                    )
+                    arguments[args_key] = args
+                values[index] = self.fields_calculator.read_stack_top(entry["solution"], arguments[args_key])
+        self.ofieldsreporter.CalcStack("clear")
+
+        if not pandas_output:
+            return values
+        return pd.DataFrame(
+            {
+                "quantity": [e["quantity"] for e in entries],
+                "object_name": [str(e["object_name"]) for e in entries],
+                "scalar_function": [e["scalar_function"] for e in entries],
+                "intrinsics": [str(e["intrinsics"]) if e["intrinsics"] else "" for e in entries],
+                "variations": [str(e["variations"]) if e["variations"] else "" for e in entries],
+                "value": values,
+            }
+        )
+
+    def _enter_scalar_quantity(self, quantity, scalar_function, is_vector, object_name, object_type, adjacent_side):
+        """Push a quantity and its scalar function on the calculator stack."""
         if is_vector:
             try:
                 self.ofieldsreporter.EnterQty(quantity)
@@ -497,28 +692,18 @@ class PostProcessor3D(PostProcessorCommon):
                 self.ofieldsreporter.EnterPoint(obj_list)
             self.ofieldsreporter.CalcOp(scalar_function)
 
+    def _sweep_variation_arguments(self, variations, sweep_variables=None):
+        """Build the calculator variation arguments from the swept variables."""
         if not variations:
             variations = self._app.available_variations.nominal_w_values_dict
-
+        if sweep_variables is None:
+            sweep_variables = {k for k, v in self._app.variable_manager.variables.items() if v.sweep}
         variation = []
         for el, value in variations.items():
-            if self._app.variable_manager.variables[el].sweep:
+            if el in sweep_variables:
                 variation.append(el + ":=")
                 variation.append(value)
-
-        variation.extend(intrinsics)
-
-        file_name = os.path.join(self._app.working_directory, generate_unique_name("temp_fld") + ".fld")
-        self.ofieldsreporter.CalculatorWrite(file_name, ["Solution:=", solution], variation)
-        value = None
-        if os.path.exists(file_name) or settings.remote_rpc_session:
-            with open_file(file_name, "r") as f:
-                lines = f.readlines()
-                lines = [line.strip() for line in lines]
-                value = lines[-1]
-            os.remove(file_name)
-        self.ofieldsreporter.CalcStack("clear")
-        return float(value)
+        return variation
 
     @pyaedt_function_handler(
         quantity_name="quantity",
@@ -713,6 +898,189 @@ class PostProcessor3D(PostProcessorCommon):
             return file_name
         return False  # pragma: no cover
 
+    @pyaedt_function_handler()
+    def export_field_on_grid_tiles(
+        self,
+        quantity,
+        output_directory=None,
+        solution=None,
+        variations=None,
+        grid_type="Cartesian",
+        grid_center=None,
+        grid_start=None,
+        grid_stop=None,
+        grid_step=None,
+        tile_size=50,
+        is_vector=False,
+        intrinsics=None,
+        phase=None,
+        reference_coordinate_system="Global",
+        export_in_si_system=True,
+        export_field_in_reference=True,
+        overwrite=False,
+    ):
+        """Export a field on a large grid tile by tile into a chunked binary store.
+
+        The grid is split into tiles that are exported one at a time with
+        :func:`export_field_file_on_grid`. Reading each exported tile overlaps with the export of
+        the next one. Completed tiles are saved as NumPy files and skipped when the export is run
+        again with the same parameters and the same solution, so an interrupted export resumes where
+        it stopped. The solution is identified by the latest modification time of the results directory,
+        so the store is reset after the design is solved again. When all tiles are exported, they are
+        consolidated into a single memory-mapped array.
+
+        Parameters
+        ----------
+        quantity : str
+            Name of the quantity to export. For example, ``"Temp"``.
+        output_directory : str, optional
+            Directory of the store. The default is ``None``, in which case a directory named
+            after the quantity and the solution is created in the working directory.
+        solution : str, optional
+            Name of the solution in the format ``"solution : sweep"``. The default is ``None``.
+        variations : dict, optional
+            Dictionary of all variation variables with their values.
+            The default is ``None``.
+        grid_type : str, optional
+            Type of the grid to export. Options are ``"Cartesian"``, ``"Cylindrical"``, and
+            ``"Spherical"``. The default is ``"Cartesian"``.
+        grid_center : list, optional
+            The ``[x, y, z]`` coordinates for the center of the grid.
+            The default is ``[0, 0, 0]``.
+        grid_start : list, optional
+            Starting point of the grid. The default is ``[0, 0, 0]``.
+        grid_stop : list, optional
+            Stopping point of the grid. The default is ``[0, 0, 0]``.
+        grid_step : list, optional
+            Step size of the grid. The default is ``[0, 0, 0]``.
+        tile_size : int or list, optional
+            Maximum number of grid points per axis in a tile. The default is ``50``.
+        is_vector : bool, optional
+            Whether the quantity is a vector. The  default is ``False``.
+        intrinsics : dict, str, optional
+            Intrinsic variables required to compute the field before the export.
+            The default is ``None`` in which case the intrinsics value is automatically computed based on the setup.
+        phase : str, optional
+            Field phase. The default is ``None``.
+        reference_coordinate_system : str, optional
+            Reference coordinate system in the file to export.
+            The default is ``"Global"``.
+        export_in_si_system : bool, optional
+            Whether the provided sample points are defined in the SI system or model units.
+            The default is ``True``.
+        export_field_in_reference : bool, optional
+            Whether to export the field in reference coordinate system.
+            The default is ``True``.
+        overwrite : bool, optional
+            Whether to discard the tiles and the store of a previous export and export all tiles again.
+            The default is ``False``.
+
+        Returns
+        -------
+        :class:`ansys.aedt.core.visualization.post.grid_field_store.GridFieldStore` or bool
+            Store whose ``points`` and ``values`` are memory-mapped arrays, ``False`` when failed.
+
+        References
+        ----------
+        >>> oModule.ExportOnGrid
+
+        Examples
+        --------
+        >>> from ansys.aedt.core import Hfss
+        >>> hfss = Hfss()
+        >>> store = hfss.post.export_field_on_grid_tiles(
+        ...     "Mag_E", grid_start=[-50, -50, -50], grid_stop=[50, 50, 50], grid_step=[0.5, 0.5, 0.5], tile_size=40
+        ... )
+        >>> max_e = store.values[:, 0].max()
+        """
+        if np is None:  # pragma: no cover
+            self.logger.error("NumPy is required to export a field on grid tiles.")
+            return False
+        from concurrent.futures import ThreadPoolExecutor
+
+        from ansys.aedt.core.visualization.post.grid_field_store import GridFieldStore
+        from ansys.aedt.core.visualization.post.grid_field_store import grid_tiles
+
+        if grid_step is None:
+            grid_step = [0, 0, 0]
+        if grid_start is None:
+            grid_start = [0, 0, 0]
+        if grid_stop is None:
+            grid_stop = [0, 0, 0]
+        if grid_center is None:
+            grid_center = [0, 0, 0]
+        if not solution:
+            solution = self._app.existing_analysis_sweeps[0]
+        if not output_directory:
+            output_directory = os.path.join(
+                self._app.working_directory, f"{quantity}_{solution.replace(' : ', '_')}_grid"
+            )
+        store = GridFieldStore(output_directory)
+        tiles = grid_tiles(grid_start, grid_stop, grid_step, tile_size)
+        parameters = {
+            "quantity": quantity,
+            "solution": solution,
+            "variations": str(variations),
+            "grid_type": grid_type,
+            "grid_center": list(grid_center),
+            "grid_step": list(grid_step),
+            "is_vector": is_vector,
+            "intrinsics": str(intrinsics),
+            "phase": str(phase),
+            "reference_coordinate_system": reference_coordinate_system,
+            "export_in_si_system": export_in_si_system,
+            "export_field_in_reference": export_field_in_reference,
+            "solution_time": _latest_modification_time(self._app.results_directory),
+        }
+        store.initialize(parameters, tiles, overwrite=overwrite)
+        if store.is_complete:
+            self.logger.info(f"Field {quantity} already exported to {output_directory}.")
+            return store
+        pending = [i for i in range(len(tiles)) if i not in store.completed_tiles]
+        self.logger.info(f"Exporting {quantity} field on {len(tiles)} grid tiles, {len(pending)} remaining.")
+
+        with ThreadPoolExecutor(max_workers=1) as reader:
+            stored = None
+            for index in pending:
+                tile_start, tile_stop = tiles[index]
+                tile_file = os.path.join(output_directory, f"tile_{index:05d}.fld")
+                exported = self.export_field_file_on_grid(
+                    quantity,
+                    solution=solution,
+                    variations=variations,
+                    file_name=tile_file,
+                    grid_type=grid_type,
+                    grid_center=grid_center,
+                    grid_start=list(tile_start),
+                    grid_stop=list(tile_stop),
+                    grid_step=grid_step,
+                    is_vector=is_vector,
+                    intrinsics=intrinsics,
+                    phase=phase,
+                    export_with_sample_points=True,
+                    reference_coordinate_system=reference_coordinate_system,
+                    export_in_si_system=export_in_si_system,
+                    export_field_in_reference=export_field_in_reference,
+                )
+                if stored:
+                    stored.result()
+                if not exported:
+                    self.logger.error(f"Export of grid tile {index} failed. Run the export again to resume.")
+                    return False
+                stored = reader.submit(self._store_grid_tile, store, index, exported)
+            if stored:
+                stored.result()
+        if not store.consolidate():  # pragma: no cover
+            return False
+        self.logger.info(f"Field {quantity} exported to {output_directory}.")
+        return store
+
+    @staticmethod
+    def _store_grid_tile(store, index, file_name):
+        """Read an exported tile into the store and remove its field file."""
+        store.write_tile(index, _read_field_points_file(file_name))
+        os.remove(file_name)
+
     @pyaedt_function_handler(
         quantity_name="quantity",
         variation_dict="variations",
@@ -917,6 +1285,91 @@ class PostProcessor3D(PostProcessorCommon):
             return output_file
         return False  # pragma: no cover
 
+    @pyaedt_function_handler()
+    def probe_field_values(
+        self, quantity, points, solution=None, variations=None, intrinsics=None, output_file=None, pandas_output=False
+    ):
+        """Get the values of a field quantity at many points.
+
+        All points are written to one sample points file and evaluated with a single
+        field calculator export. No field plot nor markers are needed.
+
+        Parameters
+        ----------
+        quantity : str
+            Name of the quantity or named expression to probe. For example, ``"Temp"``.
+        points : list or :class:`numpy.ndarray`
+            Point coordinates ``[x, y, z]`` in model units, or list of them.
+        solution : str, optional
+            Name of the solution in the format ``"solution: sweep"``.
+            The default is ``None``, in which case the first available sweep is used.
+        variations : dict, optional
+            Dictionary of all variation variables with their values.
+            The default is ``None``, in which case the nominal variation is used.
+        intrinsics : dict, str, optional
+            Intrinsic variables required to compute the field. The default is ``None``.
+            For more information, see the ``export_field_file()`` method.
+        output_file : str, optional
+            Full path to the field file to export. The default is ``None``, in which case
+            a file in the working directory is used and removed after it is read.
+        pandas_output : bool, optional
+            Whether to return the values as a pandas DataFrame. The default is ``False``.
+
+        Returns
+        -------
+        :class:`numpy.ndarray` or :class:`pandas.DataFrame`
+            Array with one row per point. The first three columns are the point coordinates
+            as exported by AEDT and the remaining ones are the quantity components.
+            Points outside the solution domain have ``nan`` values.
+            ``False`` is returned when the export fails.
+
+        References
+        ----------
+        >>> oModule.ExportToFile
+
+        Examples
+        --------
+        >>> from ansys.aedt.core import Icepak
+        >>> ipk = Icepak()
+        >>> values = ipk.post.probe_field_values("Temp", [[0, 0, 0], [1, 2, 3]])
+        """
+        if np is None:  # pragma: no cover
+            self.logger.error("NumPy is needed to probe field values.")
+            return False
+        points = np.atleast_2d(np.asarray(points, dtype=float))
+        base_name = generate_unique_name("probe")
+        points_file = os.path.join(self._app.working_directory, base_name + ".pts")
+        keep_output = output_file is not None
+        if not keep_output:
+            output_file = os.path.join(self._app.working_directory, base_name + ".fld")
+        with open_file(points_file, "w") as f:
+            f.write(f"Unit={self.model_units}\n")
+            np.savetxt(f, points, fmt="%.15g")
+        try:
+            output_file = self.export_field_file(
+                quantity,
+                solution=solution,
+                variations=variations,
+                output_file=output_file,
+                intrinsics=intrinsics,
+                sample_points_file=points_file,
+            )
+            if not output_file:
+                return False
+            values = _read_field_points_file(output_file)
+        finally:
+            os.remove(points_file)
+            if not keep_output and output_file and os.path.exists(output_file):
+                os.remove(output_file)
+        if pandas_output:
+            if pd is None:  # pragma: no cover
+                self.logger.error("Pandas is needed to return a DataFrame.")
+                return False
+            components = values.shape[1] - 3
+            columns = [quantity] if components == 1 else [f"{quantity}_{i}" for i in range(components)]
+            return pd.DataFrame(values, columns=["x", "y", "z"] + columns)
+        return values
+
     @pyaedt_function_handler(plotname="plot_name", filepath="output_dir", filename="file_name")
     def export_field_plot(self, plot_name, output_dir, file_name="", file_format="aedtplt"):
         """Export a field plot.
@@ -3835,11 +4288,15 @@ class PostProcessor3D(PostProcessorCommon):
             frames_paths_list = frames
         scene = self.get_model_plotter_geometries(generate_mesh=False)
 
-        norm_data = np.loadtxt(frames_paths_list[norm_index], skiprows=1, delimiter=",")
-        norm_val = norm_data[:, -1]
-        v_max = np.max(norm_val)
+        scene.add_frames_from_file(
+            frames_paths_list, log_scale=False, color_map="jet", header_lines=1, opacity=0.8, streaming=True
+        )
+        statistics = frame_statistics([frames_paths_list[norm_index]], column=-1, header_lines=1)
+        if not statistics or statistics[1] is None:
+            self.logger.error("Failed to read the values of the normalization frame.")
+            return False
+        v_max = statistics[1]
         v_min = v_max - dy_rng
-        scene.add_frames_from_file(frames_paths_list, log_scale=False, color_map="jet", header_lines=1, opacity=0.8)
 
         # Specifying the attributes of the scene through the ModelPlotter object
         scene.off_screen = not show
@@ -22,9 +22,15 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import subprocess
+from unittest.mock import MagicMock
 from unittest.mock import patch
 
 from ansys.aedt.core.visualization.advanced.touchstone_parser import TouchstoneData
+from ansys.aedt.core.visualization.advanced.touchstone_parser import check_touchstone_files
+from ansys.aedt.core.visualization.advanced.touchstone_parser import touchstone_check_summary
+import numpy as np
+import pytest
 
 
 @patch("ansys.aedt.core.visualization.advanced.touchstone_parser.plt")
@@ -64,3 +70,108 @@ def test_plot_fext_xtalk_losses(mock_show, mock_plot_s_db, touchstone_file):
 
     assert res
     mock_show.show.assert_called_once()
+
+
+def test_port_index(touchstone_file):
+    ts = TouchstoneData(touchstone_file=touchstone_file)
+
+    assert ts.port_index == {"Port1": 0, "Port2": 1}
+    ts.port_names[0] = "Tx1"
+    assert ts.port_index == {"Tx1": 0, "Port2": 1}
+    assert ts.get_return_loss_index("tx") == [[0, 0]]
+    assert ts.get_next_xtalk_index() == [[0, 1]]
+    assert ts.get_fext_xtalk_index_from_prefix("Tx", "Port", skip_same_index_couples=True) == []
+
+
+@pytest.fixture
+def multi_frequency_touchstone_file(tmp_path):
+    file_path = tmp_path / "sweep.s2p"
+    file_path.write_text(
+        """! Port[1] = Port1
+! Port[2] = Port2
+# GHz S MA R 50
+1 0.1 0 0.5 0 0.5 0 0.3 0
+2 0.2 0 0.6 0 0.6 0 0.4 0
+3 0.3 0 0.7 0 0.7 0 0.5 0
+"""
+    )
+    return file_path
+
+
+def test_get_worst_curve(multi_frequency_touchstone_file):
+    ts = TouchstoneData(touchstone_file=multi_frequency_touchstone_file)
+    worst_el, dict_means = ts.get_worst_curve(plot=False)
+
+    assert worst_el == (0, 1)
+    assert list(dict_means) == [(0, 1), (1, 1), (0, 0)]
+    assert np.allclose(list(dict_means.values()), [0.55, 0.35, 0.15])
+
+    worst_el, dict_means = ts.get_worst_curve(freq_min=2, freq_max=2, worst_is_higher=False, plot=False)
+    assert worst_el == (0, 0)
+    assert np.allclose([dict_means[(0, 0)], dict_means[(1, 1)], dict_means[(0, 1)]], [0.2, 0.4, 0.6])
+
+    assert not ts.get_worst_curve(freq_min=5, plot=False)
+
+
+def test_get_worst_curve_single_frequency(touchstone_file):
+    ts = TouchstoneData(touchstone_file=touchstone_file)
+    _, dict_means = ts.get_worst_curve(plot=False)
+
+    assert not np.isnan(list(dict_means.values())).any()
+
+
+def test_touchstone_data_from_solution_data():
+    solution_data = MagicMock()
+    solution_data.primary_sweep_values = [1e9, 2e9]
+    solution_data.expressions = ["S(P1,P1)", "S(P1,P2)", "S(P2,P2)"]
+    solution_data.active_variation = {"a": "1mm"}
+    values = {"S(P1,P1)": [0.1, 0.2], "S(P1,P2)": [0.5, 0.6], "S(P2,P2)": [0.3, 0.4]}
+    solution_data.data_real.side_effect = lambda expression, _: values[expression]
+    solution_data.data_imag.side_effect = lambda expression, _: [0.0, 0.1]
+    ts = TouchstoneData(solution_data=solution_data)
+
+    assert ts.port_names == ["P1", "P2"]
+    assert ts.s.shape == (2, 2, 2)
+    assert ts.s[1, 0, 1] == ts.s[1, 1, 0] == 0.6 + 0.1j
+    assert ts.s[0, 1, 1] == 0.3
+
+
+GENEQUIV_OUTPUT = (
+    b"genequiv message: Input data are passive\r\n"
+    b"genequiv message: Maximum causality error: 0.0 for entry (1,1)\r\n"
+)
+
+
+@patch("ansys.aedt.core.visualization.advanced.touchstone_parser._genequiv_path", return_value="genequiv")
+@patch("ansys.aedt.core.visualization.advanced.touchstone_parser.subprocess.run")
+def test_check_touchstone_files_cache(mock_run, mock_genequiv_path, touchstone_file, tmp_path):
+    mock_run.return_value = MagicMock(stdout=GENEQUIV_OUTPUT)
+    cache_file = tmp_path / "cache.json"
+
+    res = check_touchstone_files(str(tmp_path), cache_file=str(cache_file), max_workers=2, timeout=10)
+    assert res["dummy.s2p"][0][:2] == ["passivity", True]
+    assert res["dummy.s2p"][1][:2] == ["causality", True]
+    assert mock_run.call_count == 1
+    assert mock_run.call_args.kwargs["timeout"] == 10
+    assert cache_file.is_file()
+
+    summary = touchstone_check_summary(str(tmp_path), cache_file=str(cache_file))
+    assert mock_run.call_count == 1
+    assert len(summary) == 1
+    assert summary[0]["file"] == "dummy.s2p"
+    assert summary[0]["status"] == "done"
+    assert summary[0]["cached"]
+    assert summary[0]["passivity"]
+    assert summary[0]["causality"]
+    assert summary[0]["causality_log"] == " Maximum causality error: 0.0 for entry (1,1)"
+
+
+@patch("ansys.aedt.core.visualization.advanced.touchstone_parser._genequiv_path", return_value="genequiv")
+@patch("ansys.aedt.core.visualization.advanced.touchstone_parser.subprocess.run")
+def test_touchstone_check_summary_timeout(mock_run, mock_genequiv_path, touchstone_file, tmp_path):
+    touchstone_file.write_text(touchstone_file.read_text() + "\n")
+    mock_run.side_effect = subprocess.TimeoutExpired("genequiv", 1)
+
+    summary = touchstone_check_summary(str(tmp_path), timeout=1)
+    assert summary[0]["status"] == "timeout"
+    assert summary[0]["passivity"] is None
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2024 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import os
+import socket
+import subprocess  # nosec
+import sys
+import time
+from unittest.mock import patch
+
+from ansys.aedt.core.desktop import _find_free_port
+from ansys.aedt.core.generic import general_methods
+from ansys.aedt.core.generic.general_methods import active_sessions
+from ansys.aedt.core.generic.general_methods import clear_active_sessions_cache
+import psutil
+import pytest
+
+LISTENER = (
+    "import socket, sys, time\n"
+    "s = socket.socket()\n"
+    "s.bind(('127.0.0.1', int(sys.argv[1])))\n"
+    "s.listen()\n"
+    "time.sleep(60)\n"
+)
+
+
+def _free_port_in_range(start, stop):
+    for port in range(start, stop):
+        with socket.socket() as s:
+            try:
+                s.bind(("127.0.0.1", port))
+            except OSError:
+                continue
+            return port
+    pytest.skip("No free port available for the dummy session.")
+
+
+@pytest.fixture
+def dummy_sessions(tmp_path):
+    if os.name != "posix":  # pragma: no cover
+        pytest.skip("Dummy AEDT processes rely on a renamed Python executable.")
+    executable = tmp_path / "ansysedt"
+    executable.symlink_to(sys.executable)
+    com_port = _free_port_in_range(50100, 50200)
+    grpc_port = _free_port_in_range(18000, 18100)
+    processes = [
+        subprocess.Popen([str(executable), "-c", LISTENER, str(com_port)]),  # nosec
+        subprocess.Popen([str(executable), "-c", LISTENER, str(grpc_port), "-grpcsrv", str(grpc_port)]),  # nosec
+    ]
+    clear_active_sessions_cache()
+    start = time.time()
+    while time.time() - start < 10:
+        listening = {c.laddr.port for c in psutil.net_connections(kind="tcp") if c.status == psutil.CONN_LISTEN}
+        if {com_port, grpc_port} <= listening:
+            break
+        time.sleep(0.05)
+    yield {processes[0].pid: com_port, processes[1].pid: grpc_port}
+    for p in processes:
+        p.kill()
+        p.wait()
+    clear_active_sessions_cache()
+
+
+def test_active_sessions_with_dummy_processes(dummy_sessions):
+    sessions = active_sessions()
+    for pid, port in dummy_sessions.items():
+        assert sessions[pid] == port
+
+
+def test_active_sessions_scans_once(dummy_sessions):
+    with patch.object(psutil, "process_iter", wraps=psutil.process_iter) as process_iter, patch.object(
+        psutil, "net_connections", wraps=psutil.net_connections
+    ) as net_connections:
+        active_sessions()
+        active_sessions()
+        assert process_iter.call_count == 1
+        assert net_connections.call_count == 1
+        clear_active_sessions_cache()
+        active_sessions()
+        assert process_iter.call_count == 2
+
+
+def test_find_free_port_does_not_scan_processes():
+    clear_active_sessions_cache()
+    with patch.object(general_methods, "_scan_aedt_processes") as scan:
+        port = _find_free_port()
+        scan.assert_not_called()
+    assert port not in range(50051, 50070)
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", port))
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2024 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import os
+from unittest.mock import MagicMock
+
+from ansys.aedt.core.application.analysis import Analysis
+import pytest
+
+
+@pytest.fixture
+def available_variations(tmp_path):
+    app = MagicMock()
+    app.existing_analysis_sweeps = ["Setup1 : Sweep"]
+    app.results_directory = str(tmp_path)
+    app.design_name = "Design1"
+    variables = {}
+    for name, post_processing in [("length", False), ("width", False), ("pp", True)]:
+        variables[name] = MagicMock(post_processing=post_processing)
+    app.variable_manager.variables = variables
+    app.osolution.GetAvailableVariations.return_value = [
+        "width='1mm' length='10mm'",
+        "width='2mm' length='10mm'",
+        "width='2mm' length='20mm'",
+    ]
+    (tmp_path / "Design1.results").mkdir()
+    return Analysis.AvailableVariations(app)
+
+
+def test_variations_outputs(available_variations):
+    assert available_variations.variations(output_as_dict=True)[1] == {"length": "10mm", "width": "2mm"}
+    assert available_variations.variations()[0] == ["length:=", ["10mm"], "width:=", ["1mm"]]
+
+
+def test_variation_table_cached_until_results_change(available_variations, tmp_path):
+    pytest.importorskip("numpy")
+    pytest.importorskip("pandas")
+    app = available_variations._app
+    table = available_variations.variation_table()
+    assert table.dtype.names == ("length", "width")
+    assert list(table["width"]) == ["1mm", "2mm", "2mm"]
+    available_variations.variations()
+    df = available_variations.variation_table(pandas_output=True)
+    assert list(df.columns) == ["length", "width"]
+    assert app.osolution.GetAvailableVariations.call_count == 1
+    (tmp_path / "Design1.results" / "DV1.results").mkdir()
+    app.osolution.GetAvailableVariations.return_value = ["width='3mm' length='30mm'"]
+    os.utime(tmp_path / "Design1.results", (0, 0))
+    assert available_variations.variations(output_as_dict=True) == [{"length": "30mm", "width": "3mm"}]
+    assert app.osolution.GetAvailableVariations.call_count == 2
+
+
+def test_find_variations(available_variations):
+    assert available_variations.find_variations({"width": "2mm"}, output_as_dict=False) == [1, 2]
+    assert available_variations.find_variations({"width": 2, "length": 20}) == [{"length": "20mm", "width": "2mm"}]
+    assert available_variations.find_variations({"height": 1}) == []
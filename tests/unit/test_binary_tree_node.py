@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2024 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from unittest.mock import MagicMock
+
+from ansys.aedt.core.generic.settings import settings
+from ansys.aedt.core.modeler.cad.elements_3d import BinaryTreeNode
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def legacy_aedt_version(monkeypatch):
+    # Versions before 2024.2 read each property with ``GetPropValue``.
+    monkeypatch.setattr(settings, "_Settings__aedt_version", "2024.1")
+
+
+def _history_object():
+    props = {"Command": "CreateBox", "XSize": "1mm"}
+    create_box = MagicMock()
+    create_box.GetChildNames.return_value = []
+    create_box.GetPropNames.return_value = list(props)
+    create_box.GetPropValue.side_effect = lambda name: props[name]
+    create_box.SetPropValue.return_value = True
+    move = MagicMock()
+    move.GetPropNames.return_value = ["Command"]
+    move.GetPropValue.return_value = "Move"
+    root = MagicMock()
+    root.GetChildNames.return_value = ["CreateBox:1", "Move:1"]
+    root.GetChildObject.side_effect = lambda name: {"CreateBox:1": create_box, "Move:1": move}[name]
+    return root, create_box, move
+
+
+def test_first_level_children_are_lazy():
+    root, _, move = _history_object()
+    node = BinaryTreeNode("Box1", root, True)
+    root.GetChildNames.assert_not_called()
+    assert list(node.children) == ["Move:1"]
+    root.GetChildObject.assert_called_once_with("CreateBox:1")
+    assert node.children["Move:1"].command == "Move"
+    assert root.GetChildObject.call_count == 2
+    assert node.segments is None
+
+
+def test_history_properties_cached_until_update():
+    root, create_box, _ = _history_object()
+    node = BinaryTreeNode("Box1", root, True)
+    assert node.command == "CreateBox"
+    assert node.properties["XSize"] == "1mm"
+    assert create_box.GetPropValue.call_count == 2
+    node.properties["XSize"] = "2mm"
+    create_box.SetPropValue.assert_called_once_with("XSize", "2mm")
+    node.properties
+    assert create_box.GetPropValue.call_count == 4
+    node.refresh()
+    assert node.command == "CreateBox"
+    assert root.GetChildNames.call_count == 2
+
+
+def test_non_history_node_properties_not_cached():
+    child_object = MagicMock()
+    child_object.GetPropNames.return_value = ["Type"]
+    child_object.GetPropValue.return_value = "Radiation"
+    node = BinaryTreeNode("Rad1", child_object, False)
+    assert node.properties["Type"] == "Radiation"
+    assert node.properties["Type"] == "Radiation"
+    assert child_object.GetPropValue.call_count == 2
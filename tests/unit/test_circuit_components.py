@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2024 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from unittest.mock import MagicMock
+
+from ansys.aedt.core.modeler.circuits.object_3d_circuit import CircuitComponent
+from ansys.aedt.core.modeler.circuits.primitives_circuit import CircuitComponentTable
+from ansys.aedt.core.modeler.circuits.primitives_nexxim import NexximComponents
+import pytest
+
+
+@pytest.fixture
+def schematic():
+    """Create Nexxim components on top of a mocked schematic editor."""
+    modeler = MagicMock()
+    modeler.oeditor.GetAllElements.return_value = [
+        "CompInst@R;1;10",
+        "CompInst@C;2;20",
+        "Wire@NetA;3;30",
+        "GPort@gnd;4",
+    ]
+    return NexximComponents(modeler)
+
+
+def test_refresh_all_ids(schematic):
+    """Test that a refresh indexes every non-wire element by ID and by name."""
+    assert schematic.refresh_all_ids() == 3
+    assert sorted(schematic.components) == [1, 2, 4]
+    assert schematic.get_obj_id("CompInst@C") == 2
+    assert schematic.get_obj_id("GPort@gnd") == 4
+    assert schematic.get_obj_id("Wire@NetA") is None
+    assert schematic["CompInst@R"] is schematic.components[1]
+
+
+def test_add_id_to_component_without_listing(schematic):
+    """Test that adding a created component does not list the schematic elements."""
+    schematic.oeditor.GetAllElements.reset_mock()
+    schematic.add_id_to_component(5, "CompInst@L;5;50")
+
+    schematic.oeditor.GetAllElements.assert_not_called()
+    assert schematic.get_obj_id("CompInst@L") == 5
+    assert schematic.components[5].schematic_id == 50
+    assert schematic.create_unique_id() not in [1, 2, 3, 4, 5]
+
+
+def test_component_table_index(schematic):
+    """Test that the name index follows additions, deletions and renames."""
+    first = CircuitComponent(schematic)
+    first.name = "CompInst@R"
+    second = CircuitComponent(schematic)
+    second.name = "CompInst@C"
+    table = CircuitComponentTable({1: first, 2: second})
+    schematic.components = table
+
+    assert table.get_id("CompInst@C") == 2
+    del table[2]
+    assert table.get_id("CompInst@C") is None
+    first.name = "CompInst@R1"
+    assert table.get_id("CompInst@R") is None
+    assert table.get_id("CompInst@R1") == 1
+    table.pop(1)
+    assert not table._names
+
+
+def test_component_table_duplicate_names():
+    """Test that deleting one of two components with the same name keeps the other one indexed."""
+    first = MagicMock()
+    first.name = "CompInst@R"
+    second = MagicMock()
+    second.name = "CompInst@R"
+    table = CircuitComponentTable({1: first, 2: second})
+
+    assert table.get_id("CompInst@R") == 1
+    del table[1]
+    assert table.get_id("CompInst@R") == 2
+
+
+def test_get_component_by_composed_name(schematic):
+    """Test that composed names are resolved from the ID without scanning the components."""
+    assert schematic["CompInst@C;2;20"] is schematic.components[2]
+    assert schematic["GPort@gnd;4"] is schematic.components[4]
+    assert schematic["CompInst@C;1;10"] is None
+
+
+def test_unique_id_refreshed_on_collision(schematic):
+    """Test that the element IDs are listed again when AEDT does not use the requested ID."""
+    schematic.oeditor.GetAllElements.reset_mock()
+    requested_id = schematic.create_unique_id()
+    schematic.add_id_to_component(requested_id, f"CompInst@L;{requested_id};50")
+    schematic.oeditor.GetAllElements.assert_not_called()
+
+    schematic.oeditor.GetAllElements.return_value = ["CompInst@X;7;70"]
+    assigned_id = schematic.create_unique_id() % 65535 + 1
+    schematic.add_id_to_component(assigned_id, f"CompInst@L;{assigned_id};60")
+    schematic.oeditor.GetAllElements.assert_called_once()
+    assert 7 in schematic._element_ids
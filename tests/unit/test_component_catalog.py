@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2024 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from ansys.aedt.core.generic.settings import settings
+from ansys.aedt.core.modeler.circuits import primitives_circuit
+from ansys.aedt.core.modeler.circuits.primitives_circuit import ComponentCatalog
+import pytest
+
+ACLB_CONTENT = """$begin 'Components'
+\t$begin 'RES_'
+\t\tDescription='Resistor'
+\t\t$begin 'Parameters'
+\t\t\tValue='1ohm'
+\t\t$end 'Parameters'
+\t$end 'RES_'
+\t$begin 'CAP_'
+\t\tDescription='Capacitor'
+\t$end 'CAP_'
+$end 'Components'
+$begin 'DefInfo'
+\tRES_(1, 0, 'Resistor')
+$end 'DefInfo'
+$begin 'CompInfo'
+\tCAP_(1, 0, 'Capacitor')
+$end 'CompInfo'
+"""
+
+
+@pytest.fixture
+def component_manager(tmp_path, monkeypatch):
+    """Create a mocked Nexxim component manager with a small system library."""
+    monkeypatch.setattr(settings, "library_index_folder", str(tmp_path / "index"))
+    library_path = tmp_path / "syslib" / "Nexxim Circuit Elements"
+    library_path.mkdir(parents=True)
+    (library_path / "Lumped.aclb").write_text(ACLB_CONTENT)
+    manager = MagicMock()
+    manager._app.syslib = str(tmp_path / "syslib")
+    manager.design_libray = "Nexxim Circuit Elements"
+    return manager
+
+
+def test_catalog_index(component_manager):
+    """Test the component names and the lazy properties of the catalog."""
+    catalog = ComponentCatalog(component_manager)
+
+    assert sorted(catalog.components) == ["Lumped:CAP_", "Lumped:RES_"]
+    resistor = catalog["RES_"]
+    assert resistor.component_library == "Lumped"
+    assert resistor._props is None
+    assert resistor.props["RES_"]["Parameters"]["Value"] == "1ohm"
+    assert catalog["CAP_"].props == {"CAP_": {"Description": "Capacitor"}}
+
+
+def test_catalog_index_is_reused(component_manager):
+    """Test that library files are parsed only once across catalogs."""
+    ComponentCatalog(component_manager)
+    primitives_circuit._component_library_index._libraries = None
+    with patch.object(primitives_circuit._component_library_index, "_parser") as parser:
+        catalog = ComponentCatalog(component_manager)
+    parser.assert_not_called()
+    assert len(catalog.components) == 2
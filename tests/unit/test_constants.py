@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2024 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from ansys.aedt.core.generic.constants import scale_units
+from ansys.aedt.core.generic.constants import unit_converter
+from ansys.aedt.core.generic.constants import unit_system
+import pytest
+
+
+@pytest.mark.parametrize(
+    "values, unit_system_name, input_units, output_units, expected",
+    [
+        (1500, "Length", "mil", "mm", 38.1),
+        ([1, 2], "Freq", "GHz", "MHz", [1000.0, 2000.0]),
+        (0, "Temperature", "cel", "kel", 273.15),
+        ([32, 212], "Temperature", "fah", "cel", [0.0, 100.0]),
+        (1, "Power", "W", "dBm", 30.0),
+    ],
+)
+def test_unit_converter(values, unit_system_name, input_units, output_units, expected):
+    """Test scalar and list conversions."""
+    assert unit_converter(values, unit_system_name, input_units, output_units) == pytest.approx(expected)
+
+
+def test_unit_converter_array():
+    """Test NumPy array conversions."""
+    np = pytest.importorskip("numpy")
+    values = np.linspace(1, 10, 1000)
+
+    converted = unit_converter(values, "Length", "meter", "mm")
+    assert isinstance(converted, np.ndarray)
+    assert np.allclose(converted, values * 1000)
+    assert np.allclose(unit_converter(values, "Temperature", "kel", "cel"), values - 273.15)
+    assert np.allclose(unit_converter(values, "Voltage", "V", "dBV"), 20 * np.log10(values))
+
+
+def test_unit_converter_unknown_units():
+    """Test that unknown units return the input values."""
+    with pytest.warns(UserWarning):
+        assert unit_converter([1, 2], "Length", "dummy", "mm") == [1, 2]
+
+
+def test_unit_lookup():
+    """Test unit system and scale factor lookup."""
+    assert unit_system("GHz") == "Freq"
+    assert not unit_system("dummy")
+    assert scale_units("MM") == 1e-3
+    assert scale_units("dummy") == 1.0
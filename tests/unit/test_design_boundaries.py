@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2024 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from unittest.mock import MagicMock
+from unittest.mock import PropertyMock
+
+from ansys.aedt.core.application.design import Design
+import pytest
+
+
+@pytest.fixture
+def design(monkeypatch):
+    """Create an HFSS design with a mocked boundary module."""
+    oboundary = MagicMock(spec=["GetNumBoundaries", "GetNumExcitations"])
+    oboundary.GetNumBoundaries.return_value = 2
+    oboundary.GetNumExcitations.return_value = 1
+    monkeypatch.setattr(Design, "oboundary", PropertyMock(return_value=oboundary))
+    app = Design.__new__(Design)
+    app._design_type = "HFSS"
+    app._boundaries = {"Rad1": MagicMock(), "PerfE1": MagicMock(), "1": MagicMock()}
+    app._boundary_counts = None
+    app.refresh_boundaries = MagicMock(side_effect=lambda: list(app._boundaries.values()))
+    return app
+
+
+def test_boundaries_registry(design):
+    """Test that boundaries are synchronized only when the counts change."""
+    assert len(design.boundaries) == 3
+    assert len(design.boundaries) == 3
+    assert design.refresh_boundaries.call_count == 1
+
+    design.oboundary.GetNumBoundaries.return_value = 3
+    design.boundaries
+    assert design.refresh_boundaries.call_count == 2
+
+    design._boundaries["Rad2"] = MagicMock()
+    design.oboundary.GetNumBoundaries.return_value = 4
+    design._boundary_registry_changed()
+    assert len(design.boundaries) == 4
+    assert design.refresh_boundaries.call_count == 2
+
+
+def test_boundaries_without_counts(design, monkeypatch):
+    """Test that designs without boundary counts are always synchronized."""
+    monkeypatch.setattr(Design, "oboundary", PropertyMock(return_value=MagicMock(spec=[])))
+    design.boundaries
+    design.boundaries
+    assert design.refresh_boundaries.call_count == 2
+
+
+def test_boundaries_count_error_recovers(design):
+    """Test that a failure to read the counts forces synchronization until it recovers."""
+    design.oboundary.GetNumBoundaries.side_effect = [RuntimeError("AEDT busy"), 2, 2]
+    design.boundaries
+    assert design._boundary_counts is None
+    design.boundaries
+    assert design._boundary_counts == (2, 1)
+    design.boundaries
+    assert design.refresh_boundaries.call_count == 2
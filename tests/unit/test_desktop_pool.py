@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2024 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import socket
+import time
+from unittest.mock import MagicMock
+
+from ansys.aedt.core.desktop_pool import DesktopPool
+from ansys.aedt.core.generic.settings import settings
+import pytest
+
+
+class StubDesktop(object):
+    """Stands in for an AEDT gRPC session with a local listening socket."""
+
+    def __init__(self):
+        self._server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._server.bind(("127.0.0.1", 0))
+        self._server.listen(8)
+        self.port = self._server.getsockname()[1]
+        self.machine = ""
+        self.odesktop = MagicMock()
+        self.odesktop.GetProjectList.return_value = ["Project1"]
+        self.released = False
+
+    def stop(self):
+        self._server.close()
+
+    def release_desktop(self, close_projects=True, close_on_exit=True):
+        self.released = True
+        self.stop()
+        return True
+
+
+class StubFactory(object):
+    def __init__(self):
+        self.desktops = []
+
+    def __call__(self):
+        desktop = StubDesktop()
+        self.desktops.append(desktop)
+        return desktop
+
+
+def _wait_for(condition, timeout=5):
+    start = time.time()
+    while not condition():
+        if time.time() - start > timeout:  # pragma: no cover
+            raise AssertionError("Condition not met in time.")
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def factory():
+    return StubFactory()
+
+
+def test_pool_lends_prewarmed_sessions(factory):
+    with DesktopPool(size=2, desktop_factory=factory, health_check_interval=60) as pool:
+        assert pool.available == 2
+        with pool.session() as desktop:
+            assert desktop in factory.desktops
+            assert pool.available == 1
+        desktop.odesktop.CloseProject.assert_called_once_with("Project1")
+        assert pool.available == 2
+        assert len(factory.desktops) == 2
+    assert all(d.released for d in factory.desktops)
+
+
+def test_pool_recycles_after_max_uses(factory):
+    with DesktopPool(size=1, max_uses=2, desktop_factory=factory, health_check_interval=60) as pool:
+        first = pool.acquire()
+        assert pool.release(first)
+        assert pool.acquire() is first
+        assert not pool.release(first)
+        assert first.released
+        second = pool.acquire(timeout=5)
+        assert second is not first
+        pool.release(second)
+
+
+def test_pool_acquire_timeout(factory):
+    with DesktopPool(size=1, desktop_factory=factory, health_check_interval=60) as pool:
+        desktop = pool.acquire()
+        with pytest.raises(TimeoutError):
+            pool.acquire(timeout=0.1)
+        pool.release(desktop)
+
+
+def test_pool_health_check_and_idle_timeout(factory):
+    with DesktopPool(size=2, min_size=1, idle_timeout=0.05, desktop_factory=factory, health_check_interval=60) as pool:
+        factory.desktops[0].stop()
+        assert pool.check_health() == 1
+        _wait_for(lambda: pool.available == 1 and len(factory.desktops) == 2)
+        busy = pool.acquire()
+        other = pool.acquire(timeout=5)
+        pool.release(other)
+        time.sleep(0.1)
+        assert pool.check_health() == 1
+        assert other.released
+        assert pool.running == 1
+        pool.release(busy)
+
+
+def test_pool_start_enables_multi_desktop(factory, monkeypatch):
+    monkeypatch.setattr(settings, "use_multi_desktop", False)
+    pool = DesktopPool(size=1, desktop_factory=factory, health_check_interval=60)
+    assert not settings.use_multi_desktop
+    with pool:
+        assert settings.use_multi_desktop
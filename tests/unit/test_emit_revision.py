@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2024 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import threading
+from unittest.mock import MagicMock
+
+from ansys.aedt.core.emit_core.emit_constants import TxRxMode
+from ansys.aedt.core.emit_core.results.revision import Revision
+import pytest
+
+RADIOS = {"Radio1": ["B1", "B2"], "Radio2": ["B1"], "Radio3": ["B1"]}
+
+
+class FakeDomain(object):
+    def __init__(self):
+        self.receiver_channel_frequency = -1.0
+        self.interferer_channel_frequencies = []
+        self.receiver = None
+        self.interferer = None
+
+    def set_receiver(self, radio, band, freq=-1.0):
+        self.receiver = (radio, band, freq)
+
+    def set_interferer(self, radio, band, freq=-1.0):
+        self.interferer = (radio, band, freq)
+
+
+class FakeInstance(object):
+    def __init__(self, power):
+        self.power = power
+
+    def has_valid_values(self):
+        return True
+
+    def get_largest_emi_problem_type(self):
+        return "Out-of-Band: TxFundamental"
+
+    def get_value(self, result_type):
+        return self.power
+
+
+class FakeInteraction(object):
+    def __init__(self, key):
+        self.key = key
+
+    def is_valid(self):
+        return True
+
+    def get_instance(self, domain):
+        assert domain.receiver[:2] == self.key[:2] and domain.interferer[:2] == self.key[2:]
+        return FakeInstance(10.0 * int(self.key[0][-1]) - int(self.key[2][-1]) + domain.interferer[2])
+
+
+class FakeEngine(object):
+    def __init__(self):
+        self.runs = []
+        self._lock = threading.Lock()
+
+    def run(self, domain):
+        key = domain.receiver[:2] + domain.interferer[:2]
+        with self._lock:
+            self.runs.append(key)
+        return FakeInteraction(key)
+
+
+@pytest.fixture
+def revision(monkeypatch):
+    # EMIT constants are filled in when the EMIT API is loaded.
+    for i, mode in enumerate(["TX", "RX", "BOTH"]):
+        monkeypatch.setattr(TxRxMode, mode, i)
+    emit_api = MagicMock()
+    engine = FakeEngine()
+    emit_api.get_engine.return_value = engine
+    emit_api.get_radio_names.side_effect = lambda mode, interferer_type: list(RADIOS)
+    emit_api.get_band_names.side_effect = lambda radio, mode: RADIOS[radio]
+    emit_api.get_active_frequencies.side_effect = lambda radio, band, mode, units: [0.0, 1.0]
+    radio = MagicMock()
+    radio.bands.return_value = ["b1", "b2"]
+    radio.band_start_frequency.return_value = 100.0
+    radio.band_stop_frequency.return_value = 200.0
+    radio.band_channel_bandwidth.return_value = 1.0
+    rev = Revision.__new__(Revision)
+    rev.emit_project = MagicMock(_emit_api=emit_api, _aedt_version="2024.2")
+    rev.emit_project.modeler.components.get_radios.return_value = {name: radio for name in RADIOS}
+    rev.parent_results = MagicMock()
+    rev.parent_results.interaction_domain.side_effect = FakeDomain
+    rev.revision_loaded = True
+    rev._interactions = {}
+    rev._band_names = {}
+    rev._active_frequencies = {}
+    rev._cache_lock = threading.Lock()
+    return rev
+
+
+def test_classifications_share_interactions(revision):
+    engine = revision.emit_project._emit_api.get_engine()
+    colors, powers = revision.interference_type_classification(FakeDomain())
+    assert powers[0] == ["N/A", 20.0, 30.0]
+    assert colors[0] == ["white", "yellow", "yellow"]
+    n_runs = len(engine.runs)
+    assert n_runs == len(set(engine.runs)) == 10
+    colors, powers = revision.protection_level_classification(FakeDomain())
+    assert len(engine.runs) == n_runs
+    assert powers[1] == [9.0, "N/A", 29.0]
+    assert colors[1] == ["orange", "white", "orange"]
+    emit_api = revision.emit_project._emit_api
+    assert emit_api.get_band_names.call_count == 6
+    assert emit_api.get_active_frequencies.call_count == 8
+    revision.clear_interaction_cache()
+    revision.protection_level_classification(FakeDomain())
+    assert len(engine.runs) > n_runs
+
+
+def test_classification_with_worker_pool(revision):
+    sequential = revision.interference_type_classification(FakeDomain())
+    revision.clear_interaction_cache()
+    assert revision.interference_type_classification(FakeDomain(), max_workers=4) == sequential
+    assert revision.parent_results.interaction_domain.call_count == 6
+    assert revision.emit_project._emit_api.get_band_names.call_count == 12
+    assert revision._band_names[("Radio1", TxRxMode.RX)] == ["B1", "B2"]
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2024 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from unittest.mock import MagicMock
+
+from ansys.aedt.core.generic.settings import settings
+from ansys.aedt.core.visualization.post.fields_calculator import FieldsCalculator
+import pytest
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.fixture
+def calculator():
+    """Create a fields calculator on top of a mocked HFSS design."""
+    app = MagicMock()
+    app.design_type = "HFSS"
+    app.nominal_adaptive = "Setup1 : LastAdaptive"
+    app.existing_analysis_setups = ["Setup1"]
+    app.variable_manager.design_variables = {"w": MagicMock(expression="2mm")}
+    app.ofieldsreporter.DoesNamedExpressionExists.return_value = 1
+    return FieldsCalculator(app)
+
+
+def test_evaluate_many(calculator):
+    """Test the shape and the values of many evaluations read from the calculator stack."""
+    reporter = calculator.ofieldsreporter
+    reporter.GetTopEntryValue.side_effect = lambda setup, args: [str(len(reporter.GetTopEntryValue.mock_calls))]
+    intrinsics = [{"Freq": "1GHz", "Phase": "0deg"}, {"Freq": "2GHz", "Phase": "0deg"}]
+
+    values = calculator.evaluate_many(["Loss", "Flux"], intrinsics=intrinsics, variations=[{"w": "3mm"}, None])
+
+    assert values.shape == (2, 1, 2, 2)
+    assert sorted(values.ravel()) == list(range(1, 9))
+    assert values[0].ravel().tolist() == [1, 3, 2, 4]
+    reporter.CalculatorWrite.assert_not_called()
+    assert [c.args[0] for c in reporter.CopyNamedExprToStack.call_args_list] == ["Loss", "Flux"]
+    setup, args = reporter.GetTopEntryValue.call_args_list[0].args
+    assert setup == "Setup1 : LastAdaptive"
+    assert args == ["w:=", "3mm", "Freq:=", "1GHz", "Phase:=", "0deg"]
+
+
+def test_evaluate_many_dataframe(calculator):
+    """Test the DataFrame output and the values that cannot be evaluated."""
+    calculator.ofieldsreporter.GetTopEntryValue.return_value = ["1.5"]
+    calculator.ofieldsreporter.DoesNamedExpressionExists.side_effect = lambda name: int(name == "Loss")
+
+    df = calculator.evaluate_many(["Loss", "Missing"], intrinsics={"Freq": "1GHz"}, pandas_output=True)
+
+    assert list(df.index.names) == ["expression", "assignment", "intrinsics", "variation"]
+    assert df.loc[("Loss", "", "Freq=1GHz", ""), "value"] == 1.5
+    assert np.isnan(df.loc[("Missing", "", "Freq=1GHz", ""), "value"])
+
+
+def test_evaluate_many_file_fallback(calculator, tmp_path):
+    """Test that values are exported to files when the calculator stack cannot be read."""
+    calculator._FieldsCalculator__app.working_directory = str(tmp_path)
+    calculator.ofieldsreporter.GetTopEntryValue.side_effect = AttributeError("GetTopEntryValue")
+    calculator.ofieldsreporter.CalculatorWrite.side_effect = lambda f, s, a: open(f, "w").write("header\n2.5\n")
+
+    values = calculator.evaluate_many(["Loss", "Flux"], intrinsics={"Freq": "1GHz"})
+
+    assert values.ravel().tolist() == [2.5, 2.5]
+    assert calculator.ofieldsreporter.GetTopEntryValue.call_count == 1
+    assert not list(tmp_path.iterdir())
+
+
+def test_read_stack_top_transient_error(calculator, tmp_path):
+    """Test that a transient error exports one value to a file and keeps reading the stack."""
+    calculator._FieldsCalculator__app.working_directory = str(tmp_path)
+    reporter = calculator.ofieldsreporter
+    reporter.GetTopEntryValue.side_effect = [Exception("Busy"), ["3.5"]]
+    reporter.CalculatorWrite.side_effect = lambda f, s, a: open(f, "w").write("header\n2.5\n")
+
+    assert calculator.read_stack_top("Setup1 : LastAdaptive", []) == 2.5
+    assert calculator.read_stack_top("Setup1 : LastAdaptive", []) == 3.5
+    assert reporter.CalculatorWrite.call_count == 1
+    assert not list(tmp_path.iterdir())
+
+
+def test_evaluate_many_deletes_created_expressions(calculator, monkeypatch):
+    """Test that the named expressions added for catalog calculations are deleted, even after an error."""
+    reporter = calculator.ofieldsreporter
+    defined = {"Loss", "voltage_line_Polyline2"}
+    reporter.DoesNamedExpressionExists.side_effect = lambda name: int(name in defined)
+    reporter.DeleteNamedExpr.side_effect = defined.remove
+    reporter.GetTopEntryValue.return_value = ["1.0"]
+    calculator._FieldsCalculator__app.modeler.convert_to_selections.side_effect = lambda a, return_list: [a]
+    monkeypatch.setattr(calculator, "is_general_expression", MagicMock(return_value=False))
+    monkeypatch.setattr(
+        calculator, "add_expression", MagicMock(side_effect=lambda c, a, name: defined.add(name) or name)
+    )
+
+    values = calculator.evaluate_many(["voltage_line", "Loss"], assignments=["Polyline1", "Polyline2"])
+
+    assert values.shape == (2, 2, 1, 1)
+    assert [c.args[0] for c in reporter.DeleteNamedExpr.call_args_list] == ["voltage_line_Polyline1"]
+    assert defined == {"Loss", "voltage_line_Polyline2"}
+
+    monkeypatch.setattr(settings, "enable_error_handler", False)
+    monkeypatch.setattr(calculator, "read_stack_top", MagicMock(side_effect=RuntimeError("AEDT error")))
+    with pytest.raises(RuntimeError):
+        calculator.evaluate_many(["voltage_line"], assignments=["Polyline3"])
+    assert defined == {"Loss", "voltage_line_Polyline2"}
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2024 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import threading
+from unittest.mock import MagicMock
+
+from ansys.aedt.core.visualization.plot.frame_stream import FramePrefetcher
+from ansys.aedt.core.visualization.plot.frame_stream import convert_frame
+from ansys.aedt.core.visualization.plot.frame_stream import frame_statistics
+from ansys.aedt.core.visualization.plot.frame_stream import read_frame
+from ansys.aedt.core.visualization.plot.pyvista import ModelPlotter
+import pytest
+
+
+def write_frame(path, values):
+    with open(path, "w") as f:
+        f.write("x,y,z,value\n")
+        for i, value in enumerate(values):
+            f.write(f"{i},0,{2 * i},{value}\n")
+    return str(path)
+
+
+def test_read_frame_from_cache(tmp_path):
+    """Test that a frame is parsed in chunks once and then read from the cache."""
+    np = pytest.importorskip("numpy")
+    frame = write_frame(tmp_path / "frame_0.csv", [1.5, -2.0, 7.25])
+    info = convert_frame(frame, chunk_size=2)
+    assert info["rows"] == 3
+    assert info["min"][3] == -2.0
+    assert info["max"][3] == 7.25
+
+    data = read_frame(frame)
+    assert isinstance(data, np.memmap)
+    assert np.allclose(data[:, 2], [0, 2, 4])
+    assert np.allclose(data[:, 3], [1.5, -2.0, 7.25])
+
+    write_frame(tmp_path / "frame_0.csv", [1.5, -2.0, 7.25, 9.0])
+    assert read_frame(frame).shape == (4, 4)
+
+
+def test_frame_statistics(tmp_path):
+    """Test that the range of several frames comes from the cache information."""
+    pytest.importorskip("numpy")
+    frames = [write_frame(tmp_path / f"frame_{i}.csv", [i, 10 * i]) for i in range(3)]
+    cache_directory = str(tmp_path / "cache")
+    assert frame_statistics(frames, cache_directory=cache_directory) == (0.0, 20.0)
+    assert frame_statistics(frames[1:2], cache_directory=cache_directory) == (1.0, 10.0)
+
+
+def test_frame_statistics_last_column(tmp_path):
+    """Test that the range of the last column of vector frames can be read."""
+    pytest.importorskip("numpy")
+    frame = tmp_path / "frame_0.csv"
+    frame.write_text("x,y,z,vx,vy,vz\n0,0,0,1,2,3\n1,0,0,-4,5,6\n")
+    assert frame_statistics([str(frame)], column=-1) == (3.0, 6.0)
+
+
+def test_frames_range_vector_frames(tmp_path, monkeypatch):
+    """Test that vector frames are loaded to get the range of their magnitude."""
+    np = pytest.importorskip("numpy")
+    scalar = write_frame(tmp_path / "frame_0.csv", [1.0, 2.0])
+    vector = tmp_path / "frame_1.csv"
+    vector.write_text("x,y,z,vx,vy,vz\n0,0,0,3,4,0\n1,0,0,0,0,1\n")
+    plotter = ModelPlotter.__new__(ModelPlotter)
+    plotter._frames = [MagicMock(path=scalar, header_lines=1), MagicMock(path=str(vector), header_lines=1)]
+    plotter._convert_fields_in_db = False
+    plotter.frames_cache_directory = str(tmp_path / "cache")
+
+    def load_frame(frame):
+        frame.scalar_name = "value"
+        data = read_frame(frame.path)
+        return MagicMock(point_data={"value": np.linalg.norm(data[:, 3:], axis=1)})
+
+    monkeypatch.setattr(ModelPlotter, "_load_frame", MagicMock(side_effect=load_frame))
+    assert plotter._frames_range() == (1.0, 5.0)
+    assert ModelPlotter._load_frame.call_count == 2
+
+    plotter._frames = plotter.frames[:1]
+    assert plotter._frames_range() == (1.0, 2.0)
+    assert ModelPlotter._load_frame.call_count == 2
+
+
+def test_frame_prefetcher_lookahead():
+    """Test that frames are returned in order and loaded a bounded number ahead."""
+    loaded = []
+
+    with FramePrefetcher(10, lambda i: loaded.append(i) or i * 10, lookahead=2) as frames:
+        assert next(frames) == 0
+        threading.Event().wait(0.2)
+        assert len(loaded) <= 4
+        assert list(frames) == [10 * i for i in range(1, 10)]
+    assert loaded == list(range(10))
+
+
+def test_frame_prefetcher_error():
+    """Test that a failed frame stops the iteration with an error."""
+
+    def load(index):
+        if index == 1:
+            raise ValueError("corrupted")
+        return index
+
+    frames = FramePrefetcher(3, load)
+    assert next(frames) == 0
+    with pytest.raises(RuntimeError, match="frame 1"):
+        next(frames)
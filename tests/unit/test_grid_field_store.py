@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2024 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import os
+from unittest.mock import MagicMock
+
+from ansys.aedt.core.visualization.post.grid_field_store import GridFieldStore
+from ansys.aedt.core.visualization.post.grid_field_store import grid_tiles
+from ansys.aedt.core.visualization.post.post_common_3d import PostProcessor3D
+import pytest
+
+
+def test_grid_tiles():
+    """Test that the grid is split in tiles sharing no point."""
+    tiles = grid_tiles([0, 0, 0], [0.9, 0.4, 0], [0.1, 0.1, 0], 4)
+    assert len(tiles) == 3 * 2
+    assert tiles[0] == ((0.0, 0.0, 0.0), (0.3, 0.3, 0.0))
+    assert tiles[-1] == ((0.8, 0.4, 0.0), (0.9, 0.4, 0.0))
+
+
+def test_grid_field_store_resume(tmp_path):
+    """Test that completed tiles are kept only when the parameters match."""
+    np = pytest.importorskip("numpy")
+    tiles = grid_tiles([0, 0, 0], [1, 0, 0], [1, 0, 0], 1)
+    store = GridFieldStore(str(tmp_path))
+    assert not store.initialize({"quantity": "Temp"}, tiles)
+    store.write_tile(0, np.array([[0, 0, 0, 1.0]]))
+
+    store = GridFieldStore(str(tmp_path))
+    assert store.initialize({"quantity": "Temp"}, tiles)
+    assert store.completed_tiles == {0}
+    assert not store.initialize({"quantity": "Mag_E"}, tiles)
+    assert not store.completed_tiles
+
+
+def test_export_field_on_grid_tiles(tmp_path):
+    """Test that an interrupted export resumes from the first missing tile."""
+    np = pytest.importorskip("numpy")
+    post = PostProcessor3D.__new__(PostProcessor3D)
+    results = tmp_path / "project.aedtresults"
+    results.mkdir()
+    post._app = MagicMock(working_directory=str(tmp_path), results_directory=str(results))
+    exported = []
+
+    def export_field_file_on_grid(quantity, file_name, grid_start, grid_stop, grid_step, **kwargs):
+        exported.append(grid_start[0])
+        if len(exported) == 3:
+            return False
+        xs = np.arange(grid_start[0], grid_stop[0] + grid_step[0] / 2, grid_step[0])
+        with open(file_name, "w") as f:
+            f.write("X Y Z Temp\n")
+            for x in xs:
+                f.write(f"{x} 0 0 {10 * x}\n")
+        return file_name
+
+    post.export_field_file_on_grid = MagicMock(side_effect=export_field_file_on_grid)
+    kwargs = dict(
+        output_directory=str(tmp_path / "store"),
+        solution="Setup1 : SteadyState",
+        grid_stop=[9, 0, 0],
+        grid_step=[1, 0, 0],
+        tile_size=4,
+    )
+
+    assert not post.export_field_on_grid_tiles("Temp", **kwargs)
+    assert exported == [0.0, 4.0, 8.0]
+
+    store = post.export_field_on_grid_tiles("Temp", **kwargs)
+    assert exported[3:] == [8.0]
+    assert store.is_complete
+    assert not list((tmp_path / "store").glob("tile_*"))
+    assert np.allclose(store.points[:, 0], np.arange(10))
+    assert np.allclose(store.values[:, 0], 10 * np.arange(10))
+    assert post.export_field_on_grid_tiles("Temp", **kwargs) is not False
+    assert len(exported) == 4
+
+    # Solving the design again changes the results directory and resets the store
+    solution_file = results / "solution.dat"
+    solution_file.write_text("solved")
+    os.utime(solution_file, (results.stat().st_mtime + 10, results.stat().st_mtime + 10))
+    assert post.export_field_on_grid_tiles("Temp", **kwargs).is_complete
+    assert len(exported) == 7
+    assert post.export_field_on_grid_tiles("Temp", overwrite=True, **kwargs).is_complete
+    assert len(exported) == 10
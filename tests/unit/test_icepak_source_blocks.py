@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2024 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from unittest.mock import MagicMock
+from unittest.mock import PropertyMock
+
+from ansys.aedt.core import icepak
+from ansys.aedt.core.icepak import Icepak
+import pytest
+
+SHERLOCK_CSV = """Ref Des,Applied Power (W),Package
+U1,0.5,QFN
+U2,0.5,QFN
+R1,0.1,0402
+R2,n/a,0402
+U9,1.0,BGA
+"""
+
+
+@pytest.fixture
+def ipk(monkeypatch):
+    """Create an Icepak application with a mocked modeler and boundary creation."""
+    modeler = MagicMock()
+    modeler.solid_names = ["COMP_U1", "COMP_U2", "COMP_U3", "R1", "Region"]
+    volumes = {"COMP_U1": 2.0, "COMP_U2": 2.0, "COMP_U3": 8.0, "R1": 0.1, "Region": 1000.0}
+    modeler.__getitem__.side_effect = lambda name: MagicMock(volume=volumes[name])
+    monkeypatch.setattr(Icepak, "modeler", PropertyMock(return_value=modeler))
+    monkeypatch.setattr(Icepak, "logger", PropertyMock(return_value=MagicMock()))
+    monkeypatch.setattr(Icepak, "variable_manager", PropertyMock(return_value=MagicMock()))
+    monkeypatch.setattr(Icepak, "assign_material", MagicMock(return_value=True))
+
+    def boundary(app, name, props, boundarytype):
+        bound = MagicMock(props=props, type=boundarytype)
+        bound.name = name
+        bound.create.return_value = True
+        return bound
+
+    monkeypatch.setattr(icepak, "BoundaryObject", MagicMock(side_effect=boundary))
+    app = Icepak.__new__(Icepak)
+    app._boundaries = {}
+    return app
+
+
+def test_assign_block_from_sherlock_file(ipk, tmp_path):
+    """Test that a Sherlock export is applied with one lookup and one block per component."""
+    csv_file = tmp_path / "sherlock.csv"
+    csv_file.write_text(SHERLOCK_CSV)
+
+    assert ipk.assign_block_from_sherlock_file(str(csv_file)) == pytest.approx(1.1)
+    assert list(ipk._boundaries) == ["COMP_U1", "COMP_U2", "R1"]
+    assert ipk._boundaries["R1"].props["Total Power"] == "0.1W"
+    ipk.assign_material.assert_not_called()
+
+
+def test_create_source_blocks_group_by_power(ipk):
+    """Test that only objects with the same power and volume share a boundary."""
+    report = ipk.create_source_blocks(
+        {"COMP_U1": 0.5, "COMP_U2": "500mW", "COMP_U3": 0.5, "R1": "100mW", "Missing": 2},
+        assign_material=True,
+        group_by_power=True,
+    )
+
+    assert [i.name for i in report["boundaries"]] == ["COMP_U1", "COMP_U3", "R1"]
+    assert report["boundaries"][0].props["Objects"] == ["COMP_U1", "COMP_U2"]
+    assert report["boundaries"][0].props["Total Power"] == "1W"
+    assert report["boundaries"][1].props["Total Power"] == "0.5W"
+    assert report["boundaries"][2].props["Total Power"] == "100mW"
+    assert report["applied"] == ["COMP_U1", "COMP_U2", "COMP_U3", "R1"]
+    assert report["skipped"] == ["Missing"]
+    assert report["total_power"] == pytest.approx(1.6)
+    assert report["elapsed_time"] >= 0
+    ipk.assign_material.assert_called_once_with(["COMP_U1", "COMP_U2", "COMP_U3", "R1"], "Ceramic_material")
+
+
+def test_create_source_blocks_group_power_format(ipk):
+    """Test that the total power of a group is written without floating point noise."""
+    report = ipk.create_source_blocks({"COMP_U1": "700mW", "COMP_U2": "700mW"}, group_by_power=True)
+
+    assert report["boundaries"][0].props["Total Power"] == "1.4W"
+
+
+def test_create_source_blocks_from_list(ipk):
+    """Test that multiple power columns are set as variables with a single call."""
+    blocks = ipk.create_source_blocks_from_list([["COMP_U1", 1, 2], ["Missing", 3, 4], ["R1", 5, 6]])
+
+    assert blocks[0] == ["COMP_U1", 1, 2]
+    assert blocks[1].props["Total Power"] == "COMP_U1_P[P_index]"
+    assert blocks[2] == ["R1", 5, 6]
+    ipk.variable_manager.set_variables.assert_called_once_with({"P_index": 0, "COMP_U1_P": "[1, 2]", "R1_P": "[5, 6]"})
+
+
+def test_assign_priority_on_intersections(ipk, monkeypatch, tmp_path):
+    """Test that intersecting components get priorities from 2 with a single call."""
+    log_lines = [
+        "[info] Validation started\n",
+        "[error] Part COMP_U1 and COMP_U2 intersect\n",
+        "[error] Part COMP_U3 and COMP_U1 intersect\n",
+        "[error] Part R1 and R2 intersect\n",
+    ]
+
+    def validate(log_file):
+        with open(log_file, "w") as f:
+            f.writelines(log_lines)
+        return 0
+
+    mesh = MagicMock()
+    monkeypatch.setattr(Icepak, "odesign", PropertyMock(return_value=MagicMock(ValidateDesign=validate)))
+    monkeypatch.setattr(Icepak, "working_directory", PropertyMock(return_value=str(tmp_path)))
+    monkeypatch.setattr(Icepak, "aedt_version_id", PropertyMock(return_value="2024.2"))
+    monkeypatch.setattr(Icepak, "mesh", PropertyMock(return_value=mesh))
+    monkeypatch.setattr(Icepak, "save_project", MagicMock(return_value=True))
+
+    assert ipk.assign_priority_on_intersections()
+    mesh.assign_priority_map.assert_called_once_with({"COMP_U1": 2, "COMP_U3": 3})
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2024 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import os
+import shutil
+
+from ansys.aedt.core.application import job_manager
+from ansys.aedt.core.application.job_manager import JobConfiguration
+from ansys.aedt.core.application.job_manager import get_hpc_info
+from ansys.aedt.core.application.job_manager import update_hpc_option
+from ansys.aedt.core.application.job_manager import update_simulation_cores
+import pytest
+
+TEMPLATE = os.path.join(os.path.dirname(job_manager.__file__), "..", "misc", "pyaedt_local_config.acf")
+
+
+@pytest.fixture
+def template(tmp_path):
+    job_manager.clear_job_templates()
+    yield shutil.copy(TEMPLATE, tmp_path / "config.acf")
+    job_manager.clear_job_templates()
+
+
+def test_job_configuration_variants(template, tmp_path):
+    """Test that many variants are written from one parsed template."""
+    for cores in [2, 8]:
+        config = JobConfiguration.from_file(template)
+        assert config.set_options({"NumCores": cores, "NumGPUs": 1})
+        assert config.set_config_name(f"config_{cores}")
+        assert not config.set_option("Missing", 1)
+        assert config.write(tmp_path / f"config_{cores}.acf")
+
+    assert len(job_manager._job_templates) == 1
+    assert get_hpc_info(tmp_path / "config_8.acf") == ("config_8", "HFSS")
+    config = JobConfiguration.from_file(tmp_path / "config_8.acf", use_cache=False)
+    assert config.get_option("NumCores") == "8"
+    assert config.get_option("MachineName") == "localhost"
+    assert JobConfiguration.from_file(template).get_option("NumCores") == "4"
+    assert not [i for i in os.listdir(tmp_path) if i.endswith(".tmp")]
+
+
+def test_job_configuration_keeps_indentation(template):
+    """Test that an edited line keeps its indentation and the rest of the file is unchanged."""
+    with open(template) as f:
+        original = f.readlines()
+    config = JobConfiguration.from_file(template)
+    config.set_simulation_engines(3)
+    edited = config.to_string().splitlines(keepends=True)
+    changed = [i for i, line in enumerate(original) if line != edited[i]]
+    assert len(changed) == 1
+    assert edited[changed[0]] == "\t\t\t\t\tNumEngines=3\n"
+
+
+def test_update_functions_refresh_cache(template):
+    """Test that successive single-option updates see the previous edits."""
+    assert update_hpc_option(template, "NumGPUs", 2, False)
+    update_simulation_cores(template, 12)
+    assert not update_hpc_option(template, "Missing", 2)
+    config = JobConfiguration.from_file(template)
+    assert config.get_option("NumGPUs") == "2"
+    assert config.get_option("NumCores") == "12"
+
+
+def test_update_simulation_cores_all_machines(tmp_path):
+    """Test that the update functions change the line of every machine in the configuration."""
+    config_file = tmp_path / "multi.acf"
+    config_file.write_text(
+        "$begin 'Machine'\n\tMachineName='host1'\n\tNumCores=4\n$end 'Machine'\n"
+        "$begin 'Machine'\n\tMachineName='host1'\n\tNumCores=4\n$end 'Machine'\n"
+    )
+    update_simulation_cores(str(config_file), 8)
+
+    content = config_file.read_text()
+    assert content.count("\tNumCores=8\n") == 2
+    assert "NumCores=4" not in content
+    config = JobConfiguration.from_file(str(config_file), use_cache=False)
+    config.set_option("MachineName", "host2")
+    assert config.to_string().count("MachineName='host2'") == 1
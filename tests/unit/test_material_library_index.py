@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2024 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import os
+import shutil
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from ansys.aedt.core.generic.library_index import LibraryIndex
+from ansys.aedt.core.generic.load_aedt_file import load_keyword_in_aedt_file_at_offset
+from ansys.aedt.core.generic.settings import settings
+from ansys.aedt.core.modules.material_lib import Materials
+from ansys.aedt.core.modules.material_lib import _index_amat_file
+import pytest
+
+from tests import TESTS_GENERAL_PATH
+
+AMAT_FILE = TESTS_GENERAL_PATH / "example_models" / "syslib" / "Materials.amat"
+
+
+@pytest.fixture
+def library(tmp_path, monkeypatch):
+    """Create a material library and use a temporary folder for the library indexes."""
+    monkeypatch.setattr(settings, "library_index_folder", str(tmp_path / "index"))
+    library_path = tmp_path / "syslib"
+    (library_path / "Materials").mkdir(parents=True)
+    shutil.copy(AMAT_FILE, library_path / "Materials" / "Materials.amat")
+    return library_path
+
+
+def test_index_amat_file():
+    """Test material names and offsets of an AMAT file."""
+    mats = _index_amat_file(str(AMAT_FILE))
+
+    assert list(mats) == ["FC-78", "Polyflon CuFlon (tm)", "Water(@360K)", "steel_stainless"]
+    data = load_keyword_in_aedt_file_at_offset(str(AMAT_FILE), "Water(@360K)", mats["Water(@360K)"])
+    assert list(data) == ["Water(@360K)"]
+    assert "MaterialDef" in data["Water(@360K)"]
+
+
+def test_load_keyword_at_offset_nested_block(tmp_path):
+    """Test that a nested block with the same name does not end the keyword block."""
+    amat = tmp_path / "nested.amat"
+    amat.write_text(
+        "$begin 'Other'\n"
+        "  value=1\n"
+        "$end 'Other'\n"
+        "$begin 'Mat'\n"
+        "  $begin 'MaterialDef'\n"
+        "    $begin 'Mat'\n"
+        "      inner=2\n"
+        "    $end 'Mat'\n"
+        "  $end 'MaterialDef'\n"
+        "  outer=3\n"
+        "$end 'Mat'\n"
+        "$begin 'Next'\n"
+        "  value=4\n"
+        "$end 'Next'\n"
+    )
+    offset = amat.read_bytes().index(b"$begin 'Mat'")
+
+    data = load_keyword_in_aedt_file_at_offset(str(amat), "Mat", offset)
+    assert data == {"Mat": {"MaterialDef": {"Mat": {"inner": 2}}, "outer": 3}}
+
+
+def test_library_index(library):
+    """Test that library files are parsed only when the library changes."""
+    parser = MagicMock(side_effect=_index_amat_file)
+    index = LibraryIndex("test_materials", "*.amat", parser)
+
+    files = index.get(str(library))
+    assert len(files) == 1
+    assert os.path.isfile(index.index_file)
+    assert parser.call_count == 1
+
+    # A new index object reads the saved index without parsing the files again
+    index = LibraryIndex("test_materials", "*.amat", parser)
+    assert index.get(str(library)) == files
+    assert parser.call_count == 1
+
+    # Only the new file is parsed
+    shutil.copy(AMAT_FILE, library / "new_materials.amat")
+    assert len(index.get(str(library))) == 2
+    assert parser.call_count == 2
+
+    index.clear()
+    assert not os.path.isfile(index.index_file)
+
+
+def test_materials_lazy_library_material(library):
+    """Test that library material definitions are read on first use."""
+    app = MagicMock()
+    app.syslib = str(library)
+    app.personallib = ""
+    app.userlib = ""
+    app.odefinition_manager.GetProjectMaterialNames.return_value = []
+    materials = Materials(app)
+
+    assert "steel_stainless" in materials.mat_names_aedt
+    assert materials._get_aedt_case_name("STEEL_STAINLESS") == "steel_stainless"
+    with patch(
+        "ansys.aedt.core.modules.material_lib.load_keyword_in_aedt_file_at_offset",
+        wraps=load_keyword_in_aedt_file_at_offset,
+    ) as mock_load:
+        props = materials._read_library_material("FC-78")
+        assert props["thermal_conductivity"] == "0.062"
+        assert materials._read_library_material("fc-78") is props
+        assert mock_load.call_count == 1
+    assert materials._read_library_material("dummy") == {}
+
+
+def test_materials_library_file_edited_in_place(library):
+    """Test that editing an AMAT file in place refreshes the material offsets."""
+    app = MagicMock()
+    app.syslib = str(library)
+    app.personallib = ""
+    app.userlib = ""
+    app.odefinition_manager.GetProjectMaterialNames.return_value = []
+    Materials(app).mat_names_aedt
+
+    amat = library / "Materials" / "Materials.amat"
+    folder_stat = os.stat(amat.parent)
+    file_stat = os.stat(amat)
+    content = amat.read_bytes()
+    amat.write_bytes(content.split(b"$end '$base_index$'\n", 1)[1])
+    os.utime(amat, (file_stat.st_atime, file_stat.st_mtime + 10))
+    os.utime(amat.parent, (folder_stat.st_atime, folder_stat.st_mtime))
+
+    props = Materials(app)._read_library_material("FC-78")
+    assert props["thermal_conductivity"] == "0.062"
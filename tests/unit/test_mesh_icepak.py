@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2024 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from unittest.mock import MagicMock
+
+from ansys.aedt.core.modules.mesh_icepak import IcepakMesh
+
+
+def test_assign_priority_map():
+    """Test that the priority map is merged with the existing priorities and sent with a single call."""
+    app = MagicMock()
+    modeler = app.modeler
+    modeler.oeditor.GetChildNames.return_value = ["Region", "Box1", "Box2", "Plate", "Fan1_1"]
+    modeler.objects_by_name = {
+        "Region": MagicMock(is3d=True),
+        "Box1": MagicMock(is3d=True),
+        "Box2": MagicMock(is3d=True),
+        "Plate": MagicMock(is3d=False),
+    }
+    modeler.user_defined_components = {
+        "Fan1_1": MagicMock(parts={"a": MagicMock(is3d=True), "b": MagicMock(is3d=False)})
+    }
+    mesh = IcepakMesh.__new__(IcepakMesh)
+    mesh._app = app
+    existing = ["NAME:PriorityListParameters", "EntityType:=", "Object", "EntityList:=", "Old", "PriorityNumber:=", 7]
+    mesh._priorities_args = [existing]
+
+    assert mesh.assign_priority_map({"Box1": 2, "Box2": 2, "Plate": 3, "Fan1_1": 4, "Region": 5, "Missing": 6})
+
+    modeler.oeditor.UpdatePriorityList.assert_called_once()
+    args = modeler.oeditor.UpdatePriorityList.call_args.args[0]
+    assert args[0] == "NAME:UpdatePriorityListData"
+    assert args[1] == existing
+    entries = [(i[2], i[4], i[6], i[8]) for i in args[2:]]
+    assert entries == [
+        ("Object", "Box1, Box2", 2, "3D"),
+        ("Object", "Plate", 3, "2D"),
+        ("Component", "Fan1_1", 4, "3D"),
+        ("Component", "Fan1_1", 4, "2D"),
+    ]
+    assert not mesh.assign_priority_map({"Missing": 2})
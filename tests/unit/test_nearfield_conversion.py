@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2024 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import os
+
+from ansys.aedt.core.generic.settings import settings
+from ansys.aedt.core.visualization.advanced import misc
+from ansys.aedt.core.visualization.advanced.misc import convert_nearfield_data
+from ansys.aedt.core.visualization.advanced.misc import load_nearfield_binary_data
+import pytest
+
+np = pytest.importorskip("numpy")
+
+FACES = ["xmin", "xmax", "ymin", "ymax", "zmin", "zmax"]
+COMPONENTS = ["Ex", "Ey", "Ez", "Hx", "Hy", "Hz"]
+
+
+@pytest.fixture
+def nearfield_folder(tmp_path):
+    """Create a near field folder with two points per face."""
+    folder = tmp_path / "nf_data"
+    folder.mkdir()
+    for face_index, face in enumerate(FACES):
+        for component_index, component in enumerate(COMPONENTS):
+            value = face_index * 10 + component_index
+            lines = [
+                "{} {} {} {} {} \n".format(-0.025 + point * 0.01, 0.025, -0.025, value, -value) for point in range(2)
+            ]
+            with open(folder / "data_{}_{}.dat".format(component, face), "w") as f:
+                f.writelines(lines)
+    return folder
+
+
+def test_convert_nearfield_data(nearfield_folder, tmp_path):
+    """Test near field conversion to nfd file and binary data."""
+    and_file = convert_nearfield_data(str(nearfield_folder), output_folder=str(tmp_path), binary_output=True)
+    assert os.path.isfile(and_file)
+
+    nfd_data = np.loadtxt(tmp_path / "nf_data.nfd", delimiter=",", skiprows=3)
+    assert nfd_data.shape == (12, 16)
+    assert np.array_equal(nfd_data[:, 0], np.arange(1, 13))
+    # Lower faces have inverted phase
+    assert nfd_data[0, 6] == -1.0
+    assert nfd_data[2, 6] == 11.0
+
+    binary_data = load_nearfield_binary_data(str(tmp_path / "nf_data.npz"))
+    assert binary_data["frequency"] == "6GHz"
+    assert np.allclose(binary_data["points"], nfd_data[:, 1:4])
+    assert np.allclose(binary_data["e_field"].real, nfd_data[:, 4:10:2])
+    assert np.allclose(binary_data["h_field"].imag, nfd_data[:, 11:16:2])
+
+
+def test_convert_nearfield_data_missing_face(nearfield_folder, tmp_path, monkeypatch):
+    """Test near field conversion with a missing face."""
+    monkeypatch.setattr(settings, "enable_error_handler", False)
+    for component in COMPONENTS:
+        os.remove(nearfield_folder / "data_{}_zmax.dat".format(component))
+    with pytest.raises(RuntimeError, match="zmax"):
+        convert_nearfield_data(str(nearfield_folder), output_folder=str(tmp_path))
+
+
+def test_convert_nearfield_data_without_numpy(nearfield_folder, tmp_path, monkeypatch):
+    """Test that near field conversion without NumPy writes the same files."""
+    numpy_folder = tmp_path / "numpy"
+    python_folder = tmp_path / "python"
+    numpy_folder.mkdir()
+    python_folder.mkdir()
+    numpy_and_file = convert_nearfield_data(str(nearfield_folder), output_folder=str(numpy_folder))
+    monkeypatch.setattr(misc, "np", None)
+    python_and_file = convert_nearfield_data(str(nearfield_folder), output_folder=str(python_folder))
+
+    assert (python_folder / "nf_data.nfd").read_text() == (numpy_folder / "nf_data.nfd").read_text()
+    with open(python_and_file) as python_and, open(numpy_and_file) as numpy_and:
+        assert python_and.read() == numpy_and.read()
+    assert not convert_nearfield_data(str(nearfield_folder), output_folder=str(python_folder), binary_output=True)
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2024 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from unittest.mock import MagicMock
+
+from ansys.aedt.core.application.variables import VariableManager
+from ansys.aedt.core.circuit import Circuit
+from ansys.aedt.core.generic.netlist_reader import NetlistReader
+import pytest
+
+NETLIST = """R1 n1 n2 10k
+C1 n2 0 47p/50V
+L1 n1 n3 110µ
+V2 n1 0 PULSE(0 10 0 0.1u 0.1u 1.2u 5u)
+U1 n1 n2 n3 MYMOD
+U2 n3 n2 n1 MYMOD
+.param rval=50
+.model MYMOD D
+* comment
+"""
+
+
+@pytest.fixture
+def netlist_file(tmp_path):
+    """Write a small HSpice netlist."""
+    input_file = tmp_path / "netlist.cir"
+    input_file.write_bytes(NETLIST.encode("utf-8"))
+    return str(input_file)
+
+
+def test_parse_netlist_file(netlist_file):
+    """Test the element table of a netlist."""
+    netlist = NetlistReader(netlist_file).parse_netlist_file()
+
+    assert netlist.parameters == {"rval": "50"}
+    assert netlist.models == [".model MYMOD D\n"]
+    assert [e.kind for e in netlist.elements] == [
+        "resistor",
+        "capacitor",
+        "inductor",
+        "voltage_pulse",
+        "subcircuit",
+        "subcircuit",
+    ]
+    assert [e.value for e in netlist.elements[:3]] == ["10k", "47p", "110u"]
+    assert netlist.elements[3].nodes[:2] == ["0", "n1"]
+    assert netlist.elements[4].model == "MYMOD"
+    assert netlist.elements[4].pins == ["Pin1", "Pin2", "Pin3"]
+    assert len(netlist.skipped) == 1
+
+
+def test_create_schematic_from_netlist(netlist_file):
+    """Test that parameters and component definitions are set once per netlist."""
+    app = MagicMock()
+    app._desktop.GetAutoSaveEnabled.return_value = 0
+    app._netlist_grid = Circuit._netlist_grid
+    app._create_netlist_component = lambda *args: Circuit._create_netlist_component(app, *args)
+    schematic = app.modeler.schematic
+    schematic.create_component.return_value.pins = []
+    schematic.create_resistor.return_value.pins = []
+
+    assert Circuit.create_schematic_from_netlist(app, netlist_file, batch_size=2)
+
+    app.variable_manager.set_variables.assert_called_once_with({"rval": "50"})
+    schematic.create_new_component_from_symbol.assert_any_call(
+        "MYMOD", ["Pin1", "Pin2", "Pin3"], refbase="U", parameters=["MOD"], values=["MYMOD"]
+    )
+    assert schematic.create_symbol.call_count == 2
+    instance_flags = [c.kwargs["use_instance_id_netlist"] for c in schematic.create_component.call_args_list[1:]]
+    assert instance_flags == [True, False]
+    assert schematic.create_resistor.call_args.args[2] == [0.0508, 0]
+
+
+def test_netlist_component_definition_after_failure():
+    """Test that a definition is marked as used only after a component is created."""
+    app = MagicMock()
+    schematic = app.modeler.schematic
+    schematic.create_resistor.side_effect = [False, MagicMock(), MagicMock()]
+    element = MagicMock(kind="resistor", model=None, value="10k")
+    definitions = set()
+
+    for _ in range(3):
+        Circuit._create_netlist_component(app, element, [0, 0], definitions)
+
+    instance_flags = [c.kwargs["use_instance_id_netlist"] for c in schematic.create_resistor.call_args_list]
+    assert instance_flags == [True, True, False]
+    assert definitions == {("resistor", None)}
+
+
+def test_netlist_grid():
+    """Test the precomputed component locations."""
+    locations = Circuit._netlist_grid(7, 0.0254)
+
+    assert locations[0] == [0.0254, 0]
+    assert locations[5][1] == pytest.approx(0.254)
+    assert locations[6] == [pytest.approx(0.0762), 0]
+
+
+def test_set_variables():
+    """Test that new and existing variables are set with one property change per object."""
+    app = MagicMock()
+    app.design_type = "Circuit Design"
+    app._is_object_oriented_enabled.return_value = True
+    app.get_oo_object.return_value.GetPropNames.return_value = ["r1"]
+    app._odesign.GetName.return_value = "Circuit1"
+    variable_manager = VariableManager(app)
+
+    assert variable_manager.set_variables({"r1": "50ohm", "c1": 1e-12, "$l1": "1nH"})
+
+    design_tab = app._odesign.ChangeProperty.call_args.args[0][1]
+    assert design_tab[0] == "NAME:DefinitionParameterTab"
+    assert design_tab[1] == ["NAME:PropServers", "Instance:Circuit1"]
+    assert design_tab[2][1][:7] == ["NAME:c1", "PropType:=", "VariableProp", "UserDef:=", True, "Value:=", "1e-12"]
+    assert design_tab[3][1][:3] == ["NAME:r1", "Value:=", "50ohm"]
+    project_tab = app._oproject.ChangeProperty.call_args.args[0][1]
+    assert project_tab[0] == "NAME:ProjectVariableTab"
+    assert project_tab[2][1][0] == "NAME:$l1"
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2024 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from unittest.mock import MagicMock
+
+from ansys.aedt.core.generic.settings import settings
+from ansys.aedt.core.visualization.post.post_3dlayout import PostProcessor3DLayout
+import pytest
+
+np = pytest.importorskip("numpy")
+
+NET_FILE = """B_NET_CLASSIFICATION
+    1 GND
+    2 VCC
+E_NET_CLASSIFICATION
+"""
+
+
+@pytest.fixture
+def post(tmp_path, monkeypatch):
+    """Create a 3D Layout postprocessor with a mocked SIwave DC IR result."""
+    monkeypatch.setattr(settings, "aedt_version", "2025.1")
+    project_file = tmp_path / "board.aedt"
+    result_folder = tmp_path / "board.aedtresults" / "main" / "dcir"
+    result_folder.mkdir(parents=True)
+    (result_folder / "SIwave.exec").write_text('SetupName "DCIR1"\n')
+    (result_folder / "board.net").write_text(NET_FILE)
+
+    app = MagicMock()
+    app.project_file = str(project_file)
+    setup = MagicMock(solver_type="SIwaveDCIR")
+    setup.name = "DCIR1"
+    app.setups = [setup]
+    edbapp = app.modeler.edb
+    edbapp.stackup.signal_layers = {"TOP": None, "BOTTOM": None}
+    edbapp.nets = {
+        "GND": MagicMock(primitives=[MagicMock(layer_name="TOP"), MagicMock(layer_name="BOTTOM")]),
+        "VCC": MagicMock(primitives=[MagicMock(layer_name="TOP")]),
+    }
+    calculator = app.post.fields_calculator
+    calculator.is_expression_defined.return_value = False
+    calculator.evaluate_many.side_effect = lambda names, **kwargs: np.arange(1.0, len(names) + 1).reshape(-1, 1, 1, 1)
+
+    post = PostProcessor3DLayout.__new__(PostProcessor3DLayout)
+    post._app = app
+    post._power_loss_tables = {}
+    return post
+
+
+def test_compute_power(post):
+    """Test that the power by layer and by net are read from a single evaluation."""
+    assert post.compute_power_by_layer() == {"TOP": 3.0, "BOTTOM": 3.0}
+    assert post.compute_power_by_net(nets=["VCC"]) == {"VCC": 2.0}
+    assert post.compute_power_by_layer(layers=["BOTTOM"], solution="DCIR1") == {"BOTTOM": 3.0}
+
+    calculator = post._app.post.fields_calculator
+    calculator.evaluate_many.assert_called_once()
+    assert calculator.add_expression.call_count == 3
+    operations = [c.args[0]["operations"] for c in calculator.add_expression.call_args_list]
+    assert all(len(i) == 6 for i in operations)
+    assert operations[1][1] == "EnterSurface('TOP_VCC')"
+    names = [c.args[0]["name"] for c in calculator.add_expression.call_args_list]
+    assert len(set(names)) == 3 and all(i.startswith("pyaedt_dcir_power_") for i in names)
+    assert [c.args[0] for c in calculator.delete_expression.call_args_list] == names
+
+
+def test_compute_power_deletes_expressions_on_error(post):
+    """Test that the temporary expressions are deleted when the evaluation fails."""
+    calculator = post._app.post.fields_calculator
+    calculator.evaluate_many.side_effect = RuntimeError("Evaluation failed")
+
+    with pytest.raises(RuntimeError):
+        post._power_loss_table("DCIR1")
+    assert calculator.delete_expression.call_count == calculator.add_expression.call_count == 3
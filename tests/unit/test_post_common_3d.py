@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2024 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from unittest.mock import MagicMock
+
+from ansys.aedt.core.visualization.post.fields_calculator import FieldsCalculator
+from ansys.aedt.core.visualization.post.post_common_3d import PostProcessor3D
+import pytest
+
+np = pytest.importorskip("numpy")
+
+FIELD_FILE = """X Y Z Temp
+----------------------------------------------------------
+0 0 0 25.5
+0.001 0.002 0.003 Nan
+"""
+
+
+def test_probe_field_values(tmp_path):
+    """Test that all points are written to one file and the export is read at once."""
+    post = PostProcessor3D.__new__(PostProcessor3D)
+    post._app = MagicMock(working_directory=str(tmp_path))
+    post._app.modeler.oeditor = MagicMock(spec=["GetModelUnits"])
+    post._app.modeler.oeditor.GetModelUnits.return_value = "mm"
+    exported = {}
+
+    def export_field_file(quantity, output_file, sample_points_file, **kwargs):
+        with open(sample_points_file) as f:
+            exported["points"] = f.read().splitlines()
+        with open(output_file, "w") as f:
+            f.write(FIELD_FILE)
+        return output_file
+
+    post.export_field_file = MagicMock(side_effect=export_field_file)
+
+    values = post.probe_field_values("Temp", [[0, 0, 0], [1, 2, 3]], solution="Setup1 : SteadyState")
+
+    post.export_field_file.assert_called_once()
+    assert exported["points"] == ["Unit=mm", "0 0 0", "1 2 3"]
+    assert values.shape == (2, 4)
+    assert values[0, 3] == 25.5
+    assert np.isnan(values[1, 3])
+    assert list(tmp_path.iterdir()) == []
+
+    pytest.importorskip("pandas")
+    df = post.probe_field_values("Temp", np.array([0, 0, 0]), pandas_output=True)
+    assert list(df.columns) == ["x", "y", "z", "Temp"]
+
+
+def test_get_scalar_field_values():
+    """Test that requests sharing a stack push it once and that values are read from the stack top."""
+    post = PostProcessor3D.__new__(PostProcessor3D)
+    post._app = MagicMock()
+    post._app.existing_analysis_sweeps = ["Setup1 : LastAdaptive"]
+    post._app.variable_manager.variables = {"width": MagicMock(sweep=True), "pp": MagicMock(sweep=False)}
+    post._app.available_variations.nominal_w_values_dict = {"width": "1mm", "pp": "2"}
+    post._app._check_intrinsics.side_effect = lambda i, p, s, return_list: ["Freq:=", i] if i else []
+    post.fields_calculator = FieldsCalculator(post._app)
+    reporter = post._app.ofieldsreporter
+    reporter.GetTopEntryValue.side_effect = [[1.5], 2.5, 4.0, "bad"]
+
+    requests = [
+        ("Ohmic_Loss", "Coil1", "Integrate"),
+        ("Ohmic_Loss", "Coil1", "Integrate", "1GHz"),
+        ("Ohmic_Loss", "Coil2", "Integrate"),
+        {
+            "quantity": "Ohmic_Loss",
+            "object_name": "Coil1",
+            "scalar_function": "Integrate",
+            "variations": {"width": "2mm"},
+        },
+    ]
+    values = post.get_scalar_field_values(requests)
+
+    assert reporter.EnterQty.call_count == 2
+    assert [c.args[0] for c in reporter.EnterVol.call_args_list] == ["Coil1", "Coil2"]
+    assert values[0] == 1.5 and values[1] == 2.5 and values[3] == 4.0
+    assert np.isnan(values[2])
+    args = [c.args for c in reporter.GetTopEntryValue.call_args_list]
+    assert args[0] == ("Setup1 : LastAdaptive", ["width:=", "1mm"])
+    assert args[1] == ("Setup1 : LastAdaptive", ["width:=", "1mm", "Freq:=", "1GHz"])
+    assert args[2] == ("Setup1 : LastAdaptive", ["width:=", "2mm"])
+    reporter.CalculatorWrite.assert_not_called()
+
+    reporter.GetTopEntryValue.side_effect = [0.5]
+    df = post.get_scalar_field_values([("Temp", "Box1")], pandas_output=True)
+    assert list(df["value"]) == [0.5]
+    assert df["scalar_function"][0] == "Maximum"
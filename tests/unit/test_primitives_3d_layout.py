@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2024 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from unittest.mock import MagicMock
+
+from ansys.aedt.core.modeler.pcb.object_3d_layout import Components3DLayout
+from ansys.aedt.core.modeler.pcb.object_3d_layout import Nets3DLayout
+from ansys.aedt.core.modeler.pcb.object_3d_layout import Pins3DLayout
+from ansys.aedt.core.modeler.pcb.primitives_3d_layout import Primitives3DLayout
+import pytest
+
+
+@pytest.fixture
+def primitives():
+    """Create 3D Layout primitives with a mocked editor."""
+    prims = Primitives3DLayout(MagicMock())
+    prims.oeditor = MagicMock()
+    prims.oeditor.GetPropertyValue.side_effect = lambda tab, name, prop: f"{name}:{prop}"
+    prims.oeditor.GetComponentInfo.return_value = ["BBoxLLx=0", "BBoxLLy=0", "BBoxURx=0.002", "BBoxURy=0.004"]
+    prims._components = {"U1": Components3DLayout(prims, "U1")}
+    prims._pins = {"U1-1": Pins3DLayout(prims, "U1-1")}
+    return prims
+
+
+def test_prefetch_properties(primitives):
+    """Test that nets and component information are loaded in bulk and read from the cache."""
+    oeditor = primitives.oeditor
+    nets = {"<Power/Ground>": ["GND"], "Non Power/Ground": ["SIG"], "<All>": ["GND", "SIG"]}
+    primitives.modeler.oeditor.GetNetClassNets.side_effect = lambda net_class: nets[net_class]
+    oeditor.FindObjects.side_effect = lambda key, value: {"GND": ["U1", "U1-1"], "SIG": []}[value]
+    assert primitives.prefetch_properties(["U1-1", "U1"], properties=["Start Layer", "Net"])
+    pin = primitives.pins["U1-1"]
+    component = primitives.components["U1"]
+
+    assert pin.net_name == "GND"
+    assert pin.start_layer == "U1-1:Start Layer"
+    assert component.bounding_box == [0.0, 0.0, 0.002, 0.004]
+    assert oeditor.GetPropertyValue.call_count == 2
+    assert oeditor.FindObjects.call_count == 2
+    assert oeditor.GetComponentInfo.call_count == 1
+
+    pin.net_name = "VCC"
+    assert not primitives._property_cache
+    assert pin.net_name == "U1-1:Net"
+    assert oeditor.GetPropertyValue.call_count == 3
+
+
+def test_net_objects_cache(primitives):
+    """Test that net members are cached only while a prefetch is active."""
+    oeditor = primitives.oeditor
+    members = {"GND": ["U1", "U1-1", "poly_1"], "component": ["U1"], "pin": ["U1-1"]}
+    oeditor.FindObjects.side_effect = lambda key, value: members.get(value, [])
+    net = Nets3DLayout(primitives, "GND")
+
+    assert list(net.components) == ["U1"]
+    assert list(net.components) == ["U1"]
+    assert oeditor.FindObjects.call_count == 2
+
+    assert primitives.prefetch_properties([])
+    oeditor.FindObjects.reset_mock()
+    assert list(net.components) == ["U1"]
+    assert net.geometry_names == ["poly_1"]
+    assert net.geometry_names == ["poly_1"]
+    assert oeditor.FindObjects.call_count == 4
+    oeditor.FilterObjectList.assert_not_called()
+
+    primitives.clear_property_cache()
+    assert list(net.components) == ["U1"]
+    assert list(net.components) == ["U1"]
+    assert oeditor.FindObjects.call_count == 6
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2024 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import os
+import threading
+import time
+from unittest.mock import MagicMock
+
+from ansys.aedt.core.rpc.rpyc_services import FileManagement
+from ansys.aedt.core.rpc.rpyc_services import GlobalService
+from ansys.aedt.core.rpc.rpyc_services import PARTIAL_SUFFIX
+import pytest
+import rpyc
+from rpyc.utils.server import ThreadedServer
+
+
+@pytest.fixture
+def client():
+    """Start a local rpyc server and connect to it."""
+    server = ThreadedServer(GlobalService, hostname="127.0.0.1", port=0, protocol_config={"sync_request_timeout": None})
+    thread = threading.Thread(target=server.start, daemon=True)
+    thread.start()
+    while not server.active:
+        time.sleep(0.01)
+    connection = rpyc.connect("127.0.0.1", server.listener.getsockname()[1], config={"sync_request_timeout": None})
+    yield connection
+    connection.close()
+    server.close()
+
+
+def _make_tree(folder):
+    (folder / "sub").mkdir(parents=True)
+    (folder / "a.bin").write_bytes(os.urandom(10000))
+    (folder / "sub" / "b.txt").write_text("field data\n" * 2000)
+    (folder / "empty.txt").write_text("")
+
+
+@pytest.mark.parametrize("compression", [None, "zlib"])
+def test_upload_and_download_folder(client, tmp_path, compression):
+    """Test chunked, compressed and parallel transfers and the skip of identical files."""
+    local = tmp_path / "local"
+    _make_tree(local)
+    file_manager = FileManagement(client, chunk_size=1024, compression=compression, workers=3)
+
+    remote = str(tmp_path / "remote")
+    results = file_manager.upload(str(local), remote)
+    assert len(results["transferred"]) == 3
+    assert (tmp_path / "remote" / "sub" / "b.txt").read_text() == (local / "sub" / "b.txt").read_text()
+    assert (tmp_path / "remote" / "a.bin").read_bytes() == (local / "a.bin").read_bytes()
+    assert (tmp_path / "remote" / "empty.txt").exists()
+    assert len(file_manager.upload(str(local), remote)["skipped"]) == 3
+
+    results = file_manager.download_folder(remote, str(tmp_path / "back"))
+    assert len(results["transferred"]) == 3
+    assert (tmp_path / "back" / "a.bin").read_bytes() == (local / "a.bin").read_bytes()
+
+
+def test_resume_transfer(client, tmp_path):
+    """Test that an interrupted transfer resumes from its partial file."""
+    data = os.urandom(5000)
+    local_file = tmp_path / "data.bin"
+    local_file.write_bytes(data)
+    remote_file = tmp_path / "remote.bin"
+    (tmp_path / ("remote.bin" + PARTIAL_SUFFIX)).write_bytes(data[:3000])
+    file_manager = FileManagement(client, chunk_size=1000)
+
+    assert file_manager.upload(str(local_file), str(remote_file))["transferred"] == [str(local_file)]
+    assert remote_file.read_bytes() == data
+    assert not (tmp_path / ("remote.bin" + PARTIAL_SUFFIX)).exists()
+
+    downloaded = tmp_path / "downloaded.bin"
+    (tmp_path / ("downloaded.bin" + PARTIAL_SUFFIX)).write_bytes(b"corrupted")
+    assert file_manager.download_file(str(remote_file), str(downloaded))["transferred"] == [str(remote_file)]
+    assert downloaded.read_bytes() == data
+
+
+def test_parallel_transfer_connections(client, tmp_path, monkeypatch):
+    """Test that each parallel worker uses its own connection, closed at the end."""
+    local = tmp_path / "local"
+    _make_tree(local)
+    connections = []
+    connect = rpyc.connect
+
+    def counted_connect(*args, **kwargs):
+        connections.append(connect(*args, **kwargs))
+        return connections[-1]
+
+    monkeypatch.setattr(rpyc, "connect", counted_connect)
+    file_manager = FileManagement(client, chunk_size=1024, workers=2)
+
+    assert len(file_manager.upload(str(local), str(tmp_path / "remote"))["transferred"]) == 3
+    assert 1 <= len(connections) <= 2
+    assert all(connection.closed for connection in connections)
+    assert not client.closed
+
+
+def test_truncated_transfer_fails(tmp_path):
+    """Test that a transfer stops and fails when the source returns no data."""
+    connection = MagicMock()
+    connection.root.file_info.return_value = (5000, "hash")
+    connection.root.read_chunk.return_value = b""
+    file_manager = FileManagement(connection, chunk_size=1000)
+
+    downloaded = str(tmp_path / "downloaded.bin")
+    assert file_manager.download_file("remote.bin", downloaded)["failed"] == ["remote.bin"]
+    assert connection.root.read_chunk.call_count == 1
+
+    local_file = tmp_path / "data.bin"
+    local_file.write_bytes(os.urandom(5000))
+    connection.root.file_info.return_value = None
+    connection.root.partial_size.return_value = 0
+    connection.root.write_chunk.return_value = 0
+    connection.root.finalize_file.return_value = False
+    assert file_manager.upload(str(local_file), "remote.bin")["failed"] == [str(local_file)]
+    assert connection.root.write_chunk.call_count == 1
+
+
+def test_download_hash_only_when_needed(tmp_path):
+    """Test that the remote hash is computed only to compare files, and that a mismatch is retried once."""
+    connection = MagicMock()
+    connection.root.file_info.side_effect = lambda name, compute_hash=True: (5, "remote" if compute_hash else "")
+    connection.root.read_chunk.side_effect = lambda name, offset, size, compression: b"abcde"[offset : offset + size]
+    file_manager = FileManagement(connection, chunk_size=2)
+
+    downloaded = tmp_path / "downloaded.bin"
+    assert file_manager.download_file("remote.bin", str(downloaded))["transferred"] == ["remote.bin"]
+    assert downloaded.read_bytes() == b"abcde"
+    assert [c.args for c in connection.root.file_info.call_args_list] == [("remote.bin", False)]
+
+    connection.root.file_info.reset_mock()
+    (tmp_path / ("resumed.bin" + PARTIAL_SUFFIX)).write_bytes(b"ab")
+    assert file_manager.download_file("remote.bin", str(tmp_path / "resumed.bin"))["failed"] == ["remote.bin"]
+    hashes = [c.args[1:] != (False,) for c in connection.root.file_info.call_args_list]
+    assert hashes == [False, True, False, True]
+    assert not (tmp_path / "resumed.bin").exists()